@@ -49,16 +49,18 @@ class _DatabaseClass(BaseClass, dict, Mapping):
             if __name.startswith("__") and __name.endswith("__"):
                 return super().__getattribute__(__name)
 
-        try:
-            #Try to return with __getattribute__ first
+        #Attributes (methods, name, functions added to the database) have the precedence:
+        #look them up only if they exist, to avoid raising and catching AttributeError
+        #at each access to an entry
+        if (__name in super().__getattribute__("__dict__")) or hasattr(type(self), __name):
             return super().__getattribute__(__name)
-        except:
-            if not (__name in self):
-                string = f"{__name} not found in database '{self._name}'. Available entries are:\n"
-                for item in self:
-                    string += f"\t{item}\n"
-                raise ValueError(string)
-        return super().__getitem__(__name)
+
+        if not dict.__contains__(self, __name):
+            string = f"{__name} not found in database '{self._name}'. Available entries are:\n"
+            for item in self:
+                string += f"\t{item}\n"
+            raise ValueError(string)
+        return dict.__getitem__(self, __name)
     
     def __setattr__(self, __name: str, __value: Any) -> None:
         """
@@ -94,10 +96,10 @@ class _DatabaseClass(BaseClass, dict, Mapping):
         return super().__setitem__(__key, __value)
     
     def __getitem__(self, __key: Any) -> Any:
-        if not __key in self:
+        if not dict.__contains__(self, __key):
             string = f"Key {__key} not found in database. Available entries are:"
             for item in self:
                 string += f"\n{item}"
             raise ValueError(string)
         
-        return super().__getitem__(__key)
\ No newline at end of file
+        return dict.__getitem__(self, __key)
\ No newline at end of file
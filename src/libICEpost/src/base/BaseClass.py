@@ -176,6 +176,8 @@ class BaseClass(Utilities, metaclass=ABCMeta):
     """
     Class wrapping useful methods for base virtual classes (e.g. run-time selector)
     """
+    #No instance attributes: allows derived classes to define __slots__
+    __slots__ = ()
     
     ##########################################################################################
     @classmethod
@@ -73,8 +73,8 @@ def printStack(e=None):
 
 #############################################################################
 def baseRuntimeWarning(WarningMSG, Msg, verbosityLevel=1, stack=True):
-    Where = traceback.extract_stack()
-    
+    #NOTE: the call-stack is extracted only when printed (printStack), since walking
+    #the frames is expensive and warnings may be raised inside loops
     if (verbosityLevel <= GLOBALS.__VERBOSITY_LEVEL__):
         tabbedMSG = ""
         for cc in Msg:
@@ -116,6 +116,39 @@ def checkType(entry:Any, Type:type|Iterable[type|_SpecialGenericAlias],
         else:
             raise TypeError("Wrong type for entry '{}': '{}' expected but '{}' was found.".format(entryName, ([t.__name__ for t in Type] if isinstance(Type, Iterable) else Type.__name__), entry.__class__.__name__))
 
+#############################################################################
+#Check float entries (lightweight):
+_floatTypes:tuple[type] = (float, int, np.integer)
+"""Types accepted as float by checkFloat"""
+
+_floatOrArrayTypes:tuple[type] = _floatTypes + (np.ndarray,)
+"""Types accepted as float or array by checkFloat"""
+
+def checkFloat(entry:Any, entryName:str, *, allowArray:bool=False, allowNone:bool=False) -> None:
+    """
+    Check that an instance is a float (int and numpy integers accepted as float, as for
+    checkType with intAsFloat=True). Lightweight version of checkType(entry, float, entryName)
+    without argument checking, for the entries checked at each evaluation (e.g., the 
+    thermodynamic state in thermophysical properties).
+
+    Arguments:
+        entry (Any): Instance to be checked.
+        entryName (str): Name of the entry to be checked (used as info when raising TypeError).
+        allowArray (bool, optional): If True, numpy arrays are also accepted (default is False).
+        allowNone (bool, optional): If True, None is allowed as a valid value (default is False).
+
+    Raises:
+        TypeError: If 'entry' is not a float (or array, if allowArray is True).
+    """
+    if not GLOBALS.__TYPE_CHECKING__:
+        return
+    
+    if isinstance(entry, _floatOrArrayTypes if allowArray else _floatTypes) or (allowNone and (entry is None)):
+        return
+    
+    expected = "'float' or 'ndarray'" if allowArray else "'float'"
+    raise TypeError(f"Wrong type for entry '{entryName}': {expected} expected but '{entry.__class__.__name__}' was found.")
+
 #############################################################################
 def checkArray(array:Iterable, Type:type|Iterable[type|_SpecialGenericAlias]|_SpecialGenericAlias, entryName:str="array", *, allowEmpty:bool=True, **kwargs):
     """
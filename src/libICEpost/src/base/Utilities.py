@@ -27,6 +27,8 @@ class Utilities(object):
     """
     Class wrapping useful methods (virtual).
     """
+    #No instance attributes: allows derived classes to define __slots__
+    __slots__ = ()
     
     #Type checking:
     @staticmethod
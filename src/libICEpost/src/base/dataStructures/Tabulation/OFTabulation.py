@@ -1283,7 +1283,7 @@ class OFTabulation(BaseTabulation):
             raise IOError(f"Size of table stored in '{tabPath}' is not consistent with the size of the tabulation ({len(tab)} != {self.size}).")
         
         #Add the tabulation
-        self.addField(data=tab, field=tableName, file=fileName)
+        self.addField(data=tab, field=tableName, file=fileName, **kwargs)
         
         return self
     
@@ -31,6 +31,7 @@ import matplotlib.ticker
 
 import itertools
 import warnings
+from bisect import bisect_right
 
 from .BaseTabulation import BaseTabulation
 
@@ -47,9 +48,135 @@ class TabulationAccessWarning(Warning):
     """Warning from Tabulation access"""
     pass
 
+class TabulationPrecisionWarning(Warning):
+    """Warning for loss of accuracy when storing the data of a Tabulation with reduced precision"""
+    pass
+
 #############################################################################
 #                           AUXILIARY FUNCTIONS                             #
 #############################################################################
+def _precisionLoss(original:np.ndarray, data:np.ndarray) -> float:
+    """
+    Maximum relative error of the data stored with reduced precision with respect to the original 
+    values (inf in case of overflow). Since the multi-linear interpolation is a convex combination of 
+    the vertices of a cell, it also bounds the relative error of the interpolated values (for data 
+    with uniform sign).
+    """
+    original = original.astype(float)
+    mask = (original != 0.) & np.isfinite(original)
+    if not mask.any():
+        return 0.
+    return float(np.max(np.abs(data[mask].astype(float) - original[mask])/np.abs(original[mask])))
+
+#Multi-linear interpolation in a cell of a table (flattened data 'values', with 'strides' in 
+#number of elements), from the flat index of the lower vertex and the weights of the upper 
+#vertex along each dimension. The contributions of the vertices are summed in the same order 
+#as in Tabulation._combineArray, so that single points and batches give the same results.
+def _multilinear(values:np.ndarray, strides:list[int], base:int, weights:list[float]) -> float:
+    """
+    Multi-linear interpolation in a cell of a table with any number of dimensions.
+    """
+    out = 0.
+    for vertex in itertools.product((0, 1), repeat=len(weights)):
+        w = 1.
+        for upper, weight in zip(vertex, weights):
+            w = w*(weight if upper else (1. - weight))
+        out += w*values.item(base + sum(v*s for v, s in zip(vertex, strides)))
+    return out
+
+def _multilinear3(values:np.ndarray, strides:list[int], base:int, weights:list[float]) -> float:
+    """
+    Tri-linear interpolation in a cell of a 3-D table.
+    """
+    item = values.item
+    sx, sy, sz = strides
+    fx, fy, fz = weights
+    gx, gy, gz = 1. - fx, 1. - fy, 1. - fz
+    return (0.
+        + gx*gy*gz*item(base)
+        + gx*gy*fz*item(base + sz)
+        + gx*fy*gz*item(base + sy)
+        + gx*fy*fz*item(base + sy + sz)
+        + fx*gy*gz*item(base + sx)
+        + fx*gy*fz*item(base + sx + sz)
+        + fx*fy*gz*item(base + sx + sy)
+        + fx*fy*fz*item(base + sx + sy + sz)
+        )
+
+def _multilinear4(values:np.ndarray, strides:list[int], base:int, weights:list[float]) -> float:
+    """
+    Quadri-linear interpolation in a cell of a 4-D table.
+    """
+    item = values.item
+    sx, sy, sz, sw = strides
+    fx, fy, fz, fw = weights
+    gx, gy, gz, gw = 1. - fx, 1. - fy, 1. - fz, 1. - fw
+    return (0.
+        + gx*gy*gz*gw*item(base)
+        + gx*gy*gz*fw*item(base + sw)
+        + gx*gy*fz*gw*item(base + sz)
+        + gx*gy*fz*fw*item(base + sz + sw)
+        + gx*fy*gz*gw*item(base + sy)
+        + gx*fy*gz*fw*item(base + sy + sw)
+        + gx*fy*fz*gw*item(base + sy + sz)
+        + gx*fy*fz*fw*item(base + sy + sz + sw)
+        + fx*gy*gz*gw*item(base + sx)
+        + fx*gy*gz*fw*item(base + sx + sw)
+        + fx*gy*fz*gw*item(base + sx + sz)
+        + fx*gy*fz*fw*item(base + sx + sz + sw)
+        + fx*fy*gz*gw*item(base + sx + sy)
+        + fx*fy*gz*fw*item(base + sx + sy + sw)
+        + fx*fy*fz*gw*item(base + sx + sy + sz)
+        + fx*fy*fz*fw*item(base + sx + sy + sz + sw)
+        )
+
+_multilinearKernels:dict[int,Callable] = {3:_multilinear3, 4:_multilinear4}
+"""Kernels specialized for the most common number of dimensions (laminar flame speed tables)"""
+
+try:
+    #Compiled kernel if numba is available
+    from numba import njit, prange
+    
+    #Releasing the GIL, so that the batch can also be interpolated concurrently from multiple threads
+    @njit(parallel=True, nogil=True, cache=True)
+    def _combinePoints(values:np.ndarray, strides:np.ndarray, base:np.ndarray, weights:np.ndarray, out:np.ndarray) -> np.ndarray:
+        """
+        Multi-linear interpolation of a batch of points in their cells (flat index of the lower
+        vertex 'base', with shape (N,), and weights of the upper vertex, with shape (D, N)),
+        stored in the pre-allocated array 'out', with shape (N,).
+        """
+        D, N = weights.shape
+        for ii in prange(N):
+            s = 0.
+            for vertex in range(2**D):
+                w = 1.
+                index = base[ii]
+                for dim in range(D):
+                    #Vertices ordered as in itertools.product (first dimension varying slowest)
+                    if (vertex >> (D - 1 - dim)) & 1:
+                        w *= weights[dim, ii]
+                        index += strides[dim]
+                    else:
+                        w *= 1. - weights[dim, ii]
+                s += w*values[index]
+            out[ii] = s
+        return out
+
+except ImportError:
+    def _combinePoints(values:np.ndarray, strides:np.ndarray, base:np.ndarray, weights:np.ndarray, out:np.ndarray) -> np.ndarray:
+        """
+        Multi-linear interpolation of a batch of points in their cells (flat index of the lower
+        vertex 'base', with shape (N,), and weights of the upper vertex, with shape (D, N)),
+        stored in the pre-allocated array 'out', with shape (N,).
+        """
+        out[:] = 0.
+        for vertex in itertools.product((0, 1), repeat=len(weights)):
+            w = 1.
+            for upper, weight in zip(vertex, weights):
+                w = w*(weight if upper else (1. - weight))
+            out += w*values[base + sum(v*s for v, s in zip(vertex, strides))]
+        return out
+
 def toPandas(table:Tabulation) -> DataFrame:
     """
     Convert an instance of Tabulation to a pandas.DataFrame with all the points stored in the tabulation.
@@ -168,11 +295,6 @@ def concat(table:Tabulation, *tables:Tabulation, inplace:bool=False, fillValue:f
     if not fillValue is None:
         checkType(fillValue, float, "fillValue")
     
-    if not inplace:
-        tab = table.copy()
-        concat(tab, *tables, inplace=True, fillValue=fillValue, overwrite=overwrite)
-        return tab
-    
     order = table.order
     ranges = {f:set(table.ranges[f]) for f in order}
     for ii, tab in enumerate(tables):
@@ -185,27 +307,33 @@ def concat(table:Tabulation, *tables:Tabulation, inplace:bool=False, fillValue:f
             ranges[f].update(tab.ranges[f])
 
     ranges = {f:sorted(ranges[f]) for f in order} #Sort ranges
-    data = np.zeros([len(ranges[f]) for f in order])*(float("nan") if fillValue is None else fillValue) #Create empty data
+    positions = {f:{v:ii for ii, v in enumerate(ranges[f])} for f in order} #Position of each sampling point
+    dtype = table.dtype if np.issubdtype(table.dtype, np.floating) else float #Keep the precision of the first table
+    data = np.full([len(ranges[f]) for f in order], float("nan") if fillValue is None else fillValue, dtype=dtype) #Create empty data
     written = np.zeros_like(data, dtype=bool) #Check if data has been written
     for tab in [table, *tables]:
         r = tab.ranges
         o = tab.order
         # Create a mapping from index in tab to index in new table
-        mapping = {f: [ranges[f].index(v) for v in r[f]] for f in order}
-        reordering = [o.index(f) for f in order] #Reordering of the dimensions
-        #Fill data
-        for idx, val in zip(itertools.product(*[mapping[f] for f in o]), tab._data.flat):
-            idx = tuple(idx[i] for i in reordering) #Reorder index
-            if written[*idx] and not overwrite:
-                raise ValueError(f"Overlapping data found at index {idx}. Use 'overwrite=True' to overwrite the data.")
-            data[*idx] = val
-            written[*idx] = True
+        mapping = [[positions[f][v] for v in r[f]] for f in order]
+        index = np.ix_(*mapping)
+        #Fill data (whole block, with the dimensions reordered as in the first table)
+        if not overwrite and written[index].any():
+            local = np.argwhere(written[index])[0]
+            idx = tuple(mapping[ii][jj] for ii, jj in enumerate(local))
+            raise ValueError(f"Overlapping data found at index {idx}. Use 'overwrite=True' to overwrite the data.")
+        data[index] = tab._data.transpose([o.index(f) for f in order])
+        written[index] = True
 
     #Check for missing sampling points
     if fillValue is None and not np.all(written):
         raise ValueError("Missing sampling points in the concatenated tables. Cannot concatenate without 'fillValue' argument.")
     
-    #Create new table
+    #Construct the new table directly from the merged data (no copy of the first table)
+    if not inplace:
+        return Tabulation(data, ranges, order, outOfBounds=table.outOfBounds, dtype=dtype)
+    
+    #Update the table
     table._ranges = {v:np.array(ranges[v]) for v in order}
     table._data = data
     table._createInterpolator()
@@ -849,7 +977,8 @@ class Tabulation(BaseTabulation):
     def order(self, order:Iterable[str]):
         oldOrder = self.order
         BaseTabulation.order.fset(self, order)
-        self._data = self._data.transpose(*[oldOrder.index(o) for o in order])
+        #Store the data contiguous in the new nesting order (last variable varying fastest in memory)
+        self._data = np.ascontiguousarray(self._data.transpose(*[oldOrder.index(o) for o in order]))
         
         #Update interpolator
         self._createInterpolator()
@@ -871,6 +1000,14 @@ class Tabulation(BaseTabulation):
         """
         return self._data.copy()
     
+    #######################################
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The type used to store the data.
+        """
+        return self._data.dtype
+    
     #######################################
     #Get interpolator:
     @property
@@ -906,7 +1043,7 @@ class Tabulation(BaseTabulation):
     
     #########################################################################
     #Constructor:
-    def __init__(self, data:Iterable[float]|Iterable, ranges:dict[str,Iterable[float]], order:Iterable[str], *, outOfBounds:Literal["extrapolate", "fatal", "nan"]="fatal"):
+    def __init__(self, data:Iterable[float]|Iterable, ranges:dict[str,Iterable[float]], order:Iterable[str], *, outOfBounds:Literal["extrapolate", "fatal", "nan"]="fatal", dtype:type=None):
         """
         Construct a tabulation from the data at the interpolation points, 
         the ranges of each input variable, and the order in which the 
@@ -921,6 +1058,10 @@ class Tabulation(BaseTabulation):
             ranges (dict[str,Iterable[float]]): Sampling points used in the tabulation for each input variable.
             order (Iterable[str]): Order in which the input variables are nested.
             outOfBounds (Literal[&quot;extrapolate&quot;, &quot;nan&quot;, &quot;fatal&quot;], optional): Ho to handle out-of-bound access to the tabulation. Defaults to "fatal".
+            dtype (type, optional): Floating-point type used to store the data (e.g., np.float32 halves the memory 
+                of large tables, with relative accuracy of the stored values ~1e-7). A TabulationPrecisionWarning 
+                is issued if the relative error of the stored values exceeds 1e-3. The interpolation is always 
+                computed in double precision. Defaults to None (float64).
         
         Raises:
             TypeError: If data is a DataFrame. Use 'from_pandas' method to create a Tabulation from a DataFrame.
@@ -930,7 +1071,23 @@ class Tabulation(BaseTabulation):
         
         #Argument checking:
         self.checkType(data, Iterable, entryName="data")
-        data = np.array(data) #Cast to numpy
+        if not dtype is None:
+            if not np.issubdtype(dtype, np.floating):
+                raise TypeError(f"Wrong type for entry 'dtype': floating-point type expected but '{dtype}' was found.")
+            
+            #Cast to numpy with the given precision, checking the error on the stored values
+            original = np.asarray(data)
+            with np.errstate(over="ignore"): #Overflows are reported below
+                data = np.array(original, dtype=dtype)
+            if np.issubdtype(original.dtype, np.number):
+                loss = _precisionLoss(original, data)
+                if loss > 1e-3:
+                    warnings.warn(
+                        TabulationPrecisionWarning(
+                            f"Storing the data with type {data.dtype} introduces relative errors up to {loss:.3e}.")
+                        )
+        else:
+            data = np.array(data) #Cast to numpy
         
         #Ranges
         self.checkMap(ranges, str, Iterable, entryName="ranges")
@@ -989,29 +1146,66 @@ class Tabulation(BaseTabulation):
     def _createInterpolator(self) -> None:
         """Create the interpolator.
         """
-        #Create grid:
+        #Create grid (C-contiguous float arrays, so that the interpolator does not need to convert them):
         ranges = []
         for f in self.order:
             #Check for dimension:
             range_ii = self._ranges[f]
             if len(range_ii) > 1:
-                ranges.append(range_ii)
+                ranges.append(np.ascontiguousarray(range_ii, dtype=float))
         
-        #Remove empty directions
-        tab = self._data.squeeze()
+        #Remove empty directions (keeping the precision of the data, if floating-point)
+        dtype = self._data.dtype if np.issubdtype(self._data.dtype, np.floating) else float
+        tab = np.ascontiguousarray(self._data.squeeze(), dtype=dtype)
         
+        self._interpolator = RegularGridInterpolator(tuple(ranges), tab, **self._interpolatorOptions(self._outOfBounds))
+        
+        #Grid along the active dimensions, as arrays (for batches of points) and lists (for the look-up 
+        #of single points), with the inverse of the grid spacing, so that the interpolation weights are 
+        #computed with a multiplication instead of a division. Data along the active dimensions.
+        self._gridArrays = ranges
+        self._grid = [r.tolist() for r in ranges]
+        self._invDeltaArrays = [1./np.diff(r) for r in ranges]
+        self._invDelta = [r.tolist() for r in self._invDeltaArrays]
+        
+        #Inverse of the spacing of the uniform grids (None if not uniform), to locate batches of points
+        #in the cells directly, without searching
+        self._invUniformDelta = []
+        for r in ranges:
+            delta = (r[-1] - r[0])/(len(r) - 1)
+            uniform = np.allclose(r, np.linspace(r[0], r[-1], len(r)), rtol=0., atol=1e-6*delta)
+            self._invUniformDelta.append(1./delta if uniform else None)
+        self._values = tab
+        self._strides = [st//tab.itemsize for st in tab.strides]
+        self._kernel = _multilinearKernels.get(len(ranges), _multilinear)
+        
+        #Positions of the active dimensions, and variables with a single data-point (position, name, value)
+        self._active = [ii for ii, f in enumerate(self.order) if len(self._ranges[f]) > 1]
+        self._inactive = [(ii, f, self._ranges[f][0]) for ii, f in enumerate(self.order) if len(self._ranges[f]) == 1]
+    
+    #########################################################################
+    @staticmethod
+    def _interpolatorOptions(outOfBounds:_OoBMethod) -> dict:
+        """
+        The options of the RegularGridInterpolator for an out-of-bounds method.
+
+        Args:
+            outOfBounds (_OoBMethod): The out-of-bounds method.
+
+        Returns:
+            dict: The keyword arguments for the interpolator.
+        """
         #Extrapolation method:
         opts = {"bounds_error":False}
-        if self.outOfBounds == _OoBMethod.fatal:
+        if outOfBounds == _OoBMethod.fatal:
             opts.update(bounds_error=True)
-        elif self.outOfBounds == _OoBMethod.nan:
+        elif outOfBounds == _OoBMethod.nan:
             opts.update(fill_value=float('nan'))
-        elif self.outOfBounds == _OoBMethod.extrapolate:
+        elif outOfBounds == _OoBMethod.extrapolate:
             opts.update(fill_value=None)
         else:
-            raise ValueError(f"Unexpecred out-of-bound method {self.outOfBounds}")
-        
-        self._interpolator = RegularGridInterpolator(tuple(ranges), tab, **opts)
+            raise ValueError(f"Unexpecred out-of-bound method {outOfBounds}")
+        return opts
     
     #########################################################################
     #Public member functions:
@@ -1023,9 +1217,17 @@ class Tabulation(BaseTabulation):
     
     def copy(self):
         """
-        Create a copy of the tabulation.
+        Create a copy of the tabulation. The data are copied, while the arrays of the 
+        ranges are shared with the original, since they are never modified in place 
+        (only replaced), so the checks of the constructor are not repeated.
         """
-        return Tabulation(self._data, self.ranges, self.order, outOfBounds=self.outOfBounds)
+        table = self.__class__.__new__(self.__class__)
+        table.__dict__.update(self.__dict__)
+        table._data = self._data.copy()
+        table._ranges = self._ranges.copy()
+        table._order = self._order.copy()
+        table._createInterpolator()
+        return table
     
     #Conversion
     toPandas = to_pandas = toPandas
@@ -1070,9 +1272,11 @@ class Tabulation(BaseTabulation):
         Multi-linear interpolation from the tabulation. The input data must be consistent with the number of input-variables stored in the tabulation.
 
         Args:
-            *args (tuple[float,...] | Iterable[tuple[float,...]]): The input data to interpolate.
+            *args (tuple[float,...] | Iterable[tuple[float,...]] | np.ndarray): The input data to interpolate.
             - If tuple[float,...] is given, returns float.
             - If tuple[tuple[float,...]] is given, returns np.ndarray[float], where each entry is the result of the interpolation.
+            - If a single np.ndarray of shape (N, ndim) is given, returns np.ndarray[float] of shape (N,). The points are
+              interpolated all at once, without checking each entry.
             outOfBounds (str, optional): Overwrite the out-of-bounds method before interpolation. Defaults to None.
 
         Returns:
@@ -1081,6 +1285,10 @@ class Tabulation(BaseTabulation):
         #Check arguments
         self.checkType(args, (tuple, Iterable), "args")
         
+        #Batch of points
+        if (len(args) == 1) and isinstance(args[0], np.ndarray) and (args[0].ndim == 2):
+            return self._interpolateArray(args[0], outOfBounds=outOfBounds)
+        
         #Check for single entry
         if not isinstance(args[0], Iterable):
             args = [args]
@@ -1110,17 +1318,8 @@ class Tabulation(BaseTabulation):
                                 "variable will be ignored.")
                             )
         
-        #Update out-of-bounds
-        if not outOfBounds is None:
-            oldOoB = self.outOfBounds
-            self.outOfBounds = outOfBounds
-        
         #Compute
-        returnValue = self.interpolator(entries)
-        
-        #Reset oob
-        if not outOfBounds is None:
-            self.outOfBounds = oldOoB
+        returnValue = self._interpolate(entries, outOfBounds=outOfBounds)
         
         #Give results
         if len(returnValue) == 1:
@@ -1128,6 +1327,256 @@ class Tabulation(BaseTabulation):
         else:
             return returnValue
     
+    #######################################
+    def _interpolatePoint(self, entry:Iterable[float], *, outOfBounds:str=None) -> float:
+        """
+        Multi-linear interpolation of a single point, without checking the types of the entries.
+
+        Args:
+            entry (Iterable[float]): The input data, with one value for each input-variable.
+            outOfBounds (str, optional): Overwrite the out-of-bounds method before interpolation. Defaults to None.
+
+        Returns:
+            float: The interpolated value.
+        """
+        return self._combine(self._locatePoint(entry, outOfBounds=outOfBounds))
+    
+    #######################################
+    def _locatePoint(self, entry:Iterable[float], *, outOfBounds:str=None) -> tuple[int,list[float]]|None:
+        """
+        Locate a single point in the table (see _locate), without checking the types of the entries. 
+        The output can be combined with the data of any table with the same grid (see _combine).
+
+        Args:
+            entry (Iterable[float]): The input data, with one value for each input-variable.
+            outOfBounds (str, optional): Overwrite the out-of-bounds method. Defaults to None.
+
+        Returns:
+            tuple[int,list[float]]|None: The flat index of the lower vertex of the cell and the weights 
+                of the upper vertex along each active dimension (None if out-of-bounds with method 'nan').
+        """
+        if len(entry) != len(self._order):
+            raise ValueError("Number of entries not consistent with number of dimensions stored in the tabulation ({} expected, while {} found).".format(self.ndim, len(entry)))
+        
+        for ii, f, value in self._inactive:
+            if entry[ii] != value:
+                warnings.warn(
+                    TabulationAccessWarning(
+                        f"Variable '{f}' with only one data-point, cannot " +
+                        "interpolate along that dimension. Entry for that " +
+                        "variable will be ignored.")
+                    )
+        
+        return self._locate([entry[ii] for ii in self._active], outOfBounds=self._outOfBoundsMethod(outOfBounds))
+    
+    #######################################
+    def _interpolateArray(self, points:np.ndarray, *, outOfBounds:str=None) -> np.ndarray[float]:
+        """
+        Multi-linear interpolation of a batch of points.
+
+        Args:
+            points (np.ndarray): The input data, with shape (N, ndim).
+            outOfBounds (str, optional): Overwrite the out-of-bounds method before interpolation. Defaults to None.
+
+        Returns:
+            np.ndarray[float]: The interpolated values, with shape (N,).
+        """
+        return self._interpolate(self._activePoints(points), outOfBounds=outOfBounds)
+    
+    #######################################
+    def _locateArray(self, points:np.ndarray, *, outOfBounds:str=None) -> tuple[np.ndarray,np.ndarray,np.ndarray|None]:
+        """
+        Locate a batch of points in the table (see _locatePoints). The output can be combined 
+        with the data of any table with the same grid (see _combineArray).
+
+        Args:
+            points (np.ndarray): The input data, with shape (N, ndim).
+            outOfBounds (str, optional): Overwrite the out-of-bounds method. Defaults to None.
+
+        Returns:
+            tuple[np.ndarray,np.ndarray,np.ndarray|None]: The output of _locatePoints.
+        """
+        return self._locatePoints(np.asarray(self._activePoints(points), dtype=float), outOfBounds=self._outOfBoundsMethod(outOfBounds))
+    
+    #######################################
+    def _activePoints(self, points:np.ndarray) -> np.ndarray:
+        """
+        Extract the coordinates along the active dimensions from a batch of points with shape (N, ndim),
+        warning if the entries of variables with only one data-point are not consistent.
+        """
+        if points.shape[1] != self.ndim:
+            raise ValueError("Number of entries not consistent with number of dimensions stored in the tabulation ({} expected, while {} found).".format(self.ndim, points.shape[1]))
+        
+        #Extract active dimensions
+        active = []
+        for ii, f in enumerate(self.order):
+            if len(self._ranges[f]) > 1:
+                active.append(ii)
+            elif np.any(points[:,ii] != self._ranges[f][0]):
+                warnings.warn(
+                    TabulationAccessWarning(
+                        f"Variable '{f}' with only one data-point, cannot " +
+                        "interpolate along that dimension. Entry for that " +
+                        "variable will be ignored.")
+                    )
+        
+        return points[:,active]
+    
+    #######################################
+    def _sameGrid(self, other:Tabulation) -> bool:
+        """
+        Whether another table has the same variables, sampling points, and memory layout 
+        of the data, so that a point located in this table (see _locatePoint/_locateArray)
+        can be combined also with the data of the other table.
+
+        Args:
+            other (Tabulation): The other table.
+
+        Returns:
+            bool: If the grids are the same.
+        """
+        return (self.order == other.order) \
+            and all(np.array_equal(self._ranges[f], other._ranges[f]) for f in self.order) \
+            and (self._strides == other._strides)
+    
+    #######################################
+    def _outOfBoundsMethod(self, outOfBounds:str|None) -> _OoBMethod:
+        """
+        The out-of-bounds method to use: the one of the table if None, else the one given (without changing the table).
+        """
+        if outOfBounds is None:
+            return self._outOfBounds
+        self.checkType(outOfBounds, str, "outOfBounds")
+        return _OoBMethod(outOfBounds)
+    
+    #######################################
+    def _interpolate(self, entries:Iterable[Iterable[float]], *, outOfBounds:str=None) -> np.ndarray[float]:
+        """
+        Interpolate at the active dimensions of the table.
+
+        Args:
+            entries (Iterable[Iterable[float]]): The input data along the active dimensions.
+            outOfBounds (str, optional): Overwrite the out-of-bounds method before interpolation. Defaults to None.
+
+        Returns:
+            np.ndarray[float]: The interpolated values.
+        """
+        outOfBounds = self._outOfBoundsMethod(outOfBounds)
+        
+        #Single point: interpolate directly, avoiding the overhead of the array operations
+        if len(entries) == 1:
+            return np.array([self._combine(self._locate(entries[0], outOfBounds=outOfBounds))])
+        
+        return self._combineArray(self._locatePoints(np.asarray(entries, dtype=float), outOfBounds=outOfBounds))
+    
+    #######################################
+    def _locatePoints(self, points:np.ndarray, *, outOfBounds:_OoBMethod) -> tuple[np.ndarray,np.ndarray,np.ndarray|None]:
+        """
+        Locate a batch of points in the table at once (np.searchsorted along each dimension, 
+        or direct indexing on uniform grids).
+
+        Args:
+            points (np.ndarray): The points along the active dimensions, with shape (N, D).
+            outOfBounds (_OoBMethod): The out-of-bounds method.
+
+        Returns:
+            tuple[np.ndarray,np.ndarray,np.ndarray|None]: The flat index of the lower vertex of the
+                cell of each point, with shape (N,), the weights of the upper vertices, with shape (D, N), 
+                and the mask of the points out-of-bounds if the out-of-bounds method is 'nan' (else None).
+        """
+        strides = self._strides
+        
+        #Locate the cells (the first/last ones if extrapolating)
+        base = np.zeros(len(points), dtype=np.intp)
+        weights = np.empty((len(self._gridArrays), len(points)))
+        outside = np.zeros(len(points), dtype=bool)
+        for dim, (grid, invDelta, invUniformDelta) in enumerate(zip(self._gridArrays, self._invDeltaArrays, self._invUniformDelta)):
+            x = points[:,dim]
+            inside = (x >= grid[0]) & (x <= grid[-1])
+            if not inside.all():
+                if outOfBounds == _OoBMethod.fatal:
+                    raise ValueError(f"One of the requested xi is out of bounds in dimension {dim}")
+                outside |= ~inside
+            
+            if invUniformDelta is None:
+                ii = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, len(grid) - 2)
+            else:
+                #Uniform grid: cell from the distance to the first point, corrected by one cell at most 
+                #for the round-off (same cells as with the search)
+                ii = np.clip(((x - grid[0])*invUniformDelta).astype(np.intp), 0, len(grid) - 2)
+                ii -= (grid[ii] > x) & (ii > 0)
+                ii += (grid[ii + 1] <= x) & (ii < len(grid) - 2)
+            base += ii*strides[dim]
+            weights[dim] = (x - grid[ii])*invDelta[ii]
+        
+        return base, weights, (outside if outOfBounds == _OoBMethod.nan else None)
+    
+    #######################################
+    def _combineArray(self, located:tuple[np.ndarray,np.ndarray,np.ndarray|None]) -> np.ndarray[float]:
+        """
+        Multi-linear interpolation of a batch of points located with _locatePoints, summing the 
+        contributions of the vertices of their cells, gathered from the flattened data.
+
+        Args:
+            located (tuple[np.ndarray,np.ndarray,np.ndarray|None]): The output of _locatePoints.
+
+        Returns:
+            np.ndarray[float]: The interpolated values, with shape (N,).
+        """
+        base, weights, outside = located
+        out = _combinePoints(self._values.ravel(), np.array(self._strides, dtype=np.intp), base, weights, np.empty(base.size))
+        
+        if not outside is None:
+            out[outside] = float('nan')
+        return out
+    
+    #######################################
+    def _locate(self, entry:Iterable[float], *, outOfBounds:_OoBMethod) -> tuple[int,list[float]]|None:
+        """
+        Locate a point in the table, i.e., find the cell containing it and the 
+        interpolation weights along each active dimension.
+
+        Args:
+            entry (Iterable[float]): The point along the active dimensions.
+            outOfBounds (_OoBMethod): The out-of-bounds method.
+
+        Returns:
+            tuple[int,list[float]]|None: The flat index of the lower vertex of the cell 
+                and the weights of the upper vertex along each dimension. None if the point
+                is out-of-bounds and the out-of-bounds method is 'nan'.
+        """
+        base = 0
+        weights = []
+        for dim, (x, grid, invDelta, stride) in enumerate(zip(entry, self._grid, self._invDelta, self._strides)):
+            if not (grid[0] <= x <= grid[-1]):
+                if outOfBounds == _OoBMethod.fatal:
+                    raise ValueError(f"One of the requested xi is out of bounds in dimension {dim}")
+                elif outOfBounds == _OoBMethod.nan:
+                    return None
+            
+            #Cell containing the point (the first/last one if extrapolating)
+            ii = min(max(bisect_right(grid, x) - 1, 0), len(grid) - 2)
+            base += ii*stride
+            weights.append((x - grid[ii])*invDelta[ii])
+        
+        return base, weights
+    
+    #######################################
+    def _combine(self, located:tuple[int,list[float]]|None) -> float:
+        """
+        Multi-linear interpolation in a cell of the table located with _locate
+        (with the kernel specialized for the number of dimensions, if available).
+
+        Args:
+            located (tuple[int,list[float]]|None): The output of _locate.
+
+        Returns:
+            float: The interpolated value.
+        """
+        if located is None:
+            return float('nan')
+        return self._kernel(self._values, self._strides, *located)
+    
     #######################################
     def __getitem__(self, index:int|tuple[int]|slice|tuple[slice]) -> float|np.ndarray[float]:
         """
@@ -1189,8 +1638,8 @@ class Tabulation(BaseTabulation):
             else:
                 raise TypeError("Cannot access with index of type '{}'.".format(index.__class__.__name__))
             
-        except BaseException as err:
-            raise ValueError("Failed setting items in Tabulation: {}".format(err))
+        except Exception as err:
+            raise ValueError("Failed setting items in Tabulation: {}".format(err)) from err
         
         #Update interpolator
         self._createInterpolator()
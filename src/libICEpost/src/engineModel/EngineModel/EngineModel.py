@@ -427,24 +427,24 @@ class EngineModel(BaseClass):
         if not isinstance(combustionProperties, Dictionary):
             combustionProperties = Dictionary(**combustionProperties)
         
+        #NOTE: When introducing the injection models, need to compute EVO composition instead
+        
         if "EgrModel" in combustionProperties:
             #Construct egr model from combustion properties
             egrModelType:str = combustionProperties.lookup("EgrModel")
             egrModelDict = combustionProperties.lookupOrDefault(egrModelType + "Dict", Dictionary())
             egrModelDict.update(reactants=self._cylinder.mixture.mix) #Append to dictionary the cylinder properties
-        else:
-            #Use default
-            self.EgrModel = self.Submodels["EgrModel"].copy().update(reactants=self._cylinder.mixture.mix)
-        
-        #NOTE: When introducing the injection models, need to compute EVO composition instead
-        
-        #Construct the EGR model
-        self.EgrModel = EgrModel.selector(egrModelType, egrModelDict)
+            
+            #Construct the EGR model
+            self.EgrModel = EgrModel.selector(egrModelType, egrModelDict)
+        #else: use the sub-model already set (default: no EGR)
         
         print(f"\tType: {self.EgrModel.__class__.__name__}")
         
-        #Apply EGR to reactants
-        self._cylinder.mixture.mix.dilute(self.EgrModel.EgrMixture, self.EgrModel.egr)
+        #Apply EGR to reactants (the EGR model is static: read its values once)
+        egrMixture, egr = self.EgrModel.EgrMixture, self.EgrModel.egr
+        if egr > 0.0:
+            self._cylinder.mixture.mix.dilute(egrMixture, egr)
     
     ####################################
     def _constructCombustionModel(self, combustionProperties:dict|Dictionary):
@@ -886,7 +886,7 @@ class EngineModel(BaseClass):
         #Add fields to data:
         fields = {"dpdCA", "AHRR", "ROHR", "A"}
         for zone in self.Zones:
-            fields |= {v + get_postfix(zone) for v in getattr(self, f"_{zone}").state.__dict__}
+            fields |= {v + get_postfix(zone) for v in getattr(self, f"_{zone}").state}
         for f in fields:
             if not f in self.data.columns:
                 self.data.loc[:,f] = float("nan")
@@ -961,7 +961,8 @@ class EngineModel(BaseClass):
             Z:ThermoModel = getattr(self, f"_{zone}")
             
             #Properties
-            self.data.loc[index, Z.state.__dict__.keys()] = [Z.state.__dict__[key] for key in Z.state.__dict__.keys()]
+            state = Z.state
+            self.data.loc[index, list(state)] = list(state.values())
             
             #Specie
             # for specie in Z.mixture.mix:
@@ -1165,7 +1166,7 @@ class EngineModel(BaseClass):
         return integrate.trapz(data.loc[:,"p"], x=data.loc[:,"V"])
     
     ####################################
-    def plotPV(self, /,*,start:float=None, end:float=None, loglog:bool=True, timingsParams:dict=dict(), showTimings:bool=True, ax:Axes=None, **kwargs):
+    def plotPV(self, /,*,start:float=None, end:float=None, loglog:bool=True, timingsParams:dict=None, showTimings:bool=True, ax:Axes=None, **kwargs):
         """
         Create the pressure-volume diagram of the thermodynamic cycle.
 
@@ -1173,7 +1174,7 @@ class EngineModel(BaseClass):
             start (float, optional): The beginning of the plot (CA). Defaults to None.
             end (float, optional): The end of the plot (CA). Defaults to None.
             loglog (bool, optional): log-log scale. Defaults to True.
-            timingsParams(dict, optional): The kwargs for the scatter for timings. Defaults to:
+            timingsParams(dict, optional): The kwargs for the scatter for timings (not modified). Defaults to:
             {
                 "edgecolor":"k",
                 "zorder":2,
@@ -1187,13 +1188,14 @@ class EngineModel(BaseClass):
         if end is None:
             end = self.data.iloc[len(self.data)-1]["CA"]
         
-        #Set default timingsParams
-        default = \
+        #Set default timingsParams (work on a local copy, so neither the
+        #caller's dictionary nor a shared default is modified)
+        timingsParams = \
         {
             "edgecolor":"k",
             "zorder":2,
+            **(dict() if timingsParams is None else timingsParams)
         }
-        [timingsParams.update({p:default[p]}) for p in default if not p in timingsParams]
         
         #Check arguments
         self.checkType(start,float,"start")
@@ -13,6 +13,7 @@ Last update:        12/06/2023
 
 from libICEpost.src.base.Utilities import Utilities
 from libICEpost.src.base.BaseClass import BaseClass, abstractmethod
+from libICEpost.src.base.Functions.typeChecking import checkFloat
 
 import numpy as np
 
@@ -38,48 +39,64 @@ class LaminarFlameSpeedModel(BaseClass, Utilities):
     #########################################################################
     #Cumpute laminar flame speed:
     @abstractmethod
-    def Su(self,p:float,T:float,phi:float,EGR:float=None) -> float|np.ndarray:
+    def Su(self,p:float|np.ndarray,T:float|np.ndarray,phi:float|np.ndarray,EGR:float|np.ndarray=None) -> float|np.ndarray:
         """
         Used to compute laminar flame speed in derived class. Here in the base class
         it is used only for argument checking.
 
         Args:
-            p (float): Pressure [Pa].
-            T (float): Unburnt gas temperature [K]
-            phi (float): Equivalence ratio [-].
-            EGR (float, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
 
         Returns:
             float|np.ndarray: The computed laminar flame speed [m/s].
         """
-        self.checkType(p, float, entryName="p")
-        self.checkType(T, float, entryName="T")
-        self.checkType(phi, float, entryName="phi")
-        if not(EGR is None):
-            self.checkType(EGR, float, entryName="EGR")
+        checkFloat(p, "p", allowArray=True)
+        checkFloat(T, "T", allowArray=True)
+        checkFloat(phi, "phi", allowArray=True)
+        checkFloat(EGR, "EGR", allowArray=True, allowNone=True)
     
     ##############################
     #Cumpute laminar flame thickness:
     @abstractmethod
-    def deltaL(self,p:float,T:float,phi:float,EGR:float=None) -> float|np.ndarray:
+    def deltaL(self,p:float|np.ndarray,T:float|np.ndarray,phi:float|np.ndarray,EGR:float|np.ndarray=None) -> float|np.ndarray:
         """
         Used to compute laminar flame thickness in derived class. Here in the base class
         it is used only for argument checking.
 
         Args:
-            p (float): Pressure [Pa].
-            T (float): Unburnt gas temperature [K]
-            phi (float): Equivalence ratio [-].
-            EGR (float, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
 
         Returns:
             float|np.ndarray: The computed laminar flame thickness [m].
         """
-        self.checkType(p, float, entryName="p")
-        self.checkType(T, float, entryName="T")
-        self.checkType(phi, float, entryName="phi")
-        if not(EGR is None):
-            self.checkType(EGR, float, entryName="EGR")
+        checkFloat(p, "p", allowArray=True)
+        checkFloat(T, "T", allowArray=True)
+        checkFloat(phi, "phi", allowArray=True)
+        checkFloat(EGR, "EGR", allowArray=True, allowNone=True)
+    
+    ##############################
+    #Cumpute laminar flame speed and thickness:
+    def SuDeltaL(self,p:float|np.ndarray,T:float|np.ndarray,phi:float|np.ndarray,EGR:float|np.ndarray=None) -> tuple[float|np.ndarray,float|np.ndarray]:
+        """
+        Compute laminar flame speed and thickness at once. Derived classes can override 
+        it to share the computations needed by both.
+
+        Args:
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+
+        Returns:
+            tuple[float|np.ndarray,float|np.ndarray]: The laminar flame speed [m/s] and thickness [m].
+        """
+        return self.Su(p, T, phi, EGR), self.deltaL(p, T, phi, EGR)
         
 #############################################################################
 LaminarFlameSpeedModel.createRuntimeSelectionTable()
@@ -14,16 +14,40 @@ Last update:        12/06/2023
 from __future__ import annotations
 
 from typing import Iterable, Any
+from functools import lru_cache
+from operator import itemgetter
 
 from libICEpost.src.base.dataStructures.Tabulation.OFTabulation import OFTabulation
 from .LaminarFlameSpeedModel import LaminarFlameSpeedModel
+from libICEpost.src.base.Functions.typeChecking import checkFloat
 
 from libICEpost.src.base.dataStructures.Dictionary import Dictionary
 
 from libICEpost.src.base.dataStructures.Tabulation.Tabulation import Tabulation
 
+from foamlib import FoamFile
+
 import numpy as np 
-import copy as cp
+
+from libICEpost.GLOBALS import __CACHE_SIZE__
+
+#############################################################################
+#                           AUXILIARY FUNCTIONS                             #
+#############################################################################
+@lru_cache(maxsize=__CACHE_SIZE__)
+def _stateGetter(order:tuple[str]) -> itemgetter:
+    """
+    Getter to sort the state (p, Tu, phi, egr) as in the nesting order of the table.
+    """
+    return itemgetter(*[("p", "Tu", "phi", "egr").index(var) for var in order])
+
+def _fastAxisOrder(order:list[str], fastAxis:str) -> list[str]:
+    """
+    Nesting order with the variable 'fastAxis' moved to the last (fastest-varying) position.
+    """
+    if not fastAxis in order:
+        raise ValueError(f"Variable '{fastAxis}' not found in the table (available variables are {order}).")
+    return [var for var in order if not var == fastAxis] + [fastAxis]
 
 #############################################################################
 #                               MAIN CLASSES                                #
@@ -39,10 +63,13 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
     __order:list[str] = ["p", "Tu", "phi", "egr"]
     __files:dict[str,str] = {"Su":"laminarFlameSpeedTable", "deltaL":"deltaLTable"}
     
+    _gridCheck:tuple[list[np.ndarray],list[np.ndarray],bool]|None = None
+    """The grids of the Su and deltaL tables when last compared, and whether they are the same (see _sharedGrid)"""
+    
     #########################################################################
     #Class methods:
     @classmethod
-    def fromFile(cls, path:str, readLaminarFlameThickness:bool=True, noWrite=True, **kwargs) -> TabulatedLFS:
+    def fromFile(cls, path:str, readLaminarFlameThickness:bool=True, noWrite=True, fastAxis:str=None, **kwargs) -> TabulatedLFS:
         """
         Construct a table from files stored in an OpenFOAM-LibICE tabulation locted at 'path'.
         Directory structure as follows: \\
@@ -60,7 +87,10 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
             path (str): The master path where the tabulation is stored.
             readLaminarFlameThickness (bool, optional): Is the laminar flame thickness to be loaded? (in case it was not tabulated). Defaults to True.
             noWrite (bool, optional): Handle to prevent write access of this class to the tabulation (avoid overwrite). Defaults to True.
-            **kwargs: Optional keyword arguments of Tabulation.__init__ method of each Tabulation object.
+            fastAxis (str, optional): The input variable (p, Tu, phi, egr) to store as the fastest-varying (last) 
+                dimension of the tables (see TabulatedLFS.__init__). Defaults to None (nesting order of the files).
+            **kwargs: Optional keyword arguments of Tabulation.__init__ method of each Tabulation object 
+                (e.g., dtype=np.float32 to halve the memory of large tables, if ~1e-7 relative accuracy is sufficient).
             
         Returns:
             TabulatedLFS: the tabulation
@@ -68,10 +98,12 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
         cls.checkType(path, str, "path")
         cls.checkType(noWrite, bool, "noWrite")
         cls.checkType(readLaminarFlameThickness, bool, "readLaminarFlameThickness")
+        if not fastAxis is None:
+            cls.checkType(fastAxis, str, "fastAxis")
         
         order = cls.__order[:]
         inputNames = cls.__inputNames[:]
-        files = cp.deepcopy(cls.__files)
+        files = cls.__files.copy()
         
         #Read table properties to see if EGR is present
         with FoamFile(path + "/tableProperties") as tableProperties:
@@ -81,7 +113,7 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
                 del order[-1]
                 del inputNames[-1]
                 
-        return super().fromFile(
+        tab = super().fromFile(
             path=path,
             order=order,
             files=files,
@@ -89,6 +121,12 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
             noRead=(None if readLaminarFlameThickness else ["deltaL"]),
             noWrite=noWrite,
             **kwargs)
+        
+        #Reorder the tables
+        if not fastAxis is None:
+            tab.order = _fastAxisOrder(tab.order, fastAxis)
+        
+        return tab
     
     ###################################
     #Class methods:
@@ -99,6 +137,7 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
             path (str): The master path where the tabulation is stored.
             readLaminarFlameThickness (bool, optional): Is the laminar flame thickness to be loaded? (in case it was not tabulated). Defaults to True.
             noWrite (bool, optional): Handle to prevent write access of this class to the tabulation (avoid overwrite). Defaults to True.
+            fastAxis (str, optional): The input variable to store as the fastest-varying dimension of the tables. Defaults to None.
             kwargs (dict, optional): The optional keyword arguments to pass to Tabulation instance for construction. Defaults to dict().
         
         Args:
@@ -114,6 +153,7 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
             path=dictionary.lookup("path", varType=str),
             readLaminarFlameThickness=dictionary.lookupOrDefault("readLaminarFlameThickness", default=True),
             noWrite=dictionary.lookupOrDefault("noWrite", default=True),
+            fastAxis=dictionary.lookupOrDefault("fastAxis", default=None),
             **dictionary.lookupOrDefault("kwargs", default=dict()),
             )
     
@@ -131,6 +171,7 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
         path:str=None, 
         noWrite:bool=True,
         tablePropertiesParameters:dict[str,Any]=None, 
+        fastAxis:str=None,
         **kwargs):
         """Construct a tabulation from sampling points and unwrapped list of data-points for each variable to tabulate.
         
@@ -144,7 +185,13 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
             path (str, optional): The path where to save the tabulation. Defaults to None.
             noWrite (bool, optional): Forbid writing (prevent overwrite). Defaults to True.
             tablePropertiesParameters (dict[str,Any], optional): Additional parameters to store in the tableProperties. Defaults to None.
-            **kwargs: Optional keyword arguments of Tabulation.__init__ method of each Tabulation object.
+            fastAxis (str, optional): The input variable (p, Tu, phi, egr) to store as the fastest-varying (last) dimension 
+                of the tables. If the evaluations sweep mainly one of the variables (e.g., Tu in the cells of a CFD 
+                domain at almost constant pressure), the vertices of consecutive look-ups are contiguous in memory, 
+                improving the cache usage. This changes the nesting order of the tables (also when written to files). 
+                Defaults to None (nesting order p, Tu, phi, egr).
+            **kwargs: Optional keyword arguments of Tabulation.__init__ method of each Tabulation object
+                (e.g., dtype=np.float32 to halve the memory moved at each interpolation).
         """
         #LFS and LFT
         self.checkType(Su, Iterable, "Su")
@@ -156,7 +203,7 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
         ranges = dict()
         order = self.__order[:]
         inputNames = self.__inputNames[:]
-        files = cp.deepcopy(self.__files)
+        files = self.__files.copy()
         
         #Pressure
         self.checkType(pRange, Iterable, "pRange")
@@ -190,6 +237,11 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
             tablePropertiesParameters=tablePropertiesParameters,
             **kwargs
         )
+        
+        #Reorder the tables
+        if not fastAxis is None:
+            self.checkType(fastAxis, str, "fastAxis")
+            self.order = _fastAxisOrder(self.order, fastAxis)
     
     #########################################################################
     #Get SuTable:
@@ -197,7 +249,7 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
         """
         The tabulation of laminar flame speed (read-only)
         """
-        return self.tables["Su"]
+        return self._data["Su"].table.copy()
     
     ################################
     #Get deltaLTable:
@@ -205,51 +257,154 @@ class TabulatedLFS(OFTabulation,LaminarFlameSpeedModel):
         """
         The tabulation of laminar flame tickness (read-only)
         """
-        return self.tables["deltaL"]
+        table = self._data["deltaL"].table
+        return None if table is None else table.copy()
+    
+    #########################################################################
+    def _interpolateLFS(self, table:str, p:float|np.ndarray, T:float|np.ndarray, phi:float|np.ndarray, EGR:float|np.ndarray=None, **kwargs) -> float|np.ndarray[float]:
+        """
+        Interpolate from a table at the given state. If any of the inputs is an array, 
+        the inputs are broadcasted and interpolated at all points at once.
+
+        Args:
+            table (str): The name of the table.
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+            **kwargs: The key-word arguments to pass to Tabulation.__call__ method.
+
+        Returns:
+            float|np.ndarray[float]: The interpolated value(s).
+        """
+        #The inputs were already checked: interpolate directly from the table, without 
+        #going through the checks of OFTabulation.__call__ and Tabulation.__call__
+        tab = self._data[table].table
+        if tab is None:
+            raise ValueError(f"Table for field '{table}' not yet loaded (None).")
+        
+        #Sort the state as the nesting order of the table
+        vars = _stateGetter(tuple(self._order))((p,T,phi,EGR))
+        if not any(isinstance(v, np.ndarray) for v in vars):
+            return tab._interpolatePoint(vars, **kwargs)
+        
+        vars = np.broadcast_arrays(*vars)
+        points = np.stack(vars, axis=-1).reshape(-1, len(vars)).astype(float)
+        return tab._interpolateArray(points, **kwargs).reshape(vars[0].shape)
+    
+    ################################
+    def _sharedGrid(self, Su:Tabulation, deltaL:Tabulation) -> bool:
+        """
+        Whether the Su and deltaL tables have the same grid, so that a state located in the 
+        Su table can be used also for the deltaL table. The grids are compared again only if 
+        the tables were changed (the grid arrays are rebuilt at each change of a table).
+
+        Args:
+            Su (Tabulation): The table of laminar flame speed.
+            deltaL (Tabulation): The table of laminar flame thickness.
+
+        Returns:
+            bool: If the grids are the same.
+        """
+        check = self._gridCheck
+        if (check is None) or not ((check[0] is Su._gridArrays) and (check[1] is deltaL._gridArrays)):
+            check = self._gridCheck = (Su._gridArrays, deltaL._gridArrays, Su._sameGrid(deltaL))
+        return check[2]
     
     #########################################################################
     #Cumpute laminar flame speed:
-    def Su(self,p:float,T:float,phi:float,EGR=None, **kwargs):
+    def Su(self,p:float|np.ndarray,T:float|np.ndarray,phi:float|np.ndarray,EGR:float|np.ndarray=None, **kwargs):
         """
-        Interpolate laminar flame speed from tabulation.
+        Interpolate laminar flame speed from tabulation. If any of the inputs is an array,
+        the inputs are broadcasted and an array with the broadcasted shape is returned.
 
         Args:
-            p (float): Pressure [Pa].
-            T (float): Unburnt gas temperature [K]
-            phi (float): Equivalence ratio [-].
-            EGR (float, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
             **kwargs: The key-word arguments to pass to Tabulation.__call__ method.
 
         Returns:
             float|np.ndarray[float]: The computed laminar flame speed [m/s].
+        
+        NOTE: in loops with many evaluations, the check of the arguments can be skipped
+        disabling the type-checking (libICEpost.GLOBALS.__TYPE_CHECKING__ = False).
         """
         #Check arguments:
-        LaminarFlameSpeedModel.Su(self,p,T,phi,EGR)
+        checkFloat(p, "p", allowArray=True)
+        checkFloat(T, "T", allowArray=True)
+        checkFloat(phi, "phi", allowArray=True)
+        checkFloat(EGR, "EGR", allowArray=True, allowNone=True)
         
-        vars = (p,T,phi,EGR) if "egr" in self.order else (p,T,phi)
-        return self("Su", *vars, **kwargs)
+        return self._interpolateLFS("Su", p, T, phi, EGR, **kwargs)
     
     ################################
     #Cumpute laminar flame tickness:
-    def deltaL(self,p,T,phi,EGR=None, **kwargs):
+    def deltaL(self,p:float|np.ndarray,T:float|np.ndarray,phi:float|np.ndarray,EGR:float|np.ndarray=None, **kwargs):
         """
-        Interpolate laminar flame thickness from tabulation.
+        Interpolate laminar flame thickness from tabulation. If any of the inputs is an array,
+        the inputs are broadcasted and an array with the broadcasted shape is returned.
 
         Args:
-            p (float): Pressure [Pa].
-            T (float): Unburnt gas temperature [K]
-            phi (float): Equivalence ratio [-].
-            EGR (float, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
             **kwargs: The key-word arguments to pass to Tabulation.__call__ method.
 
         Returns:
             float|np.ndarray[float]: The computed laminar flame thickness [m].
         """
         #Check arguments:
-        LaminarFlameSpeedModel.deltaL(self,p,T,phi,EGR)
+        checkFloat(p, "p", allowArray=True)
+        checkFloat(T, "T", allowArray=True)
+        checkFloat(phi, "phi", allowArray=True)
+        checkFloat(EGR, "EGR", allowArray=True, allowNone=True)
+        
+        return self._interpolateLFS("deltaL", p, T, phi, EGR, **kwargs)
+    
+    ################################
+    #Cumpute laminar flame speed and thickness:
+    def SuDeltaL(self,p:float|np.ndarray,T:float|np.ndarray,phi:float|np.ndarray,EGR:float|np.ndarray=None, **kwargs) -> tuple[float|np.ndarray[float],float|np.ndarray[float]]:
+        """
+        Interpolate laminar flame speed and thickness from tabulation at once, locating 
+        the state in the tables (cells and interpolation weights) only once. If any of 
+        the inputs is an array, the inputs are broadcasted and arrays with the broadcasted 
+        shape are returned.
+
+        Args:
+            p (float|np.ndarray): Pressure [Pa].
+            T (float|np.ndarray): Unburnt gas temperature [K]
+            phi (float|np.ndarray): Equivalence ratio [-].
+            EGR (float|np.ndarray, optional): (optional) mass fraction of recirculated exhaust gasses. Defaults to None.
+            **kwargs: The key-word arguments to pass to Tabulation.__call__ method.
+
+        Returns:
+            tuple[float|np.ndarray[float],float|np.ndarray[float]]: The laminar flame speed [m/s] and thickness [m].
+        """
+        #Check arguments:
+        checkFloat(p, "p", allowArray=True)
+        checkFloat(T, "T", allowArray=True)
+        checkFloat(phi, "phi", allowArray=True)
+        checkFloat(EGR, "EGR", allowArray=True, allowNone=True)
+        
+        #The location can be shared if the tables have the same grid and out-of-bounds method
+        Su, deltaL = self._data["Su"].table, self._data["deltaL"].table
+        if (Su is None) or (deltaL is None) or not (("outOfBounds" in kwargs) or (Su._outOfBounds == deltaL._outOfBounds)) \
+            or not self._sharedGrid(Su, deltaL):
+            return self._interpolateLFS("Su", p, T, phi, EGR, **kwargs), self._interpolateLFS("deltaL", p, T, phi, EGR, **kwargs)
+        
+        #Sort the state as the nesting order of the tables
+        vars = _stateGetter(tuple(self._order))((p,T,phi,EGR))
+        if not any(isinstance(v, np.ndarray) for v in vars):
+            located = Su._locatePoint(vars, **kwargs)
+            return Su._combine(located), deltaL._combine(located)
         
-        vars = (p,T,phi,EGR) if "egr" in self.order else (p,T,phi)
-        return self("deltaL", *vars, **kwargs)
+        vars = np.broadcast_arrays(*vars)
+        points = np.stack(vars, axis=-1).reshape(-1, len(vars)).astype(float)
+        located = Su._locateArray(points, **kwargs)
+        return Su._combineArray(located).reshape(vars[0].shape), deltaL._combineArray(located).reshape(vars[0].shape)
     
 #############################################################################
 LaminarFlameSpeedModel.addToRuntimeSelectionTable(TabulatedLFS)
@@ -105,14 +105,14 @@ class Reaction(BaseClass):
         Checks that the atomic composition of the specie are consistent
         """
         atomsR = []
-        for r in self.reactants:
-            for a in r.specie:
+        for r in self.reactants.species:
+            for a in r:
                 if not a.atom in atomsR:
                     atomsR.append(a.atom)
         
         atomsP = []
-        for p in self.products:
-            for a in p.specie:
+        for p in self.products.species:
+            for a in p:
                 if not a.atom in atomsP:
                     atomsP.append(a.atom)
         
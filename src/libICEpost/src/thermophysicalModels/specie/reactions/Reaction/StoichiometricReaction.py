@@ -180,12 +180,10 @@ class StoichiometricReaction(Reaction):
         #Check consistency between reactants and products in terms of atomic specie
         self.checkAtomicSpecie()
         
-        #Determine all chemical specie involved in the reaction
-        molecules = []
-        for specie in self.reactants:
-            molecules.append(specie.specie)
-        for specie in self.products:
-            molecules.append(specie.specie)
+        #Determine all chemical specie involved in the reaction (in order: reactants, products)
+        reactants = self.reactants.species
+        products = self.products.species
+        molecules = reactants + products
         
         #Determine all atomic specie involved in the reaction
         atoms = []
@@ -197,20 +195,16 @@ class StoichiometricReaction(Reaction):
         #Build the matrix of coefficients, associated to the balances of each atomic specie
         coeffs = self.np.zeros((len(atoms), len(molecules)))
         
-        for specie in self.reactants:
-            atomIndices = [atoms.index(a.atom) for a in specie.specie]
-            specieIndex = self.reactants.index(specie.specie)
-            coeffs[atomIndices,specieIndex] += specie.specie.atomicCompositionMatrix().T
-        
-        for specie in self.products:
-            atomIndices = [atoms.index(a.atom) for a in specie.specie]
-            specieIndex = self.products.index(specie.specie) + len(self.reactants)
-            coeffs[atomIndices,specieIndex] -= specie.specie.atomicCompositionMatrix().T
+        for specieIndex, specie in enumerate(molecules):
+            atomIndices = [atoms.index(a.atom) for a in specie]
+            if specieIndex < len(reactants):
+                coeffs[atomIndices,specieIndex] += specie.atomicCompositionMatrix().T
+            else:
+                coeffs[atomIndices,specieIndex] -= specie.atomicCompositionMatrix().T
         
         #Check if all specie are involved in the reaction:
-        for ii, specie in enumerate(molecules):
-            if (specie in self.reactants) and (specie in self.products):
-                raise ValueError("Some chemical specie are not active in the reaction.")
+        if not set(reactants).isdisjoint(products):
+            raise ValueError("Some chemical specie are not active in the reaction.")
         
         #Remove empty atom balances:
         for ii, atom in enumerate(atoms):
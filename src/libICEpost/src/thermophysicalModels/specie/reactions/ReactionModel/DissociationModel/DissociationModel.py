@@ -86,7 +86,7 @@ class DissociationModel(BaseClass):
         if not state is None:
             self.checkType(state, ThermoState, "state")
             if self._state != state:
-                self._state = state.copy()
+                self._state = state #Immutable, no need to copy
                 update = True
         
         return update
@@ -114,11 +114,12 @@ class ReactionModel(BaseClass):
         Returns:
             bool: if something changed
         """
-        if not reactants is None:
-            self.checkType(reactants, Mixture, "reactants")
+        #Lightweight type checking (hot path)
+        if not (reactants is None or isinstance(reactants, Mixture)):
+            raise TypeError(f"Wrong type for entry 'reactants': 'Mixture' expected but '{reactants.__class__.__name__}' was found.")
         
-        if not state is None:
-            self.checkType(state, ThermoState, "state")
+        if not (state is None or isinstance(state, ThermoState)):
+            raise TypeError(f"Wrong type for entry 'state': 'ThermoState' expected but '{state.__class__.__name__}' was found.")
         
         return self._update(reactants, state=state)
     
@@ -137,18 +138,16 @@ class ReactionModel(BaseClass):
         """
         update = False
         
-        #Update reactants
+        #Update reactants (type checking already performed in update)
         if not reactants is None:
-            self.checkType(reactants, Mixture, "reactants")
             if self._reactants != reactants:
-                self._reactants.update(reactants.species, reactants.Y, fracType="mass")
+                self._reactants.assign(reactants)
                 update = True
         
         #Update state variables
         if not state is None:
-            self.checkType(state, ThermoState, "state")
             if self._state != state:
-                self._state = state.copy()
+                self._state = state #Immutable, no need to copy
                 update = True
         
         return update
@@ -146,11 +146,9 @@ class Stoichiometry(ReactionModel):
         """
         Update list of fuels
         """
-        fuels = []
-        for s in self.reactants:
-            if s.specie.name in database.chemistry.specie.Fuels:
-                fuels.append(s.specie)
-        self._fuels = fuels
+        #NOTE: iterate the species (not the MixtureItems), the fractions are not needed
+        Fuels = database.chemistry.specie.Fuels
+        self._fuels = [s for s in self.reactants.species if s.name in Fuels]
         
         return self
         
@@ -211,44 +209,29 @@ class Stoichiometry(ReactionModel):
                 self.reactions[oxReactions[f.name].name] = oxReactions[f.name]
                 # raise ValueError(f"Oxidation reaction not found in database 'rections.{self.ReactionType}' for the couple (fuel, oxidizer) = ({f.name, self.oxidizer.name})")
         
+        #Identification of the active reactions: all reactants of the reaction are found in 
+        #the mixture, among which the oxidizer and at least one fuel (checked once per reaction)
+        reactants = self.reactants
+        activeReactions = []
+        seen = set()
+        for react in oxReactions.values():
+            #The same reaction can be the oxidation reaction of more fuels
+            if id(react) in seen:
+                continue
+            seen.add(id(react))
+            if (self.oxidizer in react.reactants) \
+                and any(mol in react.reactants for mol in self._fuels) \
+                and all(s in reactants for s in react.reactants.species):
+                activeReactions.append(react)
+        
         #Identification of reacting compounds
         yReact = 0.0
         reactingMix = None
-        activeReactions = []
         #Loop over specie of the reactants
-        for specie in self.reactants:
-            #Loop over all oxidation reactions to find the active reactions
+        for specie in reactants:
             #TODO: loop over reducers to find also the reducers.
-            found = False
-            for r in oxReactions:
-                react = oxReactions[r]
-                #Check if the specie in the reactants of the reaction
-                if specie.specie in react.reactants:
-                    #Check that all reactants of the reaction are found in the mixture,
-                    #otherwise the reaction does not take place
-                    active = True
-                    for sR in react.reactants:
-                        if not (sR.specie in self.reactants):
-                            active = False
-                            break
-                    
-                    if not self.oxidizer in react.reactants:
-                        active = False
-                    if not any([mol in react.reactants for mol in self._fuels]):
-                        active = False
-                    
-                    #If not active, skip to next reaction
-                    if not active:
-                        continue
-                    
-                    #If here, an active reaction was found
-                    found = True
-                    
-                    #Check if already added to reactions
-                    if not react in activeReactions:
-                        #Add to active reactions
-                        activeReactions.append(react)
-                    
+            found = any(specie.specie in react.reactants for react in activeReactions)
+            
             #add the specie to the reacting mixture if an active reaction was found
             if found:
                 if reactingMix is None:
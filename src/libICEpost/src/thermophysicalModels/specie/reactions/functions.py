@@ -12,9 +12,11 @@ Last update:        10/06/2024
 #####################################################################
 
 import os
+from bisect import bisect_left
 from typing import Iterable, Any
 
 import yaml
+import numpy as np
 
 from libICEpost.src.base.Functions.typeChecking import checkType
 
@@ -60,6 +62,61 @@ def computeAlphaSt(air:Mixture, fuel:Mixture, *, oxidizer:Molecule=database.chem
         
         return stoich_air_fuel_ratio
     
+#############################################################################
+def computeAlphaStBatch(air:Mixture, fuels:Iterable[Mixture]) -> np.ndarray:
+    """
+    Compute the stoichiometric air-fuel ratios of a set of fuels with the same air
+    (e.g., for parametric studies on fuel blends). Uses the closed-form oxygen balance 
+    for complete oxidation (C -> CO2, H -> H2O, S -> SO2), evaluated for all the fuels 
+    at once through the atomic composition matrix of their species.
+    
+    NOTE: Oxygen is the only oxidizer (as for computeAlphaSt with the default O2 oxidizer): 
+    the oxygen available in the air and the demand of the fuels are computed from the 
+    atomic composition of all their species, while other atoms (e.g., N, Ar) are inert.
+
+    Args:
+        air (Mixture): The air mixture composition
+        fuels (Iterable[Mixture]): The fuel mixture compositions
+        
+    Returns:
+        np.ndarray: The stoichiometric air-fuel ratio of each fuel
+    """
+    checkType(air, Mixture, "air")
+    checkType(fuels, Iterable, "fuels")
+    fuels = list(fuels)
+    [checkType(f, Mixture, f"fuels[{ii}]") for ii,f in enumerate(fuels)]
+    
+    #Moles of O2 required (>0) or provided (<0) by each atom for complete oxidation
+    o2Demand = {"C":1.0, "H":0.25, "S":1.0, "O":-0.5}
+    
+    #Union of the species
+    species:list[Molecule] = []
+    index:dict[Molecule,int] = {}
+    for mix in [air, *fuels]:
+        for s in mix.species:
+            if not s in index:
+                index[s] = len(species)
+                species.append(s)
+    
+    #Specie properties: O2 demand and molecular mass
+    demand = np.array([sum(o2Demand.get(a.atom.name, 0.0)*a.n for a in s) for s in species])
+    MM = np.array([s.MM for s in species])
+    
+    #Mole fractions of the fuels (rows)
+    X = np.zeros((len(fuels), len(species)))
+    for ii, f in enumerate(fuels):
+        X[ii,[index[s] for s in f.species]] = f.X
+    
+    #Air
+    Xair = np.zeros(len(species))
+    Xair[[index[s] for s in air.species]] = air.X
+    o2Air = -(Xair @ demand)
+    if not o2Air > 0.0:
+        raise ValueError("Air mixture does not contain available oxygen.")
+    
+    #Stoichiometric air-fuel ratio (mass based)
+    return ((X @ demand)/o2Air)*(air.MM/(X @ MM))
+
 #############################################################################
 @lru_cache(maxsize=__CACHE_SIZE__)
 def computeAlpha(air:Mixture, fuel:Mixture, reactants:Mixture, *, oxidizer:Molecule=database.chemistry.specie.Molecules.O2) -> float:
@@ -126,9 +183,9 @@ def makeEquilibriumMechanism(path_or_stream:str|Any, species:Iterable[str], *, o
     checkType(species, Iterable, "species")
     [checkType(s, str, f"species[{ii}]") for ii, s in enumerate(species)]
     
-    # Make species a set (remove duplicate)
-    species = set(species)
-    species_list = list(species)
+    # Remove duplicates and sort by name, so that the mechanism does not 
+    # depend on the ordering of the species (nor on the hashing of the set)
+    species_list = sorted(set(species))
     
     # Determine if path_or_stream is a string (file path) or a stream
     is_path = isinstance(path_or_stream, str)
@@ -145,13 +202,14 @@ def makeEquilibriumMechanism(path_or_stream:str|Any, species:Iterable[str], *, o
     from libICEpost.Database.chemistry.thermo.Thermo.janaf7 import janaf7_db, janaf7
     from libICEpost.Database.chemistry.specie.Molecules import Molecules
     
-    # Find the atoms
+    # Find the atoms (kept sorted by name)
     atoms:list[str] = []
     for s in species_list:
         specie = Molecules[s]
         for a in specie:
-            if not a.atom.name in atoms:
-                atoms.append(a.atom.name)
+            ii = bisect_left(atoms, a.atom.name)
+            if (ii == len(atoms)) or (atoms[ii] != a.atom.name):
+                atoms.insert(ii, a.atom.name)
     
     output = {}
     output["phases"] = \
@@ -13,21 +13,42 @@ Last update:        12/06/2023
 
 from __future__ import annotations
 
+import numpy as np
+
 from libICEpost.src.base.Utilities import Utilities
 from libICEpost.src.base.Functions.runtimeWarning import runtimeWarning
 
+#############################################################################
+#                               FUNCTIONS                                   #
+#############################################################################
+_Molecule:type|None = None
+"""The Molecule class (bound at first use)."""
+
+def _moleculeClass() -> type[Molecule]:
+    """
+    Get the Molecule class, imported at first use: Molecule depends on Atom, and loading it 
+    loads the database of molecules, which depends on the periodic table of atoms.
+    """
+    global _Molecule
+    if _Molecule is None:
+        from .Molecule import Molecule as _Molecule
+    return _Molecule
+
 #############################################################################
 #                               MAIN CLASSES                                #
 #############################################################################
 #Atomic specie:
 class Atom(Utilities):
     """
-    Class handling an atomic specie.
+    Class handling an atomic specie. Atoms are immutable values: constructing an atom 
+    with the name and mass of an existing one returns the same instance.
 
     Attributes:
         name (str): Name of the atomic specie.
         mass (float): Atomic mass.
     """
+    #Immutable with only two attributes: no instance dictionary
+    __slots__ = ("_name", "_mass")
     
     _name:str
     """The name of the atomic specie."""
@@ -35,6 +56,9 @@ class Atom(Utilities):
     _mass:float
     """The atomic mass of the atomic specie [g/mol]."""
     
+    __pool:dict[tuple[type,str,float],Atom] = dict()
+    """The atomic species constructed, by (class, name, mass)."""
+    
     
     #############################################################################
     #Properties:
@@ -60,6 +84,17 @@ class Atom(Utilities):
     
     #############################################################################
     #Constructor:
+    def __new__(cls, name:str=None, mass:float=None):
+        """
+        Get the atomic specie with given name and mass from the pool, if already 
+        constructed, otherwise allocate a new instance.
+        """
+        #Wrong types are not looked-up (raised by __init__)
+        atom = None
+        if isinstance(name, str) and isinstance(mass, (float, int, np.integer)):
+            atom = Atom.__pool.get((cls, name, float(mass)))
+        return super().__new__(cls) if atom is None else atom
+    
     def __init__(self, name, mass):
         """
         Initialize an Atom instance.
@@ -68,12 +103,39 @@ class Atom(Utilities):
             name (str): Name of the element.
             mass (float): Atomic mass.
         """
+        #Already initialized (found in the pool)
+        if hasattr(self, "_name"):
+            return
+        
         #Check arguments:
         Utilities.checkType(name, str, entryName="name")
         Utilities.checkType(mass, float, entryName="mass")
         
         self._name = name
-        self._mass = mass
+        self._mass = float(mass)
+        
+        #Store in the pool
+        Atom.__pool[self.__class__, name, self._mass] = self
+    
+    ##############################
+    #Copy and pickling: the instance in the pool
+    def __copy__(self) -> Atom:
+        """
+        Atoms are immutable: the copy is the same instance.
+        """
+        return self
+    
+    def __deepcopy__(self, memo:dict) -> Atom:
+        """
+        Atoms are immutable: the copy is the same instance.
+        """
+        return self
+    
+    def __reduce__(self) -> tuple:
+        """
+        Pickle through the constructor, so that unpickling returns the instance in the pool.
+        """
+        return (self.__class__, (self._name, self._mass))
         
     #############################################################################
     #Operators:
@@ -82,33 +144,29 @@ class Atom(Utilities):
     #Equality:
     def __eq__(self, otherSpecie):
         """
-        Determine if two species are equal by comparing all their attributes.
+        Determine if two species are equal by comparing their name and atomic mass.
 
         Args:
             otherSpecie (Atom): The other species to compare with.
 
         Returns:
-            bool: True if all attributes of both species are equal, False otherwise.
+            bool: True if name and mass of both species are equal, False otherwise.
 
         Raises:
             TypeError: If the other object is not of the same class.
         """
         if isinstance(otherSpecie, self.__class__):
-            for field in set(self.__dict__.keys()).union(otherSpecie.__dict__.keys()):  # Union of the keys of the two dictionaries
-                if self.__dict__.get(field) != otherSpecie.__dict__.get(field):
-                    return False
-            return True
+            return (self is otherSpecie) or ((self._name == otherSpecie._name) and (self._mass == otherSpecie._mass))
         else:
             raise TypeError("Cannot compare elements of type '{}' and '{}'.".format(otherSpecie.__class__.__name__, self.__class__.__name__))
-            return False
     
     ##############################
     #Hashing:
     def __hash__(self):
         """
-        Hashing of the representation.
+        Hashing of the name and atomic mass (consistent with __eq__).
         """
-        return hash(self.__repr__()) 
+        return hash((self._name, self._mass))
     
     ##############################
     #Disequality:
@@ -202,36 +260,25 @@ class Atom(Utilities):
         Raises:
             TypeError: If two atomic species with the same name but different properties are added.
         """
-        from .Molecule import Molecule
-        
-        #Argument checking:
-        Utilities.checkType(otherSpecie, [Atom, Molecule], entryName="otherSpecie")
+        Molecule = _moleculeClass()
         
+        #Argument checking (isinstance, cheaper than checkType on this hot path):
         if isinstance(otherSpecie, Atom):
-            atomicSpecie = [self]
-            numberOfAtoms = [1]
-            
-            #If same specie, increase number of atoms
-            if (self == otherSpecie):
-                numberOfAtoms[0] += 1
-            
             #Check if the two atoms have different properties
-            elif (self.name == otherSpecie.name):
+            if (self.name == otherSpecie.name) and not (self == otherSpecie):
                 raise ValueError("Cannot add two atomic specie with same name but different properties.")
             
-            #Add the other specie
-            else:
-                atomicSpecie.append(otherSpecie)
-                numberOfAtoms.append(1)
-            
-            #Create specie from atoms and initialize name from brute formula
-            returnSpecie = Molecule("", atomicSpecie, numberOfAtoms)
+            #Create specie from atoms (merged if the same specie) and initialize name from brute formula
+            returnSpecie = Molecule._fromAtoms("", [self, otherSpecie], [1, 1])
             returnSpecie.name = returnSpecie.bruteFormula()
             
-        else:
+        elif isinstance(otherSpecie, Molecule):
             #Use the Molecule class to handle the addition
             returnSpecie = otherSpecie + self
         
+        else:
+            raise TypeError(f"Wrong type for entry 'otherSpecie': 'Atom' or 'Molecule' expected but '{otherSpecie.__class__.__name__}' was found.")
+        
         return returnSpecie
     
     ##############################
@@ -244,13 +291,11 @@ class Atom(Utilities):
         Returns:
             Molecule: A new Molecule instance created by multiplying the Atom instance by the given number.
         """
+        #Argument checking (isinstance, cheaper than checkType on this hot path; int accepted as float):
+        if not isinstance(num, (float, int, np.integer)):
+            raise TypeError(f"Wrong type for entry 'num': 'float' expected but '{num.__class__.__name__}' was found.")
         
-        from .Molecule import Molecule
-        
-        #Argument checking:
-        Utilities.checkType(num, float, entryName="num")
-        
-        returnSpecie = Molecule("",[self.copy()], [num])
+        returnSpecie = _moleculeClass()._fromAtoms("",[self], [num])
         returnSpecie.name = returnSpecie.bruteFormula()
         
         return returnSpecie
@@ -22,6 +22,7 @@ from enum import Enum
 
 import numpy as np
 import math
+import itertools
 from .Atom import Atom
 from .Molecule import Molecule
 
@@ -35,6 +36,9 @@ class _fracType(Enum):
     mass = "mass"
     mole = "mole"
 
+_versions = itertools.count()
+"""Source of the versions of the mixture compositions (unique among all mixtures)."""
+
 #############################################################################
 #                               MAIN CLASSES                                #
 #############################################################################
@@ -70,6 +74,12 @@ class Mixture(Utilities):
     """The mass fractions of the specie in the mixture."""
     _species:list[Molecule]
     """The species in the mixture."""
+    _MM:float|None
+    """The cached average molecular mass of the mixture (None if to be recomputed)."""
+    _index:dict[str,int]|None
+    """The cached position of the species in the mixture by name (None if to be rebuilt)."""
+    _version:int
+    """Version of the composition, changed at each modification (two mixtures with the same version have the same composition)."""
     
     #########################################################################
     @property
@@ -86,7 +96,7 @@ class Mixture(Utilities):
         """
         The mass fractions.
         """
-        return [np.round(y, Mixture._decimalPlaces) for y in self._Y]
+        return np.round(self._Y, Mixture._decimalPlaces).tolist()
     
     #################################
     @Y.setter
@@ -103,7 +113,7 @@ class Mixture(Utilities):
         """
         The mole fractions.
         """
-        return [np.round(x, Mixture._decimalPlaces) for x in self._X]
+        return np.round(self._X, Mixture._decimalPlaces).tolist()
     
     #################################
     @X.setter
@@ -138,6 +148,16 @@ class Mixture(Utilities):
         """
         return [s.MM for s in self._species]
     
+    #################################
+    @property
+    def compositionKey(self) -> tuple[tuple[str,float],...]:
+        """
+        Hashable key of the mixture composition: the sorted (name, mass fraction) pairs,
+        consistent with the equality operator. Used to cache quantities depending only 
+        on the composition.
+        """
+        return tuple(sorted(zip(self.specieNames, self.Y)))
+    
     #########################################################################
     @classmethod
     def empty(cls):
@@ -160,6 +180,9 @@ class Mixture(Utilities):
         self._species = []
         self._Y = []
         self._X = []
+        self._MM = None
+        self._index = None
+        self._version = next(_versions)
         self.update(species=specieList, composition=composition, fracType=fracType)
     
     #########################################################################
@@ -168,27 +191,17 @@ class Mixture(Utilities):
     ###############################
     #Print:
     def __str__(self):
-        StrToPrint = ""
-        template = "| {:14s}| {:12s} | {:12s} | {:12s}|\n"
-        template1 = "{:.6f}"
-        
-        hLine = lambda a: (("-"*(len(a)-1)) + "\n")
+        row = "| {:14s}| {:12s} | {:12s} | {:12s}|\n".format
+        num = "{:.6f}".format
         
-        title = template.format("Mixture", "MM [g/mol]", "X [-]", "Y [-]")
+        title = row("Mixture", "MM [g/mol]", "X [-]", "Y [-]")
+        hLine = ("-"*(len(title)-1)) + "\n"
         
-        StrToPrint += hLine(title)
-        StrToPrint += title
-        StrToPrint += hLine(title)
+        parts = [hLine, title, hLine]
+        parts += [row(data.specie.name, num(data.specie.MM), num(data.X), num(data.Y)) for data in self]
+        parts += [hLine, row("tot", num(self.MM), num(self.Xsum()), num(self.Ysum())), hLine]
         
-        for data in self:
-            StrToPrint += template.format(data.specie.name, template1.format(data.specie.MM), template1.format(data.X), template1.format(data.Y))
-        
-        StrToPrint += hLine(title)
-        StrToPrint += template.format("tot", template1.format(self.MM), template1.format(self.Xsum()), template1.format(self.Ysum()))
-        
-        StrToPrint += hLine(title)
-        
-        return StrToPrint
+        return "".join(parts)
     
     ##############################
     #Representation:
@@ -218,18 +231,15 @@ class Mixture(Utilities):
         Returns:
             MixtureItem: dataclass for data of specie in mixture.
         """
-        #Argument checking:
-        self.checkType(specie, (str, Molecule, int), entryName="specie")
-        
         #If str, check if a specie with that name is in the mixture
         if isinstance(specie, str):
-            if not specie in [s.name for s in self.species]:
+            index = self._specieIndex().get(specie)
+            if index is None:
                 raise ValueError("Specie {} not found in mixture composition".format(specie))
-            index = self.specieNames.index(specie)
         
         #If Molecule, check if the specie is in the mixture
         elif isinstance(specie, Molecule):
-            index = self.species.index(specie)
+            index = self._moleculeIndex(specie)
         
         #If int, check if the index is in the range
         elif isinstance(specie, int):
@@ -237,6 +247,9 @@ class Mixture(Utilities):
                 raise ValueError("Index {} out of range".format(specie))
             index = specie
         
+        else:
+            raise TypeError(f"Wrong type for entry 'specie': 'str', 'Molecule' or 'int' expected but '{specie.__class__.__name__}' was found.")
+        
         #Return the data as a dataclass
         data = MixtureItem(specie=self.species[index], X=self.X[index], Y=self.Y[index])
         return data
@@ -253,18 +266,15 @@ class Mixture(Utilities):
                 - If Molecule: checking for specie
                 - If int:  checing for entry following the order
         """
-        #Argument checking:
-        self.checkType(specie, [str, Molecule, int], entryName="specie")
-        
         #If str, check if a specie with that name is in the mixture
         if isinstance(specie, str):
-            if not specie in [s.name for s in self.species]:
+            index = self._specieIndex().get(specie)
+            if index is None:
                 raise ValueError("Specie {} not found in mixture composition".format(specie))
-            index = [s.name for s in self.species].index(specie)
         
         #If Molecule, check if the specie is in the mixture
         elif isinstance(specie, Molecule):
-            index = self.species.index(specie)
+            index = self._moleculeIndex(specie)
         
         #If int, check if the index is in the range
         elif isinstance(specie, int):
@@ -272,9 +282,13 @@ class Mixture(Utilities):
                 raise ValueError("Index {} out of range".format(specie))
             index = specie
         
+        else:
+            raise TypeError(f"Wrong type for entry 'specie': 'str', 'Molecule' or 'int' expected but '{specie.__class__.__name__}' was found.")
+        
         #Delete item:
         x = self._X[index]
         del self._species[index]
+        self._index = None
         del self._X[index]
         del self._Y[index]
         
@@ -309,13 +323,16 @@ class Mixture(Utilities):
         Returns:
             bool: True if the molecule is in the mixture, False otherwise.
         """
-        #Argument checking:
-        self.checkType(entry, [str, Molecule], "entry")
-        
-        if isinstance(entry, Molecule):
-            return (entry in self.species)
+        if isinstance(entry, str):
+            return (entry in self._specieIndex())
+        elif isinstance(entry, Molecule):
+            index = self._specieIndex().get(entry.name)
+            if index is None:
+                return False
+            #Same name but different molecule (or duplicate names): fall back to linear search
+            return (self._species[index] == entry) or (entry in self._species)
         else:
-            return (entry in [s.name for s in self.species])
+            raise TypeError(f"Wrong type for entry 'entry': 'str' or 'Molecule' expected but '{entry.__class__.__name__}' was found.")
     
     ###############################
     def __index__(self, entry:Molecule|str) -> int:
@@ -327,17 +344,22 @@ class Mixture(Utilities):
                 - If Molecule: checking for specie
                 - If str: checking for molecule matching the name
         """
-        self.checkType(entry, (Molecule,str), "entry")
-        if not entry in self:
-            raise ValueError("Molecule {} not found in mixture".format(entry.name if isinstance(entry, Molecule) else entry))
+        #If str, return the index of the specie with that name
+        if isinstance(entry, str):
+            index = self._specieIndex().get(entry)
+            if index is None:
+                raise ValueError("Molecule {} not found in mixture".format(entry))
+            return index
         
         #If Molecule, return the index of the specie in the mixture
-        if isinstance(entry, Molecule):
-            return self.species.index(entry)
+        elif isinstance(entry, Molecule):
+            try:
+                return self._moleculeIndex(entry)
+            except ValueError:
+                raise ValueError("Molecule {} not found in mixture".format(entry.name)) from None
         
-        #If str, return the index of the specie with that name
         else:
-            return self.specieNames.index(entry)
+            raise TypeError(f"Wrong type for entry 'entry': 'Molecule' or 'str' expected but '{entry.__class__.__name__}' was found.")
     
     ###############################
     #Alias for __index__:
@@ -356,6 +378,8 @@ class Mixture(Utilities):
         Check if two mixtures are equal, so if they have the same species and the same composition.
         """
         self.checkType(mix, Mixture, "mix")
+        if mix is self:
+            return True
         specieList1 = sorted([s for s in self],key=(lambda x: x.specie))
         specieList2 = sorted([s for s in mix],key=(lambda x: x.specie))
 
@@ -379,13 +403,68 @@ class Mixture(Utilities):
     #########################################################################
     #Member functions:
     
+    #Look-up of species:
+    def _specieIndex(self) -> dict[str,int]:
+        """
+        The position of the species in the mixture by name (cached until the species change).
+        """
+        if self._index is None:
+            index = {}
+            for ii, s in enumerate(self._species):
+                index.setdefault(s.name, ii) #First occurrence, as list.index
+            self._index = index
+        return self._index
+    
+    def _moleculeIndex(self, molecule:Molecule) -> int:
+        """
+        The position of a molecule in the mixture.
+        
+        Raises:
+            ValueError: If the molecule is not in the mixture
+        """
+        index = self._specieIndex().get(molecule.name)
+        if (index is not None) and (self._species[index] == molecule):
+            return index
+        #Same name but different molecule (or duplicate names): fall back to linear search
+        return self._species.index(molecule)
+    
+    
     #Overwrite the copy method:
     def copy(self) -> Mixture:
         """
         Return a copy of the mixture.
         """
-        #Since molecules are immutable, we can just copy the list
-        return Mixture(self.species, self.Y, "mass")
+        #Since molecules are immutable, we can just copy the lists 
+        #(the composition is already consistent, skip validation)
+        out = self.__class__.__new__(self.__class__)
+        out._species = self._species[:]
+        out._Y = self._Y[:]
+        out._X = self._X[:]
+        out._MM = self._MM
+        out._index = self._index #Never modified in place (only rebuilt)
+        out._version = self._version
+        return out
+    
+    ###############################
+    def assign(self, mix:Mixture) -> Self:
+        """
+        Set the composition of this mixture equal to that of another mixture 
+        (in-place, without validating the composition, which is already consistent).
+
+        Args:
+            mix (Mixture): The mixture to copy the composition from.
+            
+        Returns:
+            Self: self
+        """
+        self.checkType(mix, Mixture, "mix")
+        self._species = list(mix._species)
+        self._Y = list(mix._Y)
+        self._X = list(mix._X)
+        self._MM = mix._MM
+        self._index = mix._index #Never modified in place (only rebuilt)
+        self._version = mix._version
+        return self
     
     ###############################
     #Update the composition with a new one
@@ -423,6 +502,7 @@ class Mixture(Utilities):
         
         #Initialize data:
         self._species = [s for s in species]
+        self._index = None
         
         #Store data:
         if (fracType == _fracType.mass):
@@ -440,12 +520,14 @@ class Mixture(Utilities):
         """
         Update mole fractions of the specie from mass fractions.
         """
+        self._MM = None
+        self._version = next(_versions)
+        #Work on the parallel lists of fractions and molecular masses
+        nMoles = [y / MM for y, MM in zip(self.Y, self.specieWeights)]
         aux = 0.0
-        for speci in self:
-            aux += speci.Y / speci.specie.MM
-            
-        for ii, speci in enumerate(self):
-            self._X[ii] = (speci.Y / speci.specie.MM) / aux
+        for n in nMoles:
+            aux += n
+        self._X = [n / aux for n in nMoles]
     
     ###############################
     #Compute Mass fractions:
@@ -453,12 +535,14 @@ class Mixture(Utilities):
         """
         Update mass fractions of the specie from mole fractions.
         """
+        self._MM = None
+        self._version = next(_versions)
+        #Work on the parallel lists of fractions and molecular masses
+        masses = [x * MM for x, MM in zip(self.X, self.specieWeights)]
         aux = 0.0
-        for speci in self:
-            aux += speci.X * speci.specie.MM
-        
-        for ii, speci in enumerate(self):
-            self._Y[ii] = (speci.X * speci.specie.MM) / aux
+        for m in masses:
+            aux += m
+        self._Y = [m / aux for m in masses]
             
     ###############################
     #Compute MMmix:
@@ -467,10 +551,13 @@ class Mixture(Utilities):
         """
         Return the average molecular mass of the mixture [g/mol].
         """
-        MMmixture = 0.0
-        for specj in self:
-            MMmixture += specj.X * specj.specie.MM
-        return MMmixture
+        #Cached until the composition changes
+        if self._MM is None:
+            MMmixture = 0.0
+            for x, MM in zip(self.X, self.specieWeights):
+                MMmixture += x * MM
+            self._MM = MMmixture
+        return self._MM
     
     ###############################
     #Return the sum of mass fractions of species:
@@ -512,6 +599,10 @@ class Mixture(Utilities):
         if (dilutionFract < 0.0 or dilutionFract > 1.0):
             raise ValueError(f"DilutionFract must be in range [0,1] ({dilutionFract} was found).")
         
+        #Composition is going to change
+        self._MM = None
+        self._version = next(_versions)
+        
         #Cast molecule to mixture
         if isinstance(dilutingMix, Molecule):
             dilutingMix = Mixture([dilutingMix], [1.0])
@@ -525,12 +616,14 @@ class Mixture(Utilities):
             self._X = dilutingMix.X[:]
             self._Y = dilutingMix.Y[:]
             self._species = [s for s in dilutingMix.species]
+            self._index = None
         
         #If dilution fraction is too low, add the new species with zero X and Y
         if dilutionFract < 10.**(-1.*self._decimalPlaces):
             for s in dilutingMix:
-                if not s.specie in self.species:
+                if not s.specie in self:
                     self._species.append(s.specie)
+                    self._index = None
                     self._X.append(0.0)
                     self._Y.append(0.0)
             return self
@@ -541,6 +634,7 @@ class Mixture(Utilities):
             if not(speci.specie in self):
                 #Add the new specie
                 self._species.append(speci.specie)
+                self._index = None
                 if (fracType == _fracType.mass):
                     self._Y.append(speci.Y * dilutionFract)
                     self._X.append(float('nan'))
@@ -550,15 +644,16 @@ class Mixture(Utilities):
             else:
                 #Dilute the already present specie
                 index = self.index(speci.specie)
+                #NOTE: round only the entry needed (as in self.Y/self.X), not the whole list
                 if (fracType ==  _fracType.mass):
-                    self._Y[index] = (self.Y[index] * (1.0 - dilutionFract)) + (speci.Y * dilutionFract)
+                    self._Y[index] = (np.round(self._Y[index], self._decimalPlaces) * (1.0 - dilutionFract)) + (speci.Y * dilutionFract)
                 elif (fracType ==  _fracType.mole):
-                    self._X[index] = (self.X[index] * (1.0 - dilutionFract)) + (speci.X * dilutionFract)
+                    self._X[index] = (np.round(self._X[index], self._decimalPlaces) * (1.0 - dilutionFract)) + (speci.X * dilutionFract)
         
-        #Update mass/mole fractions of other specie:
-        for speci in self:
-            if not(speci.specie in dilutingMix):
-                index = self.index(speci.specie)
+        #Update mass/mole fractions of other specie (iterating over the stored species, 
+        #so that the position is known without looking it up):
+        for index, specie in enumerate(self._species):
+            if not(specie in dilutingMix):
                 if (fracType ==  _fracType.mass):
                     self._Y[index] *= (1.0 - dilutionFract)
                 elif (fracType ==  _fracType.mole):
@@ -760,23 +855,32 @@ def mixtureBlend(mixtures:Iterable[Mixture], composition:Iterable[float], fracTy
     if not((min(composition) >= 0.0) and (max(composition) <= 1.0)):
         raise ValueError(f"All {fracType} fractions must be in range [0,1] ({composition}).")
     
-    mixBlend:Mixture = None
+    #Accumulate the composition of the blend in a single pass over all the mixtures 
+    #(instead of diluting one mixture at a time) and construct the mixture once
+    fracType = _fracType(fracType)
+    species:dict[str,Molecule] = {}
+    fractions:dict[str,float] = {}
+    Yblend = 0.0 #Sum of the compositions blended
     for ii, mix in enumerate(mixtures):
         if composition[ii] <= 10.**(-1.*Mixture._decimalPlaces):
             continue
-        
-        #If first mixture, initialize as copy
-        if mixBlend is None:
-            mixBlend = mix.copy()
-            Yblen = composition[ii]
-            continue
-        
-        #Dilute the mixture 
-        Ydil = composition[ii]/(Yblen + composition[ii])
-        mixBlend.dilute(mix, Ydil, fracType)
-        Yblen += composition[ii]
-    
-    return mixBlend
+        Yblend += composition[ii]
+        
+        for specie, f in zip(mix.species, (mix.Y if (fracType == _fracType.mass) else mix.X)):
+            if not specie.name in species:
+                species[specie.name] = specie
+                fractions[specie.name] = 0.0
+            elif species[specie.name] != specie:
+                raise ValueError(f"Found different species with the same name '{specie.name}' in the mixtures to blend.")
+            fractions[specie.name] += composition[ii]*f
+    
+    #All the compositions are null
+    if Yblend == 0.0:
+        return None
+    
+    #Normalize (also accounts for empty mixtures in the blend)
+    total = sum(fractions.values())
+    return Mixture(list(species.values()), [f/total for f in fractions.values()], fracType=fracType.value)
 
 #############################################################################
 #Load database
@@ -75,6 +75,12 @@ class Molecule(Utilities):
     _numberOfAtoms:list[float]
     """The number of atoms of each specie."""
     
+    _MM:float|None
+    """The cached molecular mass (the composition is not changed after construction)."""
+    
+    _bruteFormula:str|None
+    """The cached brute formula (the composition is not changed after construction)."""
+    
     #########################################################################
     #Properties:
     @property
@@ -131,19 +137,47 @@ class Molecule(Utilities):
         if len(atomicSpecie) == 0:
             raise ValueError("Cannot create a Molecule instance without atomic species.")
         
-        #Initialization:
+        self._initialize(specieName, atomicSpecie, numberOfAtoms)
+    
+    #########################################################################
+    @classmethod
+    def _fromAtoms(cls, specieName:str, atomicSpecie:Iterable[Atom], numberOfAtoms:Iterable[float]) -> Molecule:
+        """
+        Construct without checking the arguments. Used by the operators of Atom and Molecule, 
+        which build molecules from atomic species and numbers of atoms already checked.
+        """
+        molecule = cls.__new__(cls)
+        molecule._initialize(specieName, atomicSpecie, numberOfAtoms)
+        return molecule
+    
+    #########################################################################
+    def _initialize(self, specieName:str, atomicSpecie:Iterable[Atom], numberOfAtoms:Iterable[float]) -> None:
+        """
+        Initialize the molecule from the atomic species and number of atoms (after argument checking).
+        """
         self.name = specieName
-        self._atoms = []
-        self._numberOfAtoms = []
-        
-        #Fill atoms:
-        for ii, atom in enumerate(atomicSpecie):
-            if not atom.name in self:
-                self._atoms.append(atom.copy())
-                self._numberOfAtoms.append(numberOfAtoms[ii])
+        self._MM = None
+        self._bruteFormula = None
+        
+        #Fill atoms (Atom is immutable, so it is stored by reference), merging the
+        #atomic species found more than once with a look-up of their position by name:
+        atoms:list[Atom] = []
+        numbers:list[float] = []
+        positions:dict[str,int] = dict()
+        for atom, n in zip(atomicSpecie, numberOfAtoms):
+            name = atom.name
+            index = positions.get(name)
+            if index is None:
+                positions[name] = len(atoms)
+                atoms.append(atom)
+                numbers.append(n)
+            elif atoms[index] == atom:
+                numbers[index] += n
             else:
-                index = self.index(atom)
-                self._numberOfAtoms[index] += numberOfAtoms[ii]
+                raise ValueError("Atomic specie named '{}' already present in molecule with different properties, cannot add atomic specie to molecule.".format(name))
+        
+        self._atoms = atoms
+        self._numberOfAtoms = numbers
     
     #########################################################################
     #Operators:
@@ -289,31 +323,17 @@ class Molecule(Utilities):
             ValueError: If an atomic specie with the same name but different 
             properties is already present in the Molecule.
         """
-        #Argument checking:
-        self.checkType(otherSpecie, [Molecule, Atom], entryName="otherSpecie")
-        
-        if isinstance(otherSpecie, Atom):
-            otherSpecie = Molecule(otherSpecie.name, [otherSpecie], [1])
-        
-        atoms = self.atoms
-        numberOfAtoms = self.numberOfAtoms
-        #Add atoms of second specie
-        for atom in otherSpecie:
-            #Check if already present
-            if atom.atom.name in self:
-                #Check if with different properties:
-                if not(atom.atom in self):
-                    raise ValueError("Atomic specie named '{}' already present in molecule with different properties, cannot add atomic specie to molecule.".format(atom.atom.name))
-                #Add number of atoms of second specie
-                indexSelf = self.index(atom.atom)
-                numberOfAtoms[indexSelf] += atom.n
-            else:
-                #Add new atomic specie
-                atoms.append(atom.atom.copy())
-                numberOfAtoms.append(atom.n)
+        #Argument checking (isinstance, cheaper than checkType on this hot path):
+        if isinstance(otherSpecie, Molecule):
+            atoms, numberOfAtoms = otherSpecie._atoms, otherSpecie._numberOfAtoms
+        elif isinstance(otherSpecie, Atom):
+            atoms, numberOfAtoms = [otherSpecie], [1]
+        else:
+            raise TypeError(f"Wrong type for entry 'otherSpecie': 'Molecule' or 'Atom' expected but '{otherSpecie.__class__.__name__}' was found.")
         
-        #Create the Molecule instance
-        mol = Molecule("", atoms, numberOfAtoms)
+        #Create the Molecule instance (merging the atoms of the two species and checking 
+        #that the ones with the same name have the same properties)
+        mol = Molecule._fromAtoms("", self._atoms + atoms, self._numberOfAtoms + numberOfAtoms)
         
         #Set the name of the Molecule to brute formula
         mol.name = mol.bruteFormula()
@@ -324,28 +344,16 @@ class Molecule(Utilities):
     ##############################
     #Print function:
     def __str__(self):
-        StrToPrint = ("Chemical specie: " + self.name + "\n")
-        
-        template = "| {:15s}| {:15s}   {:15s}|\n"
-        title = template.format("Atom", "m [g/mol]", "# atoms [-]")
-        
-        hLine = lambda a: (("-"*(len(a)-1)) + "\n")
-        
-        StrToPrint += hLine(title)
-        StrToPrint += title
-        StrToPrint += hLine(title)
+        row = "| {:15s}| {:15s}   {:15s}|\n".format
         
-        for atom in self:
-            StrToPrint += template.format(atom.atom.name, str(atom.atom.mass), str(atom.n))
+        title = row("Atom", "m [g/mol]", "# atoms [-]")
+        hLine = ("-"*(len(title)-1)) + "\n"
         
-        StrToPrint += hLine(title)
-        StrToPrint += template.format("tot.", str(self.MM), "")
+        parts = ["Chemical specie: " + self.name + "\n", hLine, title, hLine]
+        parts += [row(atom.atom.name, str(atom.atom.mass), str(atom.n)) for atom in self]
+        parts += [hLine, row("tot.", str(self.MM), ""), hLine, "\n"]
         
-        StrToPrint += hLine(title)
-        
-        StrToPrint += "\n"
-        
-        return StrToPrint
+        return "".join(parts)
     
     ##############################
     #Representation:
@@ -372,13 +380,12 @@ class Molecule(Utilities):
         Raises:
             TypeError: If the entry is not of type str or Atom.
         """
-        #Argument checking:
-        self.checkType(entry, [str, Atom], "entry")
-        
-        if isinstance(entry, Atom):
-            return (entry in self.atoms)
+        if isinstance(entry, str):
+            return any(a.name == entry for a in self._atoms)
+        elif isinstance(entry, Atom):
+            return (entry in self._atoms)
         else:
-            return (entry in [s.name for s in self.atoms])
+            raise TypeError(f"Wrong type for entry 'entry': 'str' or 'Atom' expected but '{entry.__class__.__name__}' was found.")
     
     ###############################
     def __index__(self, entry:Atom):
@@ -394,15 +401,18 @@ class Molecule(Utilities):
         Raises:
             ValueError: If the Atom is not found in the Molecule.
         """
-        #Argument checking:
-        self.checkType(entry, (Atom, str), "entry")
-        if not entry in self:
-            raise ValueError("Atom {} not found in molecule".format(entry.name if isinstance(entry, Atom) else entry))
-        
         if isinstance(entry, str):
-            return [a.name for a in self.atoms].index(entry)
+            for ii, a in enumerate(self._atoms):
+                if a.name == entry:
+                    return ii
+            raise ValueError("Atom {} not found in molecule".format(entry))
+        elif isinstance(entry, Atom):
+            try:
+                return self._atoms.index(entry)
+            except ValueError:
+                raise ValueError("Atom {} not found in molecule".format(entry.name)) from None
         else:
-            return self.atoms.index(entry)
+            raise TypeError(f"Wrong type for entry 'entry': 'Atom' or 'str' expected but '{entry.__class__.__name__}' was found.")
     
     ###############################
     #Alias:
@@ -433,19 +443,8 @@ class Molecule(Utilities):
             ValueError: If the atom is not found in the molecule
             IndexError: If the index is out of range.
         """
-        #Argument checking:
-        self.checkType(atom, [str, Atom, int], entryName="atom")
-        
-        #If str, check for atom name:
-        if isinstance(atom, str):
-            if not atom in [a.name for a in self.atoms]:
-                raise ValueError("Atom {} not found in molecule".format(atom))
-            index = [a.name for a in self.atoms].index(atom)
-        
-        #If Atom, check for atom:
-        elif isinstance(atom, Atom):
-            if not atom in self:
-                raise ValueError("Atom {} not found in molecule".format(atom.name))
+        #If str or Atom, look for the atom (raises ValueError if not found):
+        if isinstance(atom, (str, Atom)):
             index = self.index(atom)
         
         #If int, check for index:
@@ -453,8 +452,11 @@ class Molecule(Utilities):
             if atom < 0 or atom >= len(self):
                 raise IndexError("Index {} out of range".format(atom))
             index = atom
-                
-        data = MoleculeItem(self.atoms[index], self.numberOfAtoms[index])
+        
+        else:
+            raise TypeError(f"Wrong type for entry 'atom': 'str', 'Atom' or 'int' expected but '{atom.__class__.__name__}' was found.")
+        
+        data = MoleculeItem(self._atoms[index], self._numberOfAtoms[index])
         
         return data
     
@@ -475,7 +477,9 @@ class Molecule(Utilities):
         """
         Compute the molecular mass of the chemical specie [g/mol].
         """
-        return molecularMass(self)
+        if self._MM is None:
+            self._MM = molecularMass(self)
+        return self._MM
     
     ##############################
     #Compute the brute formula of the chemical specie:
@@ -483,17 +487,21 @@ class Molecule(Utilities):
         """
         Returns the brute formula of the specie.
         """
-        BF = ""
+        if not self._bruteFormula is None:
+            return self._bruteFormula
         
-        for atom in self:
-            if (atom.n == 1):
-                BF += atom.atom.name
-            elif atom.n == int(atom.n):
-                BF += atom.atom.name + str(int(atom.n))
+        #Loop over the atoms and numbers directly (without building a MoleculeItem for each atom)
+        BF = []
+        for atom, n in zip(self._atoms, self._numberOfAtoms):
+            if (n == 1):
+                BF.append(atom.name)
+            elif n == int(n):
+                BF.append(atom.name + str(int(n)))
             else:
-                BF += atom.atom.name + "{:.3f}".format(atom.n)
+                BF.append(atom.name + "{:.3f}".format(n))
         
-        return BF
+        self._bruteFormula = "".join(BF)
+        return self._bruteFormula
     
     ###############################
     def atomicCompositionMatrix(self):
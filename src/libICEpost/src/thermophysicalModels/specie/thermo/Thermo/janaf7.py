@@ -16,9 +16,32 @@ from typing import Iterable
 from .Thermo import Thermo
 
 from libICEpost import Dictionary
+from libICEpost.src.base.Functions.typeChecking import checkFloat
 from libICEpost.Database.chemistry.constants import database
 Tstd = database.chemistry.constants.Tstd
 
+#############################################################################
+#                             Auxiliary functions                           #
+#############################################################################
+#Polynomials of the NASA-7 coefficients in Horner form (nested multiplication)
+def _cpPoly(a:Iterable[float], T:float) -> float:
+    """
+    cp/R = sum_{i=0,4} ( a_{i} * T^i )
+    """
+    return (((a[4]*T + a[3])*T + a[2])*T + a[1])*T + a[0]
+
+def _haPoly(a:Iterable[float], T:float) -> float:
+    """
+    ha/R = sum_{i=0,4} ( a_{i}/(i + 1) * T^i )*T + a_{5}
+    """
+    return ((((a[4]/5.*T + a[3]/4.)*T + a[2]/3.)*T + a[1]/2.)*T + a[0])*T + a[5]
+
+def _dcpdTPoly(a:Iterable[float], T:float) -> float:
+    """
+    dcp/dT/R = sum_{i=1,4}(i * a_{i} * T^(i - 1))
+    """
+    return ((4.*a[4]*T + 3.*a[3])*T + 2.*a[2])*T + a[1]
+
 #############################################################################
 #                               MAIN CLASSES                                #
 #############################################################################
@@ -142,49 +165,32 @@ class janaf7(Thermo):
     ################################
     #Print:
     def __str__(self):
-        StrToPrint = Thermo.__str__(self)
-        
-        hLine = lambda a: (("-"*(len(a)-1)) + "\n")
-        
-        template1 = "| {:10s}| "
-        template2 = "{:10s}   "
-        template3 = "{:.3e}"
+        cell = "{:10s}   ".format
+        num = "{:.3e}".format
+        nCoeffs = len(self.cpLow)
         
-        title = template1.format("Coeffs")
-        for ii in range(len(self.cpLow)):
-            title += template2.format("c_" + str(ii))
-        title += "|\n"
+        #Table of coefficients
+        def coeffsRow(name:str, coeffs:Iterable[float]) -> str:
+            return "| {:10s}| ".format(name) + "".join(cell(num(coeffs[ii]) if (len(coeffs) > ii) else "") for ii in range(nCoeffs)) + "|\n"
         
-        StrToPrint += hLine(title)
-        StrToPrint += title
-        StrToPrint += hLine(title)
-        
-        StrToPrint += template1.format("High")
-        for ii in range(len(self.cpLow)):
-            if (len(self.cpHigh) > ii):
-                StrToPrint += template2.format(template3.format(self.cpHigh[ii]))
-            else:
-                StrToPrint += template2.format("")
-        StrToPrint += "|\n"
-        
-        StrToPrint += template1.format("Low")
-        for ii in range(len(self.cpLow)):
-            if (len(self.cpHigh) > ii):
-                StrToPrint += template2.format(template3.format(self.cpHigh[ii]))
-            else:
-                StrToPrint += template2.format("")
-        StrToPrint += "|\n"
-        
-        StrToPrint += hLine(title)
+        title = "| {:10s}| ".format("Coeffs") + "".join(cell("c_" + str(ii)) for ii in range(nCoeffs)) + "|\n"
+        hLine = ("-"*(len(title)-1)) + "\n"
         
+        #Table of temperatures (fixed width)
         template = "| {:10} | {:10} | {:10}|\n"
-        StrToPrint += hLine(template.format("","",""))
-        StrToPrint += template.format("Tlow", "Thigh", "Tth")
-        StrToPrint += hLine(template.format("","",""))
-        StrToPrint += template.format(self.Tlow, self.Thigh, self.Tth)
-        StrToPrint += hLine(template.format("","",""))
+        tLine = ("-"*(len(template.format("","",""))-1)) + "\n"
         
-        return StrToPrint
+        return "".join(
+            [
+                Thermo.__str__(self),
+                hLine, title, hLine,
+                coeffsRow("High", self.cpHigh),
+                coeffsRow("Low", self.cpLow),
+                hLine,
+                tLine, template.format("Tlow", "Thigh", "Tth"),
+                tLine, template.format(self.Tlow, self.Thigh, self.Tth),
+                tLine
+            ])
     
     ##############################
     #Representation:
@@ -231,10 +237,10 @@ class janaf7(Thermo):
         cp(T) = sum_{i=0,4} ( a_{i} * T^i )
         """
         #Argument checking
-        super().cp(p,T)
+        checkFloat(p, "p")
+        checkFloat(T, "T")
         
-        coeffs = self.coeffs(T)
-        return sum(coeffs[nn] * (T ** nn) for nn in [0, 1, 2, 3, 4])*self.Rgas
+        return _cpPoly(self.coeffs(T), T)*self.Rgas
     
     ################################
     def ha(self, p:float, T:float) -> float:
@@ -247,14 +253,25 @@ class janaf7(Thermo):
         ha(T) = sum_{i=0,4} ( a_{i}/(i + 1) * T^i )*T + a_{5}
         """
         #Argument checking
-        try:
-            super().ha(p,T)
-        except NotImplementedError:
-            #Passed the check of p and T
-            pass
+        checkFloat(p, "p")
+        checkFloat(T, "T")
+        
+        return _haPoly(self.coeffs(T), T)*self.Rgas
+    
+    ################################
+    def hs(self, p:float, T:float) -> float:
+        """
+        Sensible enthalpy [J/kg]
+        If the temperature is not within Tlow and Thigh, a
+        warning is displayed.
+        
+        hs = ha - hf
+        """
+        #Argument checking
+        checkFloat(p, "p")
+        checkFloat(T, "T")
         
-        coeffs= self.coeffs(T)
-        return (coeffs[5] + sum(coeffs[nn] * (T ** (nn + 1)) / (nn + 1.0) for nn in [0, 1, 2, 3, 4]))*self.Rgas
+        return _haPoly(self.coeffs(T), T)*self.Rgas - _haPoly(self.coeffs(Tstd), Tstd)*self.Rgas
     
     ##################################
     def hf(self) -> float:
@@ -275,10 +292,10 @@ class janaf7(Thermo):
         dcp/dT(T) = sum_{i=1,4}(i * a_{i} * T^(i - 1))
         """
         #Check arguments
-        super().dcpdT(p,T)
+        checkFloat(p, "p")
+        checkFloat(T, "T")
         
-        coeffs = self.coeffs(T)
-        return sum(nn * coeffs[nn] * (T ** (nn - 1)) for nn in [1, 2, 3, 4])*self.Rgas
+        return _dcpdTPoly(self.coeffs(T), T)*self.Rgas
     
     #########################################################################
     @classmethod
@@ -38,6 +38,8 @@ class CombustionModel(BaseClass):
             The thermodynamic mixture of air
         
     """
+    __slots__ = ("_freshMixture", "_combustionProducts", "_mixture", "_reactionModel")
+    
     _freshMixture:Mixture
     """The mixture of reactants"""
     
@@ -99,6 +101,20 @@ class CombustionModel(BaseClass):
         
     #########################################################################
     #Class methods and static methods:
+    @staticmethod
+    def _makeState(state:ThermoState|dict|None) -> ThermoState|None:
+        """
+        Cast the state to ThermoState if given as a dictionary (None and ThermoState are returned as they are).
+        
+        Args:
+            state (ThermoState|dict|None): The state.
+        
+        Returns:
+            ThermoState|None: The state.
+        """
+        if (state is None) or isinstance(state, ThermoState):
+            return state
+        return ThermoState.fromDictionary(state)
     
     #########################################################################
     #Constructor
@@ -114,7 +130,7 @@ class CombustionModel(BaseClass):
         Args:
             reactants (Mixture): Air
             reactionModel (str, optional): Model handling reactions. defaults to "Stoichiometry".
-            state (ThermoState, optional): Giving current state to manage state-dependend 
+            state (ThermoState|dict, optional): Giving current state to manage state-dependend 
                 reaction models (e.g. equilibrium). Defaults to empty state ThermoState().
         """
 
@@ -124,15 +140,18 @@ class CombustionModel(BaseClass):
         self.checkType(state, [ThermoState, dict], "state")
         
         kwargs = Dictionary(**kwargs)
+        state = self._makeState(state)
         
         #To be updated by specific combustion model
         self._mixture = reactants.copy()
         self._freshMixture = reactants.copy()
         self._combustionProducts = reactants.copy()
         
+        #Reaction model: the reactants and state are explicitly wired into a shallow 
+        #copy of its dictionary (the input dictionary is not modified)
         self._reactionModel = ReactionModel.selector(
             reactionModel, 
-            kwargs.lookupOrDefault(reactionModel + "Dict", Dictionary()).update(reactants=self._freshMixture, state=state)
+            {**kwargs.lookupOrDefault(reactionModel + "Dict", Dictionary()), "reactants":self._freshMixture, "state":state}
             )
         
         #In child classes need to initialize the state (fresh mixture, combustion products, etc.)
@@ -142,30 +161,46 @@ class CombustionModel(BaseClass):
     
     #########################################################################
     #Methods:
+    def _updateReactants(self, reactants:Mixture|None) -> bool:
+        """
+        Update the fresh mixture composition.
+        
+        Args:
+            reactants (Mixture|None): The reactants composition (None for no update).
+            
+        Returns:
+            bool: if the fresh mixture changed
+        """
+        if reactants is None:
+            return False
+        
+        #Lightweight type checking (hot path)
+        if not isinstance(reactants, Mixture):
+            raise TypeError(f"Wrong type for entry 'reactants': 'Mixture' expected but '{reactants.__class__.__name__}' was found.")
+        if self._freshMixture != reactants:
+            self._freshMixture.assign(reactants)
+            return True
+        return False
+    
+    #########################################################################
     @abstractmethod
-    def update(self, *, reactants:Mixture=None, state:ThermoState=None, **kwargs) -> bool:
+    def update(self, *, reactants:Mixture=None, state:ThermoState|dict=None, **kwargs) -> bool:
         """
         Update the state of the system. To be overwritten in child classes.
         
         Args:
             reactants (Mixture, optional): update reactants composition. Defaults to None.
-            state (ThermoState, optional): the state variables of the system (needed to 
+            state (ThermoState|dict, optional): the state variables of the system (needed to 
                 update the combustion model - e.g. equilibrium)
                 
         Returns:
             bool: if something changed
         """
-        update = False
-        
         #Update reactants
-        if not reactants is None:
-            self.checkType(reactants, Mixture, "reactants")
-            if self._freshMixture != reactants:
-                self._freshMixture.update(reactants.species, reactants.Y, fracType="mass")
-                update = True
-        
-        #Update the reaction model
-        update = update or self._reactionModel.update(state=state, reactants=reactants)
+        update = self._updateReactants(reactants)
+        
+        #Update the reaction model (only once, passing the reactants only if changed)
+        update = self._reactionModel.update(state=self._makeState(state), reactants=(self._freshMixture if update else None)) or update
             
         return update
     
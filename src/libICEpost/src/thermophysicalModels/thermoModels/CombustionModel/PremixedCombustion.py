@@ -13,16 +13,42 @@ Last update:        DD/MM/YYYY
 
 from __future__ import annotations
 
+import numpy as np
+
 #load the base class
 from .CombustionModel import CombustionModel
 
 #Other imports
 from libICEpost.src.thermophysicalModels.specie.specie.Mixture import Mixture
+from libICEpost.src.thermophysicalModels.specie.specie.Molecule import Molecule
 from libICEpost.src.thermophysicalModels.specie.reactions.functions import computeAlphaSt, computeAlpha
 from libICEpost.src.base.dataStructures.Dictionary import Dictionary
 
 from ..ThermoState import ThermoState
 
+#############################################################################
+#                             Auxiliary functions                           #
+#############################################################################
+try:
+    #Compiled kernel if numba is available
+    from numba import njit
+    
+    @njit(cache=True)
+    def _blendMixture(Yfresh:np.ndarray, Yprod:np.ndarray, xb:float, out:np.ndarray) -> None:
+        """
+        Blend fresh mixture and combustion products mass fractions based on the progress variable (in-place on out).
+        """
+        for ii in range(Yfresh.size):
+            out[ii] = (1.0 - xb)*Yfresh[ii] + xb*Yprod[ii]
+
+except ImportError:
+    def _blendMixture(Yfresh:np.ndarray, Yprod:np.ndarray, xb:float, out:np.ndarray) -> None:
+        """
+        Blend fresh mixture and combustion products mass fractions based on the progress variable (in-place on out).
+        """
+        np.multiply(Yfresh, 1.0 - xb, out=out)
+        out += xb*Yprod
+
 #############################################################################
 #                               MAIN CLASSES                                #
 #############################################################################
@@ -34,7 +60,24 @@ class PremixedCombustion(CombustionModel):
     
     Attributes:
     """
+    __slots__ = ("_xb", "_species", "_speciesIndex", "_Y")
+    
     _xb:float
+    """The burned mass fraction"""
+    
+    _species:list[Molecule]
+    """Union of the species in the fresh mixture and in the combustion products"""
+    
+    _speciesIndex:dict[Molecule,int]
+    """Position of each specie in _species"""
+    
+    _Y:np.ndarray
+    """Mass fractions over _species (rows: fresh mixture, combustion products, current mixture)"""
+    
+    #Rows of _Y
+    _FRESH = 0
+    _PROD = 1
+    _MIX = 2
     
     #########################################################################
     #Properties:
@@ -84,7 +127,12 @@ class PremixedCombustion(CombustionModel):
         #Initialize base class
         super().__init__(**kwargs)
         
-        #Initialize unburnt mixture
+        #Initialize combustion products and unburnt mixture
+        self._species = []
+        self._speciesIndex = {}
+        self._Y = np.zeros((3,0))
+        self._updateProducts()
+        self._packMixtures()
         self._xb = -1   #Enforce first update
         self.update(xb=xb)
     
@@ -93,39 +141,109 @@ class PremixedCombustion(CombustionModel):
     
     #########################################################################
     #Methods:
-    def update(self, xb:float=None, *args, **kwargs) -> bool:
+    def _packMixtures(self, *, fresh:bool=True, products:bool=True) -> None:
+        """
+        Store the compositions of the fresh mixture and of the combustion products 
+        as rows of a single array over the union of their species. To be called
+        only when any of the two changed, so that updates of the progress variable 
+        alone reduce to the blending of the two rows (see _updateMixture).
+        
+        Args:
+            fresh (bool, optional): If the fresh mixture changed. Defaults to True.
+            products (bool, optional): If the combustion products changed. Defaults to True.
+        """
+        freshMix = self._freshMixture
+        prod = self._combustionProducts
+        
+        #Union of the species (fresh mixture first, then combustion products)
+        species = freshMix.species
+        index = {s:ii for ii,s in enumerate(species)}
+        for s in prod.species:
+            if not s in index:
+                index[s] = len(species)
+                species.append(s)
+        
+        #Reallocate only if the species changed (then all rows need to be stored)
+        if species != self._species:
+            self._species = species
+            self._speciesIndex = index
+            self._Y = np.zeros((3, len(species)))
+            fresh = products = True
+        
+        #Store the compositions that changed
+        Y = self._Y
+        if fresh:
+            Y[self._FRESH,len(freshMix):] = 0.0
+            Y[self._FRESH,:len(freshMix)] = freshMix.Y
+        if products:
+            Y[self._PROD,:] = 0.0
+            Y[self._PROD,[self._speciesIndex[s] for s in prod.species]] = prod.Y
+    
+    #########################################################################
+    def _updateMixture(self) -> None:
+        """
+        Update the current mixture blending the fresh mixture and the combustion 
+        products based on the progress variable. The mass fractions are stored 
+        as rows of a single array over the union of the species, so that the 
+        blending reduces to a vector operation.
+        """
+        Y = self._Y
+        _blendMixture(Y[self._FRESH], Y[self._PROD], float(self._xb), Y[self._MIX])
+        self._mixture.update(self._species, Y[self._MIX].tolist(), fracType="mass")
+    
+    #########################################################################
+    def _updateProducts(self) -> None:
+        """
+        Update the combustion products from the reaction model.
+        """
+        self._combustionProducts.assign(self._reactionModel.products)
+    
+    #########################################################################
+    def update(self, xb:float=None, *, reactants:Mixture=None, state:ThermoState|dict=None, **kwargs) -> bool:
         """
         Update mixture composition based on progress variable, fuel, and reactants composition.
         
         Args:
             xb (float, None): the burned mass fraction. Defaults to None (no update).
             reactants (Mixture, optional): update reactants composition. Defaults to None.
-            state (ThermoState, optional): Giving current state to manage state-dependend 
+            state (ThermoState|dict, optional): Giving current state to manage state-dependend 
                 reaction models(e.g. equilibrium). Defaults to None.
 
         Returns:
             bool: if something changed
         """
-        update = False
+        xbChanged = False
         
         #Xb
         if not xb is None:
+            #Lightweight type checking (hot path)
+            if not isinstance(xb, (float, int, np.floating, np.integer)):
+                raise TypeError(f"Wrong type for entry 'xb': 'float' expected but '{xb.__class__.__name__}' was found.")
+            #Clamp between 0 and 1 (before comparing, so that out-of-range values do not trigger updates)
+            xb = 0.0 if xb < 0.0 else (1.0 if xb > 1.0 else xb)
             if xb != self._xb:
-                self._xb = min(max(xb, 0.), 1.) #Clamp between 0 and 1
-                update = True
-            
-        #Update the state and air composition
-        update = update or super().update(*args, **kwargs)
+                self._xb = xb
+                xbChanged = True
+        
+        #Update the reactants composition (always applied, independently of xb)
+        freshChanged = self._updateReactants(reactants)
         
+        #Update the reaction model (passing the reactants only if changed)
+        productsChanged = self._reactionModel.update(state=self._makeState(state), reactants=(self._freshMixture if freshChanged else None))
+        
+        #Update combustion products only if the reaction model changed
+        if productsChanged:
+            self._updateProducts()
+        
+        #Store only the compositions that changed (e.g., state-only updates of 
+        #state-dependent reaction models do not affect the fresh mixture)
+        if freshChanged or productsChanged:
+            self._packMixtures(fresh=freshChanged, products=productsChanged)
+        
+        #Update current state based on combustion progress variable
+        update = xbChanged or freshChanged or productsChanged
         if update:
-            #Update combustion products
-            prod = self._reactionModel.products
-            self._combustionProducts.update(prod.species, prod.Y, fracType="mass")
-            
-            #Update current state based on combustion progress variable
-            newMix = self.freshMixture.copy()
-            newMix.dilute(self.combustionProducts, self._xb, "mass")
-            self._mixture.update(newMix.species, newMix.Y, fracType="mass")
+            self._updateMixture()
             
         return update
 
@@ -56,8 +56,10 @@ class StateInitializer(BaseClass):
             thermoStateClass (str, optional): The specific ThermoState class to construct. Defaults to "ThermoState".
         """
         #Argument checking:
-        self.checkType(mix, ThermoMixture, "mix")
-        self.checkType(thermoStateClass, str, "thermoStateClass")
+        if not isinstance(mix, ThermoMixture):
+            raise TypeError(f"Wrong type for entry 'mix': 'ThermoMixture' expected but '{mix.__class__.__name__}' was found.")
+        if not isinstance(thermoStateClass, str):
+            raise TypeError(f"Wrong type for entry 'thermoStateClass': 'str' expected but '{thermoStateClass.__class__.__name__}' was found.")
         
         self.mix = mix
         self.thermoStateClass = thermoStateClass
@@ -71,7 +73,7 @@ class StateInitializer(BaseClass):
         Returns:
             ThermoState: the state
         """
-        return self.cp.deepcopy(self._state)
+        return self._state #Immutable, no need to copy
     
     #########################################################################
     #Methods:
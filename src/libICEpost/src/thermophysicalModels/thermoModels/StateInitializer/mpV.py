@@ -15,6 +15,7 @@ Last update:        DD/MM/YYYY
 from .StateInitializer import StateInitializer, ThermoState
 
 #Other imports
+from libICEpost.src.base.Functions.typeChecking import checkFloat
 
 #############################################################################
 #                               MAIN CLASSES                                #
@@ -82,9 +83,9 @@ class mpV(StateInitializer):
             V (float): volume [m^3]
         """
         #Type checking
-        self.checkType(p, float, "p")
-        self.checkType(m, float, "m")
-        self.checkType(V, float, "V")
+        checkFloat(p, "p")
+        checkFloat(m, "m")
+        checkFloat(V, "V")
         #Initialize base class
         super().__init__(**kwargv)
 
@@ -13,12 +13,42 @@ Last update:        12/06/2023
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import replace
+import numpy as np
+from sys import intern
+
 from libICEpost.src.base.Utilities import Utilities
 
 from libICEpost.src.thermophysicalModels.specie.specie.Mixture import Mixture
 from .thermoMixture.ThermoMixture import ThermoMixture
 from .StateInitializer.StateInitializer import StateInitializer
-from .ThermoState import ThermoState
+from .ThermoState import ThermoState, ThermoStateArray
+
+#############################################################################
+#                             Auxiliary functions                           #
+#############################################################################
+_stateEntries:tuple[str] = ("m", "p", "rho", "T", "V")
+"""The entries that can be used to initialize the state (bit ii of the mask in ThermoModel.initializeState).
+NOTE: kept in case-insensitive alphabetical order, which is the order of the entries in the StateInitializer names"""
+
+_initializerTypes:tuple[str] = tuple(
+    intern("".join(key for ii, key in enumerate(_stateEntries) if mask & (1 << ii)))
+    for mask in range(1 << len(_stateEntries)))
+"""The StateInitializer type name for each mask of given entries (interned, same objects as the class names)"""
+
+def _initializerClass(initializerType:str) -> type[StateInitializer]:
+    """
+    Resolve the StateInitializer class from its type name.
+
+    Args:
+        initializerType (str): The name of the StateInitializer class
+
+    Returns:
+        type[StateInitializer]: The StateInitializer class
+    """
+    StateInitializer.selectionTable().check(initializerType)
+    return StateInitializer.selectionTable()[initializerType]
 
 #############################################################################
 #                               MAIN CLASSES                                #
@@ -36,6 +66,9 @@ class ThermoModel(Utilities): #(BaseClass):
     _ThermoStateClass:ThermoState = ThermoState
     """The ThermoState class used for this engine model"""
     
+    _initializers:list[type[StateInitializer]|None] = [None]*len(_initializerTypes)
+    """The StateInitializer class for each mask of given entries (lazily populated)"""
+    
     #########################################################################
     #Properties:
     @property
@@ -56,11 +89,27 @@ class ThermoModel(Utilities): #(BaseClass):
         Returns:
             ThermoState: dataClass for the thermodynamic state of the system
         """
-        
-        return self._state.copy()
+        #Immutable, no need to copy
+        return self._state
     
     #########################################################################
     #Class methods
+    @staticmethod
+    def _initializer(mask:int) -> type[StateInitializer]:
+        """
+        The StateInitializer class for a mask of given entries. Resolved from 
+        the selection table at first use, then stored in ThermoModel._initializers.
+
+        Args:
+            mask (int): The mask of the entries given (see _stateEntries)
+
+        Returns:
+            type[StateInitializer]: The StateInitializer class
+        """
+        initializer = ThermoModel._initializers[mask]
+        if initializer is None:
+            initializer = ThermoModel._initializers[mask] = _initializerClass(_initializerTypes[mask])
+        return initializer
     
     #########################################################################
     #Constructor:
@@ -87,7 +136,8 @@ class ThermoModel(Utilities): #(BaseClass):
         """
         
         #Mixture:
-        self.checkType(mixture, ThermoMixture, "mixture")
+        if not isinstance(mixture, ThermoMixture):
+            raise TypeError(f"Wrong type for entry 'mixture': 'ThermoMixture' expected but '{mixture.__class__.__name__}' was found.")
         self._mixture = mixture
         
         #Initialize state:
@@ -119,29 +169,37 @@ class ThermoModel(Utilities): #(BaseClass):
         Returns:
             ThermoModel: self
         """
-        stateDict = \
-            {
-                "m":mass,
-                "p":pressure,
-                "V":volume,
-                "T":temperature,
-                "rho":density
-            }
-        
         #Mixture
         if not mixture is None:
-            self.checkType(mixture, Mixture, "mixture")
+            if not isinstance(mixture, Mixture):
+                raise TypeError(f"Wrong type for entry 'mixture': 'Mixture' expected but '{mixture.__class__.__name__}' was found.")
             self._mixture.update(mixture=mixture)
         
-        #Remove None entries:
-        stateDict = {key:stateDict[key] for key in stateDict if not (stateDict[key] is None)}
+        #Entries given and their bit-mask (same order as _stateEntries)
+        stateDict = {}
+        mask = 0
+        if not mass is None:
+            stateDict["m"] = mass
+            mask |= 1
+        if not pressure is None:
+            stateDict["p"] = pressure
+            mask |= 2
+        if not density is None:
+            stateDict["rho"] = density
+            mask |= 4
+        if not temperature is None:
+            stateDict["T"] = temperature
+            mask |= 8
+        if not volume is None:
+            stateDict["V"] = volume
+            mask |= 16
         
-        if len(stateDict) > 0:
-            #Retrieve initializer:
-            initializerType = "".join(sorted([key for key in stateDict],key=str.lower))
+        if mask:
             stateDict["mix"] = self.mixture
             stateDict["thermoStateClass"] = self._ThermoStateClass.__name__
-            self._state:ThermoState = StateInitializer.selector(initializerType,stateDict)()
+            
+            #Retrieve initializer:
+            self._state:ThermoState = self._initializer(mask).fromDictionary(stateDict)()
         else:
             self._state:ThermoState = self._ThermoStateClass()
     
@@ -175,37 +233,124 @@ class ThermoModel(Utilities): #(BaseClass):
         
         #Mixture
         if not mixture is None:
-            self.checkType(mixture, Mixture, "mixture")
+            if not isinstance(mixture, Mixture):
+                raise TypeError(f"Wrong type for entry 'mixture': 'Mixture' expected but '{mixture.__class__.__name__}' was found.")
             self._mixture.update(mixture=mixture)
         
         #Update mass
-        self._state.m += dm_in
+        m = self._state.m + dm_in
         
         #Update p,V,T
-        if sum([int(v is None) for v in [pressure, temperature,volume]]) == 2:
+        if (pressure is None) + (temperature is None) + (volume is None) == 2:
             raise ValueError("Supply two of (p,V,T)")
         
+        #Scalar closure of the state: the cost is in the equation of state, which is
+        #looked-up once (updates the mixing rule) and evaluated once.
+        EoS = self.mixture.EoS
+        
         #Update volume (and density)
         if not (volume is None):
-            self._state.V = volume
-            self._state.rho = self._state.m/self._state.V
+            V = volume
+            rho = m/V
             
             #Update pressure
             if not (pressure is None):
-                self._state.p = pressure
-                self._state.T = self.mixture.EoS.T(self._state.p, self._state.rho)
+                p = pressure
+                T = EoS.T(p, rho)
             else:
                 #Update from temperature
-                self._state.T = temperature
-                self._state.p = self.mixture.EoS.p(self._state.T, self._state.rho)
+                T = temperature
+                p = EoS.p(T, rho)
         
         else:
             #Update from pressure and temperature
-            self._state.p = pressure
-            self._state.T = temperature
+            p = pressure
+            T = temperature
             
-            self._state.rho = self.mixture.EoS.rho(self._state.p, self._state.T)
-            self._state.V = self._state.m/self._state.rho
+            rho = EoS.rho(p, T)
+            V = m/rho
+        
+        #The state is immutable: rebuild it
+        self._state = replace(self._state, m=m, V=V, rho=rho, p=p, T=T)
+    
+    ################################
+    def updateBatch(self, /, *,
+        pressure:Iterable[float]=None,
+        volume:Iterable[float]=None,
+        temperature:Iterable[float]=None,
+        mass:Iterable[float]=None)->ThermoStateArray:
+        """
+        Update the state of the system over a sequence of values of the control
+        variables (two of p,V,T) at fixed mixture composition. Same as calling 
+        update for each item, but the state closure is evaluated column-wise.
+        The current state is set to the last one.
+
+        Args:
+            pressure (Iterable[float], optional): [Pa]. Defaults to None.
+            volume (Iterable[float], optional): [m^3]. Defaults to None.
+            temperature (Iterable[float], optional): [K]. Defaults to None.
+            mass (Iterable[float], optional): [kg]. Defaults to the current mass.
+
+        Returns:
+            ThermoStateArray: The states computed
+        """
+        if (pressure is None) + (temperature is None) + (volume is None) != 1:
+            raise ValueError("Supply two of (p,V,T)")
+        
+        #Columns (broadcasted to the same length)
+        columns = {key:np.atleast_1d(np.asarray(value, dtype=float)).ravel() for key, value in \
+            zip(("p", "V", "T", "m"), (pressure, volume, temperature, self._state.m if mass is None else mass)) if not value is None}
+        columns = dict(zip(columns, np.broadcast_arrays(*columns.values())))
+        m = columns["m"]
+        
+        #Scalar equation of state, evaluated element-wise
+        EoS = self.mixture.EoS
+        if not (volume is None):
+            V = columns["V"]
+            rho = m/V
+            if not (pressure is None):
+                p = columns["p"]
+                T = np.frompyfunc(EoS.T, 2, 1)(p, rho).astype(float)
+            else:
+                T = columns["T"]
+                p = np.frompyfunc(EoS.p, 2, 1)(T, rho).astype(float)
+        else:
+            p = columns["p"]
+            T = columns["T"]
+            rho = np.frompyfunc(EoS.rho, 2, 1)(p, T).astype(float)
+            V = m/rho
+        
+        out = ThermoStateArray.fromArrays(self._ThermoStateClass, p=p, T=T, rho=rho, V=V, m=m)
+        if len(out) > 0:
+            self._state = replace(self._state, p=p[-1].item(), T=T[-1].item(), rho=rho[-1].item(), V=V[-1].item(), m=m[-1].item())
+        return out
+    
+    ################################
+    def propertiesBatch(self, pressure:Iterable[float], temperature:Iterable[float], properties:Iterable[str]=("cp", "cv", "gamma")) -> dict[str,np.ndarray]:
+        """
+        Evaluate properties of the mixture (methods of ThermoMixture with 
+        signature f(p,T), e.g. cp, cv, gamma, ha, us) over arrays of pressure
+        and temperature at the current mixture composition.
+
+        Args:
+            pressure (Iterable[float]): [Pa]
+            temperature (Iterable[float]): [K]
+            properties (Iterable[str], optional): The names of the properties. Defaults to ("cp", "cv", "gamma").
+
+        Returns:
+            dict[str,np.ndarray]: The values of each property (broadcasted shape of pressure and temperature)
+        """
+        p, T = np.broadcast_arrays(np.asarray(pressure, dtype=float), np.asarray(temperature, dtype=float))
+        
+        out = {}
+        for prop in properties:
+            function = getattr(self.mixture, prop, None)
+            if not callable(function):
+                raise ValueError(f"Unknown property '{prop}' of {self.mixture.__class__.__name__}.")
+            #Scalar methods (type-checked on float), evaluated element-wise in a single ufunc loop
+            #(the ufunc returns a plain float for 0-d input: wrap in array)
+            out[prop] = np.asarray(np.frompyfunc(function, 2, 1)(p, T), dtype=float)
+        return out
     ################################
     
 #########################################################################
\ No newline at end of file
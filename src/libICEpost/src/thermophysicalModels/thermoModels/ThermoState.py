@@ -11,6 +11,12 @@ Last update:        12/06/2023
 #                               IMPORT                              #
 #####################################################################
 
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import numpy as np
+
+from libICEpost.src.base.Utilities import Utilities
 from libICEpost.src.base.BaseClass import BaseClass
 from libICEpost.src.base.dataStructures.Dictionary import Dictionary
 
@@ -22,37 +28,44 @@ try:
         pass
     del __test_Dataclass
     
-except:
-    #Python < 3.10
+except TypeError:
+    #Python < 3.10 (kw_only not supported)
     from pydantic.dataclasses import dataclass
 
+from dataclasses import fields
 from collections.abc import Mapping
 
+_new = object.__new__
+_setField = object.__setattr__
+
 #############################################################################
 #                               MAIN CLASSES                                #
 #############################################################################
 #DataClass for thermodynamic state of the system
-@dataclass(kw_only=True, match_args=True)
+@dataclass(kw_only=True, match_args=True, frozen=True, slots=True)
 class ThermoState(Mapping, BaseClass):
     """
-    DataClass storing the thermodynamic state of the system
+    DataClass storing the thermodynamic state of the system. Immutable: use
+    dataclasses.replace to build an updated state.
         
     Attributes:
         p (float): pressure [Pa]
         T (float): temperature [T]
-        V (float): volume [m^3]
         rho (float): density [kg/m^3]
+        V (float): volume [m^3]
         m (float): mass [kg]
     """
+    #NOTE: field order is the slot layout. (p,T) first since equations of state
+    #are mostly evaluated as f(p,T), then (rho,V,m) which are tied by m = rho*V.
     p:float = float("nan")
     """pressure [Pa]"""
     T:float = float("nan")
     """temperature [T]"""
-    m:float = float("nan")
-    """Volume [m^3]"""
-    V:float = float("nan")
-    """density [kg/m^3]"""
     rho:float = float("nan")
+    """density [kg/m^3]"""
+    V:float = float("nan")
+    """Volume [m^3]"""
+    m:float = float("nan")
     """mass [kg]"""
     
     #Construct from dictionary
@@ -67,22 +80,35 @@ class ThermoState(Mapping, BaseClass):
         Returns:
             ThermoState: An instance of this class constructed from dictionary
         """
-        dictionary = Dictionary(**dictionary)
-        vars = cls().__dict__.keys()
-        return cls(**{v:dictionary.lookup(v) for v in vars if v in dictionary})
+        #Lookup directly the fields of the dataclass (no need to construct a dummy instance)
+        return cls(**{f.name:dictionary[f.name] for f in fields(cls) if f.name in dictionary})
+    
+    #Shallow copy (all the fields are floats, no need for deepcopy)
+    def copy(self) -> ThermoState:
+        """
+        Return a copy of the state.
+        """
+        #Write the slots directly (dataclasses.replace would collect the fields and go through __init__)
+        out = _new(self.__class__)
+        for f in self.__dataclass_fields__:
+            _setField(out, f, getattr(self, f))
+        return out
+    
+    #NumPy interoperability: np.asarray(state) gives the values of the fields
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array([getattr(self, f) for f in self.__dataclass_fields__], dtype=float if dtype is None else dtype)
     
-    #Allow unpacking with ** operator
+    #Allow unpacking with ** operator (no instance __dict__, use the dataclass fields)
     def __len__(self):
-        return len(self.__dict__)
+        return len(self.__dataclass_fields__)
     
     def __getitem__(self, ii:str) -> float:
-        if not ii in self.__dict__.keys():
+        if not ii in self.__dataclass_fields__:
             raise KeyError(f"Entry '{ii}' not stored in {self.__class__.__name__} class.")
-        return self.__dict__[ii]
+        return getattr(self, ii)
     
     def __iter__(self):
-        vars = self.__dict__.keys()
-        return iter(vars)
+        return iter(self.__dataclass_fields__)
 
 #############################################################################
 ThermoState.createRuntimeSelectionTable()
@@ -91,7 +117,7 @@ ThermoState.createRuntimeSelectionTable()
 #                                 THERMO STATES                             #
 #############################################################################
 #DataClass for thermodynamic state of the system
-@dataclass(kw_only=True, match_args=True)
+@dataclass(kw_only=True, match_args=True, frozen=True, slots=True)
 class PsiPsiuThermoState(ThermoState):
     """
     DataClass storing the thermodynamic state of the system with burnt and unburnt properties:
@@ -111,23 +137,202 @@ class PsiPsiuThermoState(ThermoState):
         rhob (float): burnt gas density [kg/m^3]
         mb (float): burnt gas mass [kg]
     """
+    #NOTE: same ordering as the base class (T,rho,V,m) for each zone
     Tu:float = float("nan")
     """unburnt gas temperature [T]"""
-    mu:float = float("nan")
-    """unburnt gas Volume [m^3]"""
-    Vu:float = float("nan")
-    """unburnt gas density [kg/m^3]"""
     rhou:float = float("nan")
+    """unburnt gas density [kg/m^3]"""
+    Vu:float = float("nan")
+    """unburnt gas Volume [m^3]"""
+    mu:float = float("nan")
     """unburnt gas mass [kg]"""
     
     Tb:float = float("nan")
     """burnt gas temperature [T]"""
-    mb:float = float("nan")
-    """burnt gas Volume [m^3]"""
-    Vb:float = float("nan")
-    """burnt gas density [kg/m^3]"""
     rhob:float = float("nan")
+    """burnt gas density [kg/m^3]"""
+    Vb:float = float("nan")
+    """burnt gas Volume [m^3]"""
+    mb:float = float("nan")
     """burnt gas mass [kg]"""
 
 #############################################################################
-ThermoState.addToRuntimeSelectionTable(PsiPsiuThermoState)
\ No newline at end of file
+ThermoState.addToRuntimeSelectionTable(PsiPsiuThermoState)
+
+#############################################################################
+#                                 STATE ARRAYS                              #
+#############################################################################
+class ThermoStateArray(Utilities):
+    """
+    Container of a sequence of thermodynamic states stored as a structure of
+    arrays: each field of the state class is a contiguous numpy array, so that
+    column-wise operations (e.g. arr.p*arr.V) are vectorized. Indexing with an
+    integer returns the corresponding ThermoState.
+    
+    Attributes:
+        stateClass (type[ThermoState]): The class of the stored states
+        <field> (np.ndarray): The values of each field of stateClass (read-only view)
+    """
+    __slots__ = ("_stateClass", "_fields", "_index", "_data", "_size")
+    
+    _stateClass:type[ThermoState]
+    """The class of the stored states"""
+    
+    _fields:tuple[str]
+    """The names of the fields of the state class"""
+    
+    _index:dict[str,int]
+    """Row of each field in _data"""
+    
+    _data:np.ndarray
+    """The data (one row for each field, columns beyond _size are unused capacity)"""
+    
+    _size:int
+    """The number of states stored"""
+    
+    #########################################################################
+    #Properties:
+    @property
+    def stateClass(self) -> type[ThermoState]:
+        """
+        The class of the stored states.
+        """
+        return self._stateClass
+    
+    @property
+    def fields(self) -> tuple[str]:
+        """
+        The names of the fields stored.
+        """
+        return self._fields
+    
+    #########################################################################
+    #Constructor:
+    def __init__(self, stateClass:type[ThermoState]=ThermoState, *, capacity:int=16):
+        """
+        Construct an empty array of states.
+
+        Args:
+            stateClass (type[ThermoState], optional): The class of the states to store. Defaults to ThermoState.
+            capacity (int, optional): Number of states to pre-allocate. Defaults to 16.
+        """
+        if not (isinstance(stateClass, type) and issubclass(stateClass, ThermoState)):
+            raise TypeError(f"Wrong type for entry 'stateClass': subclass of 'ThermoState' expected but '{stateClass}' was found.")
+        self.checkType(capacity, int, "capacity")
+        
+        self._stateClass = stateClass
+        self._fields = tuple(f.name for f in fields(stateClass))
+        self._index = {f:ii for ii, f in enumerate(self._fields)}
+        self._data = np.full((len(self._fields), max(capacity, 1)), float("nan"))
+        self._size = 0
+    
+    #Construct from columns
+    @classmethod
+    def fromArrays(cls, stateClass:type[ThermoState]=ThermoState, **columns:Iterable[float]) -> ThermoStateArray:
+        """
+        Construct from the arrays of the fields (fields not given are set to nan).
+
+        Args:
+            stateClass (type[ThermoState], optional): The class of the states. Defaults to ThermoState.
+            **columns (Iterable[float]): The values of each field (all of the same length)
+
+        Returns:
+            ThermoStateArray: The array of states
+        """
+        columns = {f:np.asarray(columns[f], dtype=float) for f in columns}
+        sizes = {c.size for c in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Inconsistent lengths of the fields ({', '.join(f'{f}:{columns[f].size}' for f in columns)}).")
+        size = sizes.pop() if len(sizes) > 0 else 0
+        
+        out = cls(stateClass, capacity=size)
+        for f in columns:
+            if not f in out._index:
+                raise ValueError(f"Field '{f}' not found in {stateClass.__name__}. Available fields are: {out._fields}")
+            out._data[out._index[f],:size] = columns[f].ravel()
+        out._size = size
+        return out
+    
+    #Construct from a sequence of states
+    @classmethod
+    def fromStates(cls, states:Iterable[ThermoState], stateClass:type[ThermoState]=None) -> ThermoStateArray:
+        """
+        Construct from a sequence of states.
+
+        Args:
+            states (Iterable[ThermoState]): The states to store
+            stateClass (type[ThermoState], optional): The class of the states. Defaults to the class of the first state (or ThermoState if empty).
+
+        Returns:
+            ThermoStateArray: The array of states
+        """
+        states = list(states)
+        if stateClass is None:
+            stateClass = states[0].__class__ if len(states) > 0 else ThermoState
+        
+        out = cls(stateClass, capacity=len(states))
+        for ii, f in enumerate(out._fields):
+            out._data[ii,:len(states)] = np.fromiter((getattr(s, f) for s in states), dtype=float, count=len(states))
+        out._size = len(states)
+        return out
+    
+    #########################################################################
+    #Methods:
+    def append(self, state:ThermoState) -> None:
+        """
+        Append a state at the end of the array (the storage is doubled when full).
+
+        Args:
+            state (ThermoState): The state to append
+        """
+        if not isinstance(state, self._stateClass):
+            raise TypeError(f"Wrong type for entry 'state': '{self._stateClass.__name__}' expected but '{state.__class__.__name__}' was found.")
+        
+        if self._size == self._data.shape[1]:
+            data = np.full((self._data.shape[0], 2*self._data.shape[1]), float("nan"))
+            data[:,:self._size] = self._data
+            self._data = data
+        
+        self._data[:,self._size] = [getattr(state, f) for f in self._fields]
+        self._size += 1
+    
+    ################################
+    def toStates(self) -> list[ThermoState]:
+        """
+        Convert to a list of states.
+
+        Returns:
+            list[ThermoState]: The states stored
+        """
+        return [self[ii] for ii in range(self._size)]
+    
+    #########################################################################
+    #Dunder methods:
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, ii:int) -> ThermoState:
+        if not isinstance(ii, (int, np.integer)):
+            raise TypeError(f"Wrong type for entry 'ii': 'int' expected but '{ii.__class__.__name__}' was found.")
+        if ii < 0:
+            ii += self._size
+        if not (0 <= ii < self._size):
+            raise IndexError(f"Index {ii} out of range for {self.__class__.__name__} of size {self._size}.")
+        return self._stateClass(**{f:v for f, v in zip(self._fields, self._data[:,ii].tolist())})
+    
+    def __iter__(self) -> Iterator[ThermoState]:
+        for ii in range(self._size):
+            yield self[ii]
+    
+    def __getattr__(self, name:str) -> np.ndarray:
+        #Only invoked when the attribute is not found: look-up the fields
+        if not name.startswith("_"):
+            index = object.__getattribute__(self, "_index")
+            if name in index:
+                out = self._data[index[name],:self._size]
+                out.flags.writeable = False
+                return out
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(stateClass={self._stateClass.__name__}, size={self._size})"
@@ -10,6 +10,9 @@ Content of the package:
         
     ThermoState (class)
         DataClass for thermodynamic state of a system
+    
+    ThermoStateArray (class)
+        Structure of arrays storing a sequence of thermodynamic states
 
     ThermoMixture (package)
         Classes for thermodynamic modeling of a mixture
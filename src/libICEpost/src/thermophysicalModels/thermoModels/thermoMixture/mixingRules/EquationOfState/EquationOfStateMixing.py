@@ -49,6 +49,12 @@ class EquationOfStateMixing(BaseClass):
     EoSType:str
     thermos = EoS_db
     
+    _validatedEoSTypes:set[str] = set()
+    """The EoSType already checked against the EquationOfState selection table (shared by all mixing rules)"""
+    
+    _mixVersion:int|None = None
+    """The version of the mixture composition at the last update"""
+    
     #########################################################################
     #Properties:
     @property
@@ -56,7 +62,7 @@ class EquationOfStateMixing(BaseClass):
         """
         The equation of state of the mixture.
         """
-        self._update()
+        self.update()
         return self._EoS
     
     ##############################
@@ -80,7 +86,10 @@ class EquationOfStateMixing(BaseClass):
 
         Base (virtual) class: does not support instantiation.
         """
-        EquationOfState.selectionTable().check(self.EoSType)
+        #Check the EoSType only at the first construction of each type
+        if not self.EoSType in EquationOfStateMixing._validatedEoSTypes:
+            EquationOfState.selectionTable().check(self.EoSType)
+            EquationOfStateMixing._validatedEoSTypes.add(self.EoSType)
         self._mix = mix.copy()
         self.update(mix)
 
@@ -95,7 +104,13 @@ class EquationOfStateMixing(BaseClass):
         Returns:
             bool: If something changed
         """
-        return self._update(mix)
+        #The mixture did not change since the last update
+        if (mix is None) and (self._mixVersion == self._mix._version):
+            return False
+        
+        updated = self._update(mix)
+        self._mixVersion = self._mix._version
+        return updated
     
     #####################################
     @abstractmethod
@@ -109,8 +124,10 @@ class EquationOfStateMixing(BaseClass):
         Returns:
             bool: If something changed
         """
-        if not mix is None:
-            if mix != self._mix:
+        #NOTE: the mixture is often shared by reference with the owner (e.g. ThermoMixture),
+        #in which case it is already up to date and the comparison can be skipped
+        if not((mix is None) or (mix is self._mix)):
+            if (mix._version != self._mix._version) and (mix != self._mix):
                 self._mix.update(mix.species, mix.Y, fracType="mass")
                 return True
         
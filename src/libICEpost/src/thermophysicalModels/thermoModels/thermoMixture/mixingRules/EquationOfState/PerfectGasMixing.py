@@ -72,10 +72,17 @@ class PerfectGasMixing(EquationOfStateMixing):
         Pv/R*T = 1
         
         Returns:
-            bool: if womething changed
+            bool: if something changed
         """
         super()._update(mix)
-        self._EoS.Rgas = self.mix.Rgas
+        
+        #The mixture may have been changed in place by its owner: compare the gas
+        #constant and only write when it changed (keeps the EoS, and its hash, stable)
+        EoS = self._EoS
+        Rgas = self._mix.Rgas
+        if EoS.Rgas == Rgas:
+            return False
+        EoS.Rgas = Rgas
         return True
 
 #########################################################################
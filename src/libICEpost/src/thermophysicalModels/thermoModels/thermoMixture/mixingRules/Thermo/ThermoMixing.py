@@ -12,6 +12,7 @@ Last update:        17/10/2023
 #####################################################################
 
 from __future__ import annotations
+from contextlib import contextmanager
 
 from libICEpost.src.base.BaseClass import BaseClass, abstractmethod
 
@@ -49,6 +50,15 @@ class ThermoMixing(BaseClass):
     thermos:_DatabaseClass = database.chemistry.thermo.Thermo
     """Link to database of thermodynamic data"""
     
+    _validatedThermoTypes:set[str] = set()
+    """The ThermoType already checked against the Thermo selection table (shared by all mixing rules)"""
+    
+    _mixVersion:int|None = None
+    """The version of the mixture composition at the last update"""
+    
+    _frozen:bool = False
+    """If True, the implicit updates when accessing Thermo are skipped (see frozen)"""
+    
     #########################################################################
     #Properties
     @property
@@ -65,7 +75,10 @@ class ThermoMixing(BaseClass):
         Args:
             mix (Mixture): Mixture to which generate the thermodynamic data.
         """
-        Thermo.selectionTable().check(self.ThermoType)
+        #Check the ThermoType only at the first construction of each type
+        if not self.ThermoType in ThermoMixing._validatedThermoTypes:
+            Thermo.selectionTable().check(self.ThermoType)
+            ThermoMixing._validatedThermoTypes.add(self.ThermoType)
         self._mix = mix.copy()
         self.update(mix)
         
@@ -74,10 +87,34 @@ class ThermoMixing(BaseClass):
     @property
     def Thermo(self) -> Thermo:
         """
-        The thermodynamic data of the mixture.
+        The thermodynamic data of the mixture, updated at each access if the mixture changed.
+        When evaluating many properties at fixed composition, store the returned object (it is 
+        updated in place) or use the 'frozen' context to skip the checks.
         """
         self.update()
         return self._Thermo
+    
+    #########################################################################
+    @contextmanager
+    def frozen(self):
+        """
+        Context in which the thermodynamic data are not updated when accessing Thermo,
+        for evaluating the properties in loops where the mixture composition does not
+        change. The data are updated when entering the context. Explicit calls to 
+        update with a mixture are still performed.
+        
+        Usage:
+            >>> with mixing.frozen():
+            >>>     for T in Ts:
+            >>>         cp = mixing.Thermo.cp(p, T)
+        """
+        self.update()
+        frozen = self._frozen
+        self._frozen = True
+        try:
+            yield self
+        finally:
+            self._frozen = frozen
 
     #########################################################################
     def update(self, mix:Mixture=None) -> bool:
@@ -90,7 +127,13 @@ class ThermoMixing(BaseClass):
         Returns:
             bool: If something changed
         """
-        return self._update(mix)
+        #The mixture did not change since the last update (or updates are frozen)
+        if (mix is None) and (self._frozen or (self._mixVersion == self._mix._version)):
+            return False
+        
+        updated = self._update(mix)
+        self._mixVersion = self._mix._version
+        return updated
     
     #####################################
     @abstractmethod
@@ -104,8 +147,10 @@ class ThermoMixing(BaseClass):
         Returns:
             bool: If something changed
         """
-        if not mix is None:
-            if mix != self._mix:
+        #NOTE: the mixture is often shared by reference with the owner (e.g. ThermoMixture),
+        #in which case it is already up to date and the comparison can be skipped
+        if not((mix is None) or (mix is self._mix)):
+            if (mix._version != self._mix._version) and (mix != self._mix):
                 self._mix.update(mix.species, mix.Y, fracType="mass")
                 return True
         
@@ -11,11 +11,39 @@ Last update:        30/01/2024
 #                               IMPORT                              #
 #####################################################################
 
+from functools import lru_cache
+
 from .ThermoMixing import ThermoMixing
 
 from .....specie.specie.Mixture import Mixture
 from .....specie.thermo.Thermo import Thermo
 
+from libICEpost.GLOBALS import __CACHE_SIZE__
+
+#############################################################################
+#                             Auxiliary functions                           #
+#############################################################################
+@lru_cache(maxsize=__CACHE_SIZE__)
+def _mixtureCoeffs(compositionKey:tuple[tuple[str,float],...], thermos:tuple[Thermo,...]) -> tuple[float,float]:
+    """
+    Mass-weighted cp and hf of a mixture from the constantCp data of its species
+    (cached, as the same compositions recur during the simulation). The data of the 
+    species are part of the key, so that changes in the database are not missed.
+
+    Args:
+        compositionKey (tuple[tuple[str,float],...]): The composition (see Mixture.compositionKey)
+        thermos (tuple[Thermo,...]): The thermodynamic data of each specie in the composition
+
+    Returns:
+        tuple[float,float]: cp and hf of the mixture
+    """
+    cp = 0.0
+    hf = 0.0
+    for (specie, y), th in zip(compositionKey, thermos):
+        cp += y*th._cp
+        hf += y*th._hf
+    return cp, hf
+
 #############################################################################
 #                               MAIN CLASSES                                #
 #############################################################################
@@ -30,8 +58,8 @@ class constantCpMixing(ThermoMixing):
     
     ThermoType = "constantCp"
     
-    _oldMix:Mixture
-    """The old mixture composition"""
+    _key:tuple[tuple[str,float],...]|None
+    """The composition for which the thermodynamic data were computed (None if never computed)"""
     
     #########################################################################
     @classmethod
@@ -67,8 +95,8 @@ class constantCpMixing(ThermoMixing):
                     "cp":float('nan'),
                 }
             )
-        #Save old mixture
-        self._oldMix:Mixture = mix.copy()
+        #Force computation at first update
+        self._key = None
         
         super().__init__(mix)
         
@@ -87,28 +115,20 @@ class constantCpMixing(ThermoMixing):
         """
         #Update mixture in base class
         super()._update(mix)
-
-        if self.mix == self._oldMix:
+        
+        key = self._mix.compositionKey
+        if key == self._key:
             #Updated
             return False
 
         #Update
-        self._oldMix = self._mix.copy()
-        cp = []
-        hf = []
-        weigths = []
-        for specie in self.mix:
-            if not specie.specie.name in self.thermos[self.ThermoType]:
-                raise ValueError(f"Thermo.{self.ThermoType} data not found in database for specie {specie['specie'].name}.\n{self.thermos}")
-            th = self.thermos[self.ThermoType][specie.specie.name]
-            
-            weigths.append(self._mix.Y[self.mix.index(specie.specie)])
-            cp.append(th._cp)
-            hf.append(th._hf)
-        
-        self._Thermo.Rgas = self.mix.Rgas
-        self._Thermo._cp = (sum([weigths[ii]*v for ii, v in enumerate(cp)]))
-        self._Thermo._hf = (sum([weigths[ii]*v for ii, v in enumerate(hf)]))
+        self._key = key
+        self._Thermo.Rgas = self._mix.Rgas
+        thermos = constantCpMixing.thermos[constantCpMixing.ThermoType]
+        for specie, _ in key:
+            if not specie in thermos:
+                raise ValueError(f"Thermo.{constantCpMixing.ThermoType} data not found in database for specie {specie}.\n{constantCpMixing.thermos}")
+        self._Thermo._cp, self._Thermo._hf = _mixtureCoeffs(key, tuple(thermos[specie] for specie, _ in key))
 
         return True
 
@@ -11,13 +11,71 @@ Last update:        17/10/2023
 #                               IMPORT                              #
 #####################################################################
 
+from typing import Iterable
+from operator import mul
+from bisect import bisect_right
+from functools import lru_cache
+import numpy as np
+
 from .ThermoMixing import ThermoMixing
 from libICEpost import Dictionary
+from libICEpost.src.base.Functions.typeChecking import checkFloat
 
 from .....specie.specie.Mixture import Mixture
 from .....specie.thermo.Thermo import Thermo
 
-from libICEpost.src.thermophysicalModels.specie.thermo.Thermo.janaf7 import janaf7
+from libICEpost.src.thermophysicalModels.specie.thermo.Thermo.janaf7 import janaf7, Tstd, _cpPoly, _dcpdTPoly
+
+from libICEpost.GLOBALS import __CACHE_SIZE__
+
+#############################################################################
+#                             Auxiliary functions                           #
+#############################################################################
+def _haPolyMix(a:Iterable[float], T:float) -> float:
+    """
+    ha/R = sum_{i=0,4} ( a_{i}/(i + 1) * T^i )*T + a_{5}, as _haPoly, with the 
+    coefficients a_{i}/(i + 1), i=1,4 stored in a[7:11].
+    """
+    return ((((a[10]*T + a[9])*T + a[8])*T + a[7])*T + a[0])*T + a[5]
+
+@lru_cache(maxsize=__CACHE_SIZE__)
+def _intervalCoeffs(th:tuple[Thermo,...], Y:bytes) -> tuple[list[float],list[list[float]],float,float]|None:
+    """
+    Mass-weighted coefficients (multiplied by the gas constant) of a mixture with fixed
+    composition in each interval between the threshold temperatures of its species, where
+    the choice of the low/high-temperature coefficients of every specie is fixed (shared
+    by all the mixtures with the same composition, as the same compositions recur during
+    the simulation). The data of the species are part of the key, so that changes in the 
+    database are not missed.
+
+    Args:
+        th (tuple[Thermo,...]): The thermodynamic data of the species.
+        Y (bytes): The bytes of the array of mass fractions.
+
+    Returns:
+        tuple[list[float],list[list[float]],float,float]|None: The sorted threshold
+            temperatures, the coefficients in each interval (one more than the thresholds, 
+            see _haPolyMix for the layout), and the range of validity common to all the species. None if some specie
+            does not have janaf7 data.
+    """
+    if not all(isinstance(t, janaf7) for t in th):
+        return None
+
+    Y = np.frombuffer(Y)
+    Rgas = np.array([t.Rgas for t in th])[:,np.newaxis]
+    cpLow = np.array([t.cpLow for t in th])*Rgas
+    cpHigh = np.array([t.cpHigh for t in th])*Rgas
+    Tth = np.array([t.Tth for t in th])
+
+    #Interval ii is [thresholds[ii-1], thresholds[ii]): a specie uses the low-temperature
+    #coefficients if its threshold is above the lower bound of the interval
+    thresholds = sorted(set(Tth.tolist()))
+    coeffs = [np.dot(Y, np.where((T < Tth)[:,np.newaxis], cpLow, cpHigh)).tolist() for T in [-np.inf] + thresholds]
+    
+    #Append the coefficients of the enthalpy polynomial (a_{i}/(i + 1), i=1,4) to avoid the divisions at each evaluation
+    coeffs = [a + [a[1]/2., a[2]/3., a[3]/4., a[4]/5.] for a in coeffs]
+
+    return thresholds, coeffs, max(t.Tlow for t in th), min(t.Thigh for t in th)
 
 #############################################################################
 #                               MAIN CLASSES                                #
@@ -61,6 +119,8 @@ class janaf7Mixing(ThermoMixing):
         ###################################
         def __init__(self, mix:Mixture):
             self._mix = mix #Take as reference!
+            self._thermosKey = None
+            self._version = None
 
         ###################################
         def _combineMethod(self, func:str, *fargs, **fkwargs):
@@ -73,37 +133,213 @@ class janaf7Mixing(ThermoMixing):
             Returns:
                 Thermo.func@ReturnType: returns sum(y_i * thermo[specie_i].func(*fargs, **fkwargs))
             """
-            vals = []
-            weigths = []
-            for specie in self._mix:
-                if not specie.specie.name in janaf7Mixing.thermos[janaf7Mixing.ThermoType]:
-                    raise ValueError(f"Thermo.{janaf7Mixing.ThermoType} data not found in database for specie {specie.specie.name}.\n{janaf7Mixing.thermos}")
-                th = janaf7Mixing.thermos[janaf7Mixing.ThermoType][specie.specie.name]
-                
-                weigths.append(self._mix.Y[self._mix.index(specie.specie)])
-                vals.append(th.__getattribute__(func)(*fargs, **fkwargs))
+            Y = self._composition()
+            vals = [getattr(th, func)(*fargs, **fkwargs) for th in self._thermos]
+            
+            #For small mixtures the reduction in python (on the list of mass fractions, 
+            #to avoid iterating over numpy scalars) is faster than the conversion to arrays
+            if len(vals) > 32:
+                return np.dot(Y, vals)
+            return sum(map(mul, self._Ylist, vals))
+        
+        ###################################
+        def _composition(self) -> np.ndarray:
+            """
+            The mass fractions of the species in the mixture, stored in an array 
+            (and in the list _Ylist) which is updated, together with the data of 
+            the species, only when the mixture changes.
+
+            Returns:
+                np.ndarray: The mass fractions.
+            """
+            mix = self._mix
+            if not (mix._version == self._version):
+                self._speciesThermos()
+                self._Y = np.array(mix.Y)
+                self._Ylist = self._Y.tolist()
+                self._intervalCoeffs = _intervalCoeffs(tuple(self._thermos), self._Y.tobytes())
+                self._version = mix._version
+            return self._Y
+        
+        ###################################
+        def _speciesThermos(self) -> list[Thermo]:
+            """
+            The thermodynamic data of the species in the mixture, looked-up in the database
+            only when the list of species in the mixture changes.
+
+            Returns:
+                list[Thermo]: The thermodynamic data of each specie in the mixture.
+            """
+            names = tuple(self._mix.specieNames)
+            if names == self._thermosKey:
+                return self._thermos
+            
+            thermos = janaf7Mixing.thermos[janaf7Mixing.ThermoType]
+            for specie in names:
+                if not specie in thermos:
+                    raise ValueError(f"Thermo.{janaf7Mixing.ThermoType} data not found in database for specie {specie}.\n{janaf7Mixing.thermos}")
+            th = [thermos[specie] for specie in names]
+            
+            self._thermos = th
+            self._thermosKey = names
+            return self._thermos
+        
+        ###################################
+        def _mixtureCoeffs(self, T:float) -> list[float]|None:
+            """
+            Mass-weighted average of the coefficients (multiplied by the gas constant)
+            of the species at temperature T. Since the polynomials are linear in the 
+            coefficients, the properties of the mixture are computed evaluating the
+            polynomials once with these coefficients.
+
+            Args:
+                T (float): Temperature [K]
+
+            Returns:
+                list[float]|None: The coefficients, or None if the vectorized evaluation
+                    is not possible (then use _combineMethod).
+            """
+            #The coefficients are piecewise-constant in T for a given composition:
+            #look-up the interval between the threshold temperatures of the species
+            if not (self._mix._version == self._version):
+                self._composition()
+            coeffs = self._intervalCoeffs
+            if coeffs is None:
+                return None
+            thresholds, a, Tlow, Thigh = coeffs
+
+            #Out of range of validity: use the scalar method, which displays the warnings
+            if janaf7.__WARNING__ and ((T < Tlow) or (T > Thigh)):
+                return None
+
+            return a[bisect_right(thresholds, T)]
+        
+        ###################################
+        def _mixtureCoeffsArray(self, T:np.ndarray) -> np.ndarray|None:
+            """
+            Mass-weighted average of the coefficients (multiplied by the gas constant)
+            of the species at an array of temperatures (see _mixtureCoeffs).
+
+            Args:
+                T (np.ndarray): 1-D array of temperatures [K]
+
+            Returns:
+                np.ndarray|None: The coefficients, with shape (11, T.size), or None if the 
+                    vectorized evaluation is not possible (then evaluate at each temperature).
+            """
+            self._composition()
+            coeffs = self._intervalCoeffs
+            if coeffs is None:
+                return None
+            thresholds, a, Tlow, Thigh = coeffs
+            
+            #Out of range of validity: use the scalar method, which displays the warnings
+            if janaf7.__WARNING__ and ((T.min(initial=np.inf) < Tlow) or (T.max(initial=-np.inf) > Thigh)):
+                return None
+            
+            return np.array(a)[np.searchsorted(thresholds, T, side="right")].T
+        
+        ###################################
+        def _evaluateArray(self, func:str, p:float, T:np.ndarray) -> np.ndarray:
+            """
+            Evaluate a property at an array of temperatures, computing the polynomials
+            of the mixture for all the temperatures at once.
 
-            return (sum([weigths[ii]*v for ii, v in enumerate(vals)]))
+            Args:
+                func (str): The name of the property (cp, ha, hs, dcpdT).
+                p (float): Pressure [Pa]
+                T (np.ndarray): Temperatures [K]
 
+            Returns:
+                np.ndarray: The values, with the same shape of T.
+            """
+            self.checkType(p, float, "p")
+            
+            Tflat = np.ravel(T).astype(float)
+            a = self._mixtureCoeffsArray(Tflat)
+            if a is None:
+                #Fallback to scalar evaluation
+                return np.array([getattr(self, func)(p, float(t)) for t in Tflat]).reshape(np.shape(T))
+            
+            if func == "cp":
+                values = _cpPoly(a, Tflat)
+            elif func == "dcpdT":
+                values = _dcpdTPoly(a, Tflat)
+            elif func == "ha":
+                values = _haPolyMix(a, Tflat)
+            elif func == "hs":
+                values = _haPolyMix(a, Tflat) - self.hf()
+            else:
+                raise ValueError(f"Unknown property '{func}'.")
+            return values.reshape(np.shape(T))
+        
         ###################################
-        def cp(self, p:float, T:float) -> float:
-            return self._combineMethod("cp", p, T)
+        def cp(self, p:float, T:float|np.ndarray) -> float|np.ndarray:
+            """
+            Constant pressure heat capacity [J/kg/K]. If T is an array, returns an array.
+            """
+            if isinstance(T, np.ndarray):
+                return self._evaluateArray("cp", p, T)
+            checkFloat(p, "p")
+            checkFloat(T, "T")
+            
+            a = self._mixtureCoeffs(T)
+            if a is None:
+                return self._combineMethod("cp", p, T)
+            return _cpPoly(a, T)
         
         ###################################
-        def dcpdT(self, p:float, T:float) -> float:
-            return self._combineMethod("dcpdT", p, T)
+        def dcpdT(self, p:float, T:float|np.ndarray) -> float|np.ndarray:
+            """
+            dcp/dT [J/kg/K^2]. If T is an array, returns an array.
+            """
+            if isinstance(T, np.ndarray):
+                return self._evaluateArray("dcpdT", p, T)
+            checkFloat(p, "p")
+            checkFloat(T, "T")
+            
+            a = self._mixtureCoeffs(T)
+            if a is None:
+                return self._combineMethod("dcpdT", p, T)
+            return _dcpdTPoly(a, T)
         
         ###################################
-        def hs(self, p:float, T:float) -> float:
-            return self._combineMethod("hs", p, T)
+        def hs(self, p:float, T:float|np.ndarray) -> float|np.ndarray:
+            """
+            Sensible enthalpy [J/kg]. If T is an array, returns an array.
+            """
+            if isinstance(T, np.ndarray):
+                return self._evaluateArray("hs", p, T)
+            checkFloat(p, "p")
+            checkFloat(T, "T")
+            
+            a = self._mixtureCoeffs(T)
+            aStd = self._mixtureCoeffs(Tstd)
+            if (a is None) or (aStd is None):
+                return self._combineMethod("hs", p, T)
+            return _haPolyMix(a, T) - _haPolyMix(aStd, Tstd)
         
         ###################################
         def hf(self) -> float:
-            return self._combineMethod("hf")
+            a = self._mixtureCoeffs(Tstd)
+            if a is None:
+                return self._combineMethod("hf")
+            return _haPolyMix(a, Tstd)
         
         ###################################
-        def ha(self, p:float, T:float) -> float:
-            return self._combineMethod("ha", p, T)
+        def ha(self, p:float, T:float|np.ndarray) -> float|np.ndarray:
+            """
+            Absolute enthalpy [J/kg]. If T is an array, returns an array.
+            """
+            if isinstance(T, np.ndarray):
+                return self._evaluateArray("ha", p, T)
+            checkFloat(p, "p")
+            checkFloat(T, "T")
+            
+            a = self._mixtureCoeffs(T)
+            if a is None:
+                return self._combineMethod("ha", p, T)
+            return _haPolyMix(a, T)
         
         ###################################
         def update(self, mix:Mixture=None)-> None:
@@ -146,6 +382,8 @@ class janaf7Mixing(ThermoMixing):
         Returns:
             bool: If something changed
         """
+        #The mixture may have been replaced by the owner (e.g. ThermoMixture): keep the reference
+        self._Thermo._mix = self._mix
         self._Thermo.update(mix)
         return super()._update(mix)
 
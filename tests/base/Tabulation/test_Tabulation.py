@@ -1,7 +1,9 @@
 import pytest
 import numpy as np
 from pandas import DataFrame
-from libICEpost.src.base.dataStructures.Tabulation.Tabulation import Tabulation, toPandas, TabulationAccessWarning, concat
+from scipy.interpolate import RegularGridInterpolator
+import warnings
+from libICEpost.src.base.dataStructures.Tabulation.Tabulation import Tabulation, toPandas, TabulationAccessWarning, TabulationPrecisionWarning, concat
 
 @pytest.mark.filterwarnings("error::libICEpost.src.base.dataStructures.Tabulation.Tabulation.TabulationAccessWarning")
 def test_tabulation_constructor():
@@ -149,6 +151,71 @@ def test_tabulation_constructor_invalid_data_shape():
     with pytest.raises(ValueError):
         Tabulation(data, ranges, order)
 
+@pytest.mark.filterwarnings("error::libICEpost.src.base.dataStructures.Tabulation.Tabulation.TabulationAccessWarning")
+def test_tabulation_constructor_dtype():
+    """
+    Test the Tabulation constructor with single-precision storage.
+    """
+    data = np.random.rand(2, 3, 4)
+    ranges = {
+        "x": np.linspace(0, 1, 2),
+        "y": np.linspace(0, 1, 3),
+        "z": np.linspace(0, 1, 4)
+    }
+    order = ["x", "y", "z"]
+
+    tab = Tabulation(data, ranges, order)
+    tab32 = Tabulation(data, ranges, order, dtype=np.float32)
+
+    assert tab.dtype == np.float64
+    assert tab32.dtype == np.float32
+    assert tab32.interpolator.values.dtype == np.float32
+    assert tab32.copy().dtype == np.float32
+    
+    #Concatenation keeps the precision
+    ranges2 = {**ranges, "x": np.linspace(2, 3, 2)}
+    tab32b = Tabulation(data, ranges2, order, dtype=np.float32)
+    assert tab32.concat(tab32b).dtype == np.float32
+    tab32c = tab32.copy()
+    tab32c.concat(tab32b, inplace=True)
+    assert tab32c.dtype == np.float32
+    assert tab32c.interpolator.values.dtype == np.float32
+    assert np.isclose(tab32(0.3, 0.6, 0.2), tab(0.3, 0.6, 0.2), rtol=1e-6)
+
+    with pytest.raises(TypeError):
+        Tabulation(data, ranges, order, dtype=int)
+    
+    #Check of the precision loss
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", TabulationPrecisionWarning)
+        Tabulation(data*1e-5, ranges, order, dtype=np.float32)
+    with pytest.warns(TabulationPrecisionWarning):
+        Tabulation(data*1e-5, ranges, order, dtype=np.float16)
+    with pytest.warns(TabulationPrecisionWarning):
+        Tabulation(data*1e6, ranges, order, dtype=np.float16)
+
+@pytest.mark.filterwarnings("error::libICEpost.src.base.dataStructures.Tabulation.Tabulation.TabulationAccessWarning")
+def test_tabulation_reorder():
+    """
+    Test changing the nesting order of the variables of a Tabulation.
+    """
+    data = np.random.rand(2, 3, 4)
+    ranges = {
+        "x": np.linspace(0, 1, 2),
+        "y": np.linspace(0, 1, 3),
+        "z": np.linspace(0, 1, 4)
+    }
+    order = ["x", "y", "z"]
+
+    tab = Tabulation(data, ranges, order)
+    tab.order = ["x", "z", "y"]
+
+    assert tab.order == ["x", "z", "y"]
+    assert tab.shape == (2, 4, 3)
+    assert tab._data.flags["C_CONTIGUOUS"]
+    assert np.array_equal(tab.data, data.transpose(0, 2, 1))
+    assert np.isclose(tab(0.3, 0.2, 0.6), Tabulation(data, ranges, order)(0.3, 0.6, 0.2))
+
 @pytest.mark.filterwarnings("error::libICEpost.src.base.dataStructures.Tabulation.Tabulation.TabulationAccessWarning")
 def test_tabulation_constructor_invalid_ranges():
     """
@@ -897,12 +964,59 @@ def test_tabulation_interpolation():
     assert np.array_equal(tab2(0.0, 0.0, 0.0), 100)
     with pytest.warns(TabulationAccessWarning):
         assert np.array_equal(tab2(0.0, 0.0, 2.0), 100)
+    assert tab2._interpolatePoint((0.0, 0.0, 0.0)) == 100
+    with pytest.warns(TabulationAccessWarning):
+        assert tab2._interpolatePoint((0.0, 0.0, 2.0)) == 100
     
     #Interpolation with a field that has a single value and multiple points
     assert np.array_equal(tab2((0,0,0), (1,1,0)), np.array([100, 220]))
     with pytest.warns(TabulationAccessWarning):
         assert np.array_equal(tab2((0,0,0), (1,1,1)), np.array([100, 220]))
-        
+    
+    #Interpolation with an array of points
+    points = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [0.5, 0.5, 0.5]])
+    assert np.allclose(tab(points), tab(*[tuple(p) for p in points]))
+    assert np.isnan(tab(np.array([[1.5, 1.5, 1.5]]), outOfBounds="nan")[0])
+    assert tab.outOfBounds == "fatal"
+    with pytest.raises(ValueError):
+        tab(np.array([[1.5, 1.5, 1.5]]))
+    with pytest.raises(ValueError):
+        tab(np.array([[0.0, 0.0]]))
+    assert np.array_equal(tab2(np.array([[0., 0., 0.], [1., 1., 0.]])), np.array([100, 220]))
+    with pytest.warns(TabulationAccessWarning):
+        assert np.array_equal(tab2(np.array([[0., 0., 0.], [1., 1., 1.]])), np.array([100, 220]))
+
+    #Single points and batches of points consistent with scipy
+    rng = np.random.default_rng(0)
+    points = rng.random((20, 3))*1.4 - 0.2
+    for outOfBounds in ["extrapolate", "nan"]:
+        expected = RegularGridInterpolator(tab.interpolator.grid, tab.interpolator.values, bounds_error=False, fill_value=(None if outOfBounds == "extrapolate" else np.nan))(points)
+        assert tab(points, outOfBounds=outOfBounds) == pytest.approx(expected, nan_ok=True)
+        for point, value in zip(points, expected):
+            assert tab(*point, outOfBounds=outOfBounds) == pytest.approx(value, nan_ok=True)
+
+@pytest.mark.parametrize("ndim", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("uniform", [False, True])
+def test_tabulation_interpolation_ndim(ndim, uniform):
+    """
+    Test the interpolation of single points and batches with different numbers of dimensions.
+    """
+    rng = np.random.default_rng(ndim)
+    order = ["a", "b", "c", "d", "e"][:ndim]
+    if uniform:
+        ranges = {var:np.linspace(0.1, 0.7, 3 + ii) for ii, var in enumerate(order)}
+    else:
+        ranges = {var:np.sort(rng.random(3 + ii)) for ii, var in enumerate(order)}
+    tab = Tabulation(rng.random([len(ranges[var]) for var in order]), ranges, order, outOfBounds="extrapolate")
+    
+    #Random points and points on the grid
+    points = rng.random((50, ndim))*1.4 - 0.2
+    points[:10] = np.array([rng.choice(ranges[var], 10) for var in order]).T
+    values = tab(points)
+    assert values == pytest.approx(tab.interpolator(points))
+    assert np.array_equal(values, [tab(*point) for point in points])
+    assert np.array_equal(values, [tab._interpolatePoint(point.tolist()) for point in points])
+
 @pytest.mark.filterwarnings("error::libICEpost.src.base.dataStructures.Tabulation.Tabulation.TabulationAccessWarning")
 def test_tabulation_interpolator_property():
     """
@@ -1102,6 +1216,10 @@ def test_tabulation_copy():
     assert tab.order != tab_copy.order
     assert tab_copy.order == ["z", "y", "x"]
 
+    tab_copy.setRange("x", [0., 2.])
+    assert np.array_equal(tab.ranges["x"], [0., 1.])
+    assert tab(1.0, 0.0, 0.0) == 200
+
 def test_tabulation_setRange():
     data = np.array([[[100, 101, 102, 103],
                       [110, 111, 112, 113],
@@ -158,4 +158,24 @@ def test_checkMap():
     
     map = {1: 1, "b": [2,3]}
     checkMap(map, (int, str), (int, Iterable))
-    
\ No newline at end of file
+    
+
+def test_checkFloat():
+    import numpy as np
+    from libICEpost import GLOBALS
+    from libICEpost.src.base.Functions.typeChecking import checkFloat
+    reset_globals()
+    for value in (1.0, 1, np.int64(1), np.float64(1.0)):
+        checkFloat(value, "x")
+    with pytest.raises(TypeError):
+        checkFloat("1", "x")
+    with pytest.raises(TypeError):
+        checkFloat(np.array([1.0]), "x")
+    checkFloat(np.array([1.0]), "x", allowArray=True)
+    with pytest.raises(TypeError):
+        checkFloat(None, "x")
+    checkFloat(None, "x", allowNone=True)
+    
+    GLOBALS.__TYPE_CHECKING__ = False
+    checkFloat("1", "x")
+    reset_globals()
@@ -87,4 +87,21 @@ def test_selection_table_getitem():
     assert TestBaseClass.selectionTable()["TestChildClassConcrete"] == TestChildClassConcrete
     assert TestBaseClass.selectionTable()["TestChildClassVirtual"] == TestChildClassVirtual
     with pytest.raises(ValueError):
-        TestBaseClass.selectionTable()["NotChildClass"]
\ No newline at end of file
+        TestBaseClass.selectionTable()["NotChildClass"]
+def test_base_class_slots():
+    from libICEpost.src.base.Utilities import Utilities
+    assert Utilities.__slots__ == ()
+    assert BaseClass.__slots__ == ()
+
+    class Concrete(BaseClass):
+        __slots__ = ()
+        @classmethod
+        def fromDictionary(cls, dictionary: dict) -> BaseClass:
+            return cls()
+    class Slotted(Concrete):
+        __slots__ = ("a",)
+    class NotSlotted(Concrete):
+        pass
+
+    assert not hasattr(Slotted(), "__dict__")
+    assert hasattr(NotSlotted(), "__dict__")
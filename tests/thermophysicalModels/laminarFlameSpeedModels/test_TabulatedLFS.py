@@ -0,0 +1,106 @@
+import pytest
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+from libICEpost.src.base.dataStructures.Tabulation.Tabulation import Tabulation
+from libICEpost.src.thermophysicalModels.laminarFlameSpeedModels.TabulatedLFS import TabulatedLFS
+
+pRange = np.linspace(1e5, 5e6, 6)
+TuRange = np.linspace(300., 900., 5)
+phiRange = np.array([0.5, 0.7, 0.8, 1.0, 1.5])
+egrRange = np.array([0.0, 0.1, 0.3])
+
+def reference(data, ranges, points):
+    return RegularGridInterpolator(ranges, data)(points)
+
+@pytest.fixture
+def lfs_data():
+    rng = np.random.default_rng(0)
+    shape = (len(pRange), len(TuRange), len(phiRange))
+    return rng.random(shape), rng.random(shape)*1e-3
+
+@pytest.fixture
+def lfs(lfs_data):
+    Su, deltaL = lfs_data
+    return TabulatedLFS(Su=Su.flatten(), deltaL=deltaL.flatten(), pRange=pRange, TuRange=TuRange, phiRange=phiRange)
+
+def test_tabulatedLFS_scalar(lfs, lfs_data):
+    Su, deltaL = lfs_data
+    point = (2e5, 450., 0.9)
+    assert lfs.Su(*point) == pytest.approx(reference(Su, (pRange, TuRange, phiRange), point))
+    assert lfs.deltaL(*point) == pytest.approx(reference(deltaL, (pRange, TuRange, phiRange), point))
+    
+    #Grid nodes
+    assert lfs.Su(pRange[1], TuRange[2], phiRange[3]) == pytest.approx(Su[1, 2, 3])
+    
+    with pytest.raises(TypeError):
+        lfs.Su("2e5", 450., 0.9)
+
+def test_tabulatedLFS_arrays(lfs, lfs_data):
+    Su, deltaL = lfs_data
+    rng = np.random.default_rng(1)
+    p = rng.uniform(pRange[0], pRange[-1], (4, 3))
+    Tu = rng.uniform(TuRange[0], TuRange[-1], (4, 3))
+    phi = 0.9
+    
+    #Broadcasted shape
+    points = np.stack(np.broadcast_arrays(p, Tu, phi), axis=-1)
+    su = lfs.Su(p, Tu, phi)
+    assert su.shape == (4, 3)
+    assert su == pytest.approx(reference(Su, (pRange, TuRange, phiRange), points))
+    assert lfs.deltaL(p, Tu, phi) == pytest.approx(reference(deltaL, (pRange, TuRange, phiRange), points))
+    
+    #Same as scalar evaluations
+    assert su[2, 1] == pytest.approx(lfs.Su(p[2, 1], Tu[2, 1], phi))
+    
+    #Out of bounds
+    assert np.isnan(lfs.Su(np.array([2e5, 1e9]), 450., 0.9, outOfBounds="nan")[1])
+
+def test_tabulatedLFS_egr():
+    rng = np.random.default_rng(2)
+    Su = rng.random((len(pRange), len(TuRange), len(phiRange), len(egrRange)))
+    lfs = TabulatedLFS(Su=Su.flatten(), deltaL=Su.flatten()*1e-3, pRange=pRange, TuRange=TuRange, phiRange=phiRange, egrRange=egrRange)
+    point = (2e5, 450., 0.9, 0.2)
+    assert lfs.Su(*point) == pytest.approx(reference(Su, (pRange, TuRange, phiRange, egrRange), point))
+
+def test_tabulatedLFS_SuDeltaL(lfs):
+    rng = np.random.default_rng(3)
+    p = rng.uniform(pRange[0], pRange[-1], 10)
+    Tu = rng.uniform(TuRange[0], TuRange[-1], 10)
+    phi = rng.uniform(phiRange[0], phiRange[-1], 10)
+    
+    assert lfs.SuDeltaL(2e5, 450., 0.9) == (lfs.Su(2e5, 450., 0.9), lfs.deltaL(2e5, 450., 0.9))
+    su, deltaL = lfs.SuDeltaL(p, Tu, phi)
+    assert np.array_equal(su, lfs.Su(p, Tu, phi))
+    assert np.array_equal(deltaL, lfs.deltaL(p, Tu, phi))
+    
+    #Out of bounds
+    su, deltaL = lfs.SuDeltaL(np.array([2e5, 1e9]), 450., 0.9, outOfBounds="nan")
+    assert np.isnan(su[1]) and np.isnan(deltaL[1])
+    assert not np.isnan(su[0]) and not np.isnan(deltaL[0])
+
+def test_tabulatedLFS_SuDeltaL_different_grids(lfs):
+    #Sampling points of deltaL within the tolerance of the tabulation, but not identical: not shared
+    deltaL = lfs.tables["deltaL"]
+    ranges = {**deltaL.ranges, "Tu":deltaL.ranges["Tu"]*(1. + 1e-10)}
+    lfs.setTable("deltaL", Tabulation(deltaL.data, ranges, deltaL.order))
+    assert not lfs._sharedGrid(lfs._data["Su"].table, lfs._data["deltaL"].table)
+    assert lfs.SuDeltaL(2e5, 450., 0.9) == (lfs.Su(2e5, 450., 0.9), lfs.deltaL(2e5, 450., 0.9))
+
+@pytest.mark.parametrize("fastAxis", ["p", "Tu", "phi"])
+def test_tabulatedLFS_fastAxis(lfs_data, fastAxis):
+    Su, deltaL = lfs_data
+    lfs = TabulatedLFS(Su=Su.flatten(), deltaL=deltaL.flatten(), pRange=pRange, TuRange=TuRange, phiRange=phiRange, fastAxis=fastAxis)
+    assert lfs.order[-1] == fastAxis
+    assert lfs.tables["Su"].order[-1] == fastAxis
+    
+    rng = np.random.default_rng(4)
+    p = rng.uniform(pRange[0], pRange[-1], 10)
+    Tu = rng.uniform(TuRange[0], TuRange[-1], 10)
+    phi = rng.uniform(phiRange[0], phiRange[-1], 10)
+    points = np.stack((p, Tu, phi), axis=-1)
+    assert lfs.Su(p, Tu, phi) == pytest.approx(reference(Su, (pRange, TuRange, phiRange), points))
+    assert lfs.Su(p[0], Tu[0], phi[0]) == pytest.approx(reference(Su, (pRange, TuRange, phiRange), points[0]))
+    assert lfs.SuDeltaL(p, Tu, phi)[1] == pytest.approx(reference(deltaL, (pRange, TuRange, phiRange), points))
+    
+    with pytest.raises(ValueError):
+        TabulatedLFS(Su=Su.flatten(), deltaL=deltaL.flatten(), pRange=pRange, TuRange=TuRange, phiRange=phiRange, fastAxis="egr")
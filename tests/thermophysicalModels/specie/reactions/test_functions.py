@@ -0,0 +1,34 @@
+import yaml
+import pytest
+from io import StringIO
+from libICEpost.src.thermophysicalModels.specie.reactions.functions import makeEquilibriumMechanism, computeAlphaSt, computeAlphaStBatch
+from libICEpost.src.thermophysicalModels.specie.specie.Mixture import Mixture, mixtureBlend
+from libICEpost.Database.chemistry.specie.Mixtures import Mixtures
+from libICEpost.Database.chemistry.specie.Molecules import Molecules
+
+def test_make_equilibrium_mechanism_deterministic():
+    species = ["N2", "O2", "CH4", "CO2", "H2O", "CO", "H2", "O2"]
+    
+    streams = [StringIO(), StringIO()]
+    makeEquilibriumMechanism(streams[0], species)
+    makeEquilibriumMechanism(streams[1], species[::-1])
+    assert streams[0].getvalue() == streams[1].getvalue()
+    
+    phase = yaml.safe_load(streams[0].getvalue())["phases"][0]
+    assert phase["species"] == sorted(set(species))
+    assert phase["elements"] == ["C", "H", "N", "O"]
+
+def test_compute_alpha_st_batch():
+    air = Mixtures.dryAir
+    CH4 = Mixture([Molecules.CH4], [1.0])
+    H2 = Mixture([Molecules.H2], [1.0])
+    blend = mixtureBlend([CH4, H2], [0.5, 0.5], "mole")
+    fuels = [CH4, H2, blend]
+    
+    alphaSt = computeAlphaStBatch(air, fuels)
+    assert alphaSt.shape == (3,)
+    for fuel, value in zip(fuels, alphaSt):
+        assert value == pytest.approx(computeAlphaSt(air, fuel), rel=1e-6)
+    
+    #Any iterable (e.g., a generator)
+    assert computeAlphaStBatch(air, (f for f in fuels)) == pytest.approx(alphaSt)
@@ -1,4 +1,6 @@
 import pytest
+import copy
+import pickle
 
 from libICEpost.src.thermophysicalModels.specie.specie.Atom import Atom
 from libICEpost.src.thermophysicalModels.specie.specie.Molecule import Molecule
@@ -61,11 +63,16 @@ def test_atom_addition():
     atom2 = Atom("H", 1.008)
     molecule = atom1 + atom2
     assert isinstance(molecule, Molecule)
+    with pytest.raises(TypeError):
+        atom1 + 1.0
 
 def test_atom_multiplication():
     atom = Atom("H", 1.008)
     molecule = atom * 2.0
     assert isinstance(molecule, Molecule)
+    assert (atom * 2).numberOfAtoms == [2]
+    with pytest.raises(TypeError):
+        atom * "2"
 
 def test_atom_representation():
     atom = Atom("H", 1.008)
@@ -80,12 +87,35 @@ def test_atom_comparison_same_name_different_mass():
 def test_atom_hash():
     atom = Atom("H", 1.008)
     assert isinstance(hash(atom), int)
+    assert hash(atom) == hash(Atom("H", 1.008))
+    assert {atom: 1}[Atom("H", 1.008)] == 1
+    assert len({atom, Atom("H", 1.008), Atom("H", 2.014)}) == 2
     
 def test_atom_copy():
     atom1 = Atom("H", 1.008)
     atom2 = atom1.copy()
     assert atom1 == atom2
-    assert atom1 is not atom2
+    #Immutable: copies are the instance in the pool
+    assert atom1 is atom2
+    assert copy.copy(atom1) is atom1
+    assert pickle.loads(pickle.dumps(atom1)) is atom1
+    
+def test_atom_pool():
+    atom = Atom("H", 1.008)
+    assert Atom("H", 1.008) is atom
+    assert Atom("H", 2.014) is not atom
+    assert Atom("H", 2.014).mass == 2.014
+    assert atom.name == "H" and atom.mass == 1.008
+    
+    #Mass stored as float, int accepted
+    assert Atom("X", 1).mass.__class__ is float
+    assert Atom("X", 1.0) is Atom("X", 1)
+    
+def test_atom_slots():
+    atom = Atom("H", 1.008)
+    assert not hasattr(atom, "__dict__")
+    with pytest.raises(AttributeError):
+        atom.charge = 1.0
     
 def test_atom_addition_same_atom():
     atom1 = Atom("H", 1.008)
@@ -270,6 +270,19 @@ def test_mixture_blend():
     
     blended_mixture2 = mixtureBlend([mixture1, mixture2, mixture3], [0.5, 0.5, 0.0])
     assert blended_mixture2.Y == blended_mixture.Y
+    
+    #Species shared between mixtures, consistent with dilution
+    blended_mixture3 = mixtureBlend([mixture3, mixture1], [0.6, 0.4])
+    assert blended_mixture3.species == [molecule1, molecule2]
+    assert blended_mixture3.Y == pytest.approx([0.7, 0.3])
+    assert blended_mixture3 == mixture3.copy().dilute(mixture1, 0.4)
+    
+    #Mole fractions
+    blended_mixture4 = mixtureBlend([mixture3, mixture1], [0.6, 0.4], "mole")
+    assert blended_mixture4.X == pytest.approx([0.6*mixture3.X[0] + 0.4, 0.6*mixture3.X[1]])
+    
+    #Empty mixtures do not contribute
+    assert mixtureBlend([Mixture.empty(), mixture1], [0.5, 0.5]) == mixture1
 
 def test_mixture_MM():
     atom1 = Atom("H", 1.008)
@@ -280,6 +293,14 @@ def test_mixture_MM():
     mixture = Mixture([molecule1, molecule2], X, "mole")
     expected_MM = sum([x*M.MM for x, M in zip(X, [molecule1, molecule2])])
     assert mixture.MM == expected_MM
+    
+    #Updated when the composition changes
+    mixture.X = [0.6, 0.4]
+    assert mixture.MM == pytest.approx(0.6*molecule1.MM + 0.4*molecule2.MM)
+    mixture.dilute(molecule1, 0.5, "mole")
+    assert mixture.MM == pytest.approx(0.8*molecule1.MM + 0.2*molecule2.MM)
+    del mixture[molecule1]
+    assert mixture.MM == pytest.approx(molecule2.MM)
 
 def test_mixture_Rgas():
     atom1 = Atom("H", 1.008)
@@ -350,6 +371,17 @@ def test_mixture_contains():
     assert molecule2 in mixture
     assert "CO2" not in mixture
     assert molecule3 not in mixture
+    
+    #Same name, different molecule
+    assert Molecule("H2", [atom2], [2.0]) not in mixture
+    
+    #Look-up kept consistent when the species change
+    mixture.dilute(molecule3, 0.1)
+    assert "H2O" in mixture
+    assert mixture.index("H2O") == 2
+    del mixture["H2"]
+    assert "H2" not in mixture
+    assert mixture.index(molecule3) == 1
 
 def test_mixure_index():
     atom1 = Atom("H", 1.008)
@@ -433,4 +465,62 @@ def test_mixture_subtract_mixture():
     yMix, remainder = mixture1.subtractMixture(mixture2)
     assert yMix == 0.4
     assert remainder.species == [molecule1, molecule2]
-    assert remainder.Y == pytest.approx([1./3, 2./3], abs=10.**(-Mixture._decimalPlaces+1))
\ No newline at end of file
+    assert remainder.Y == pytest.approx([1./3, 2./3], abs=10.**(-Mixture._decimalPlaces+1))
+
+
+def test_mixture_copy():
+    atom1 = Atom("H", 1.008)
+    atom2 = Atom("O", 16.00)
+    molecule1 = Molecule("H2", [atom1], [2.0])
+    molecule2 = Molecule("O2", [atom2], [2.0])
+    mixture = Mixture([molecule1, molecule2], [0.3, 0.7], "mass")
+    mixCopy = mixture.copy()
+    assert mixCopy == mixture
+    assert mixCopy.X == mixture.X
+    
+    #Independent from the original
+    mixCopy.dilute(molecule1, 0.5, "mass")
+    assert mixture.Y == pytest.approx([0.3, 0.7])
+
+def test_mixture_assign():
+    atom1 = Atom("H", 1.008)
+    atom2 = Atom("O", 16.00)
+    molecule1 = Molecule("H2", [atom1], [2.0])
+    molecule2 = Molecule("O2", [atom2], [2.0])
+    mixture = Mixture([molecule1], [1.0], "mass")
+    other = Mixture([molecule1, molecule2], [0.3, 0.7], "mass")
+    
+    out = mixture.assign(other)
+    assert out is mixture
+    assert mixture == other
+    assert mixture.X == other.X
+    
+    #Independent from the assigned mixture
+    other.dilute(molecule1, 0.5, "mass")
+    assert mixture.Y == pytest.approx([0.3, 0.7])
+    
+    with pytest.raises(TypeError):
+        mixture.assign(molecule1)
+
+def test_mixture_version():
+    atom1 = Atom("H", 1.008)
+    atom2 = Atom("O", 16.00)
+    molecule1 = Molecule("H2", [atom1], [2.0])
+    molecule2 = Molecule("O2", [atom2], [2.0])
+    mixture = Mixture([molecule1, molecule2], [0.3, 0.7], "mass")
+    
+    #Same composition: same version
+    mixCopy = mixture.copy()
+    assert mixCopy._version == mixture._version
+    
+    #Any change of the composition gives a new version
+    versions = {mixture._version}
+    mixCopy.dilute(molecule1, 0.5, "mass")
+    versions.add(mixCopy._version)
+    mixture.Y = [0.5, 0.5]
+    versions.add(mixture._version)
+    del mixture[molecule1]
+    versions.add(mixture._version)
+    mixture.assign(mixCopy)
+    assert mixture._version == mixCopy._version
+    assert len(versions) == 4
@@ -9,12 +9,23 @@ def test_molecule_initialization():
     assert molecule.name == "H2O"
     assert molecule.atoms == [atom1, atom2]
     assert molecule.numberOfAtoms == [2.0, 1.0]
+    #Atoms are immutable and shared by reference
+    assert molecule.atoms[0] is atom1
 
 def test_molecule_initialization_invalid():
     atom1 = Atom("H", 1.008)
     with pytest.raises(ValueError):
         Molecule("H2O", [atom1], [2.0, 1.0])
 
+def test_molecule_initialization_repeated_atoms():
+    atom1 = Atom("H", 1.008)
+    atom2 = Atom("O", 16.00)
+    molecule = Molecule("H2O", [atom1, atom2, Atom("H", 1.008)], [1.0, 1.0, 1.0])
+    assert molecule.atoms == [atom1, atom2]
+    assert molecule.numberOfAtoms == [2.0, 1.0]
+    with pytest.raises(ValueError):
+        Molecule("H2O", [atom1, atom2, Atom("H", 2.014)], [1.0, 1.0, 1.0])
+
 def test_molecule_equality():
     atom1 = Atom("H", 1.008)
     atom2 = Atom("O", 16.00)
@@ -62,6 +73,12 @@ def test_molecule_brute_formula():
     molecule = Molecule("", [atom1, atom2], [4./3, 1.0])
     molecule.name = molecule.bruteFormula()
     assert molecule.name == "H1.333O"
+    
+    #Cached values are per-molecule
+    other = molecule + atom1
+    assert molecule.bruteFormula() == "H1.333O"
+    assert other.bruteFormula() == "H2.333O"
+    assert other.MM == pytest.approx(molecule.MM + atom1.mass)
 
 def test_molecule_hash():
     atom1 = Atom("H", 1.008)
@@ -84,6 +101,10 @@ def test_molecule_contains():
     assert atom1 in molecule
     assert "H" in molecule
     assert "C" not in molecule
+    with pytest.raises(TypeError):
+        1.0 in molecule
+    with pytest.raises(TypeError):
+        molecule.index(1.0)
 
 def test_molecule_index():
     atom1 = Atom("H", 1.008)
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from libICEpost.src.thermophysicalModels.specie.thermo.Thermo.janaf7 import janaf7
 
 Rgas = 8.314
@@ -172,6 +173,15 @@ def test_janaf7_dcpcT(thermo):
     dcpdT_expected *= Rgas
     assert dcpdT == dcpdT_expected
 
+def test_janaf7_invalid_state_type(thermo):
+    for func in ["cp", "ha", "hs", "dcpdT"]:
+        with pytest.raises(TypeError):
+            getattr(thermo, func)("0", 500.0)
+        with pytest.raises(TypeError):
+            getattr(thermo, func)(0, [500.0])
+        #numpy integers accepted as float
+        assert getattr(thermo, func)(np.int64(101325), 500.0) == getattr(thermo, func)(101325.0, 500.0)
+
 def test_janaf7_fromDictionary_valid(thermo_dict):
     thermo = janaf7.fromDictionary(thermo_dict)
     assert thermo.Rgas == Rgas
@@ -0,0 +1,15 @@
+import pytest
+from libICEpost.src.thermophysicalModels.thermoModels.CombustionModel.PremixedCombustion import PremixedCombustion
+from libICEpost.Database.chemistry.specie.Mixtures import Mixtures
+from libICEpost.Database.chemistry.specie.Molecules import Molecules
+
+@pytest.fixture
+def combustion_model():
+    reactants = Mixtures.dryAir.copy()
+    reactants.dilute(Molecules.CH4, 0.05)
+    return PremixedCombustion(reactants=reactants, xb=0.5)
+
+def test_premixed_combustion_slots(combustion_model):
+    assert not hasattr(combustion_model, "__dict__")
+    with pytest.raises(AttributeError):
+        combustion_model.notAnAttribute = 1.0
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from libICEpost.src.thermophysicalModels.thermoModels.thermoMixture.ThermoMixture import ThermoMixture
 from libICEpost.src.thermophysicalModels.specie.specie.Mixture import Mixture
 from libICEpost.src.thermophysicalModels.specie.thermo.EquationOfState.EquationOfState import EquationOfState
@@ -8,6 +9,7 @@ from libICEpost.src.thermophysicalModels.specie.thermo.EquationOfState.PerfectGa
 from libICEpost.src.thermophysicalModels.specie.thermo.Thermo.janaf7 import janaf7
 from libICEpost.Database import database
 import itertools
+import copy
 
 @pytest.fixture
 def sample_mixture():
@@ -46,6 +48,11 @@ def test_update_mixture(thermoType, eosType, sample_mixture):
     assert thermo_mixture.mix == new_mixture
     assert thermo_mixture._Thermo.mix == new_mixture
     assert thermo_mixture._EoS.mix == new_mixture
+    assert thermo_mixture.EoS.Rgas == new_mixture.Rgas
+    
+    #In-place change of the shared mixture is seen by the mixing rules
+    thermo_mixture.mix.update(sample_mixture.species, sample_mixture.Y, fracType="mass")
+    assert thermo_mixture.EoS.Rgas == sample_mixture.Rgas
 
 @pytest.mark.parametrize("thermoType, eosType", thermo_eos_pairs)
 def test_thermoMixture_str(thermoType, eosType, sample_mixture):
@@ -86,4 +93,89 @@ def test_cv(thermo_mixture):
     assert isinstance(thermo_mixture.cv(101325, 300), float)
 
 def test_gamma(thermo_mixture):
-    assert isinstance(thermo_mixture.gamma(101325, 300), float)
\ No newline at end of file
+    assert isinstance(thermo_mixture.gamma(101325, 300), float)
+
+
+def test_constantCp_mixing(sample_mixture):
+    thermo_mixture = ThermoMixture(sample_mixture, {"Thermo": "constantCp", "EquationOfState": "PerfectGas"})
+    db = database.chemistry.thermo.Thermo.constantCp
+    expected = sum(y*db[s.name].cp(101325, 300) for s, y in zip(sample_mixture.species, sample_mixture.Y))
+    assert thermo_mixture.cp(101325, 300) == pytest.approx(expected)
+    
+    #Same composition with a different specie order: same key
+    swapped = Mixture(specieList=sample_mixture.species[::-1], composition=sample_mixture.Y[::-1])
+    assert swapped.compositionKey == sample_mixture.compositionKey
+    
+    CO2 = database.chemistry.specie.Molecules.CO2
+    thermo_mixture.update(Mixture(specieList=[CO2], composition=[1.0]))
+    assert thermo_mixture.cp(101325, 300) == pytest.approx(db["CO2"].cp(101325, 300))
+    
+    #In-place change of the mixture
+    N2 = database.chemistry.specie.Molecules.N2
+    thermo_mixture.mix.dilute(N2, 0.5)
+    assert thermo_mixture.cp(101325, 300) == pytest.approx(0.5*(db["CO2"].cp(101325, 300) + db["N2"].cp(101325, 300)))
+
+def test_thermo_mixing_frozen(sample_mixture):
+    thermo_mixture = ThermoMixture(sample_mixture, {"Thermo": "constantCp", "EquationOfState": "PerfectGas"})
+    mixing = thermo_mixture._Thermo
+    cp = mixing.Thermo.cp(101325, 300)
+    
+    #Updates are skipped inside the context and performed when needed after exiting
+    CO2 = database.chemistry.specie.Molecules.CO2
+    with mixing.frozen():
+        mixing.mix.dilute(CO2, 0.5)
+        assert mixing.Thermo.cp(101325, 300) == cp
+    assert not mixing._frozen
+    assert mixing.Thermo.cp(101325, 300) != cp
+
+@pytest.mark.parametrize("T", [300., 800., 1500., 2500.])
+def test_janaf7_mixing(sample_mixture, T):
+    thermo_mixture = ThermoMixture(sample_mixture, {"Thermo": "janaf7", "EquationOfState": "PerfectGas"})
+    db = database.chemistry.thermo.Thermo.janaf7
+    for func in ["cp", "ha", "hs", "dcpdT"]:
+        expected = sum(y*getattr(db[s.name], func)(101325, T) for s, y in zip(sample_mixture.species, sample_mixture.Y))
+        assert getattr(thermo_mixture.Thermo, func)(101325, T) == pytest.approx(expected)
+    
+    #Coefficients are rebuilt when the species change
+    CO2 = database.chemistry.specie.Molecules.CO2
+    thermo_mixture.update(Mixture(specieList=[CO2], composition=[1.0]))
+    assert thermo_mixture.Thermo.cp(101325, T) == pytest.approx(db["CO2"].cp(101325, T))
+
+@pytest.mark.parametrize("func", ["cp", "ha", "hs", "dcpdT"])
+def test_janaf7_mixing_array(sample_mixture, func):
+    thermo_mixture = ThermoMixture(sample_mixture, {"Thermo": "janaf7", "EquationOfState": "PerfectGas"})
+    T = np.array([[300., 800.], [1500., 2500.]])
+    values = getattr(thermo_mixture.Thermo, func)(101325., T)
+    assert values.shape == T.shape
+    assert values == pytest.approx(np.array([[getattr(thermo_mixture.Thermo, func)(101325., float(t)) for t in row] for row in T]))
+
+def test_janaf7_mixing_shared_coefficients(sample_mixture):
+    first = ThermoMixture(sample_mixture, {"Thermo": "janaf7", "EquationOfState": "PerfectGas"})
+    second = ThermoMixture(sample_mixture.copy(), {"Thermo": "janaf7", "EquationOfState": "PerfectGas"})
+    assert first.cp(101325, 1000.) == second.cp(101325, 1000.)
+    
+    #Same composition: the coefficients computed by one are reused by the other
+    assert first.Thermo._intervalCoeffs is second.Thermo._intervalCoeffs
+    
+    #Different composition: not shared
+    second.mix.dilute(database.chemistry.specie.Molecules.CO2, 0.1)
+    assert second.cp(101325, 1000.) != first.cp(101325, 1000.)
+    assert not first.Thermo._intervalCoeffs is second.Thermo._intervalCoeffs
+
+@pytest.mark.parametrize("thermoType, attributes", [("constantCp", ["_cp"]), ("janaf7", ["_cpLow", "_cpHigh"])])
+def test_mixing_database_change(sample_mixture, thermoType, attributes):
+    db = database.chemistry.thermo.Thermo[thermoType]
+    cp = ThermoMixture(sample_mixture, {"Thermo": thermoType, "EquationOfState": "PerfectGas"}).cp(101325, 300)
+    
+    #Replacing the data of a specie in the database is seen by new mixtures with the same composition
+    original = db["N2"]
+    try:
+        modified = copy.deepcopy(original)
+        for attr in attributes:
+            value = getattr(original, attr)
+            setattr(modified, attr, [2.*a for a in value] if isinstance(value, list) else 2.*value)
+        db["N2"] = modified
+        thermo_mixture = ThermoMixture(sample_mixture, {"Thermo": thermoType, "EquationOfState": "PerfectGas"})
+        assert thermo_mixture.cp(101325, 300) == pytest.approx(cp + sample_mixture.Y[1]*original.cp(101325, 300))
+    finally:
+        db["N2"] = original
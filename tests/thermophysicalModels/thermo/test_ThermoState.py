@@ -0,0 +1,108 @@
+import pytest
+import copy
+import numpy as np
+from dataclasses import FrozenInstanceError
+from libICEpost.src.thermophysicalModels.thermoModels.ThermoState import ThermoState, PsiPsiuThermoState, ThermoStateArray
+from libICEpost.src.thermophysicalModels.thermoModels.ThermoModel import ThermoModel
+from libICEpost.src.thermophysicalModels.thermoModels.thermoMixture.ThermoMixture import ThermoMixture
+from libICEpost.Database.chemistry.specie.Mixtures import Mixtures
+
+@pytest.fixture
+def sample_states():
+    return [ThermoState(p=1e5*(ii+1), T=300.+ii, m=1e-3, V=1e-3/(ii+1), rho=float(ii+1)) for ii in range(5)]
+
+@pytest.fixture
+def mixture():
+    return ThermoMixture(Mixtures.dryAir.copy(), {"Thermo":"janaf7", "EquationOfState":"PerfectGas"})
+
+@pytest.fixture
+def model(mixture):
+    return ThermoModel(mixture, pressure=1e5, mass=1e-3, volume=1e-3)
+
+def test_thermo_state_slots():
+    state = ThermoState()
+    assert not hasattr(state, "__dict__")
+    assert not hasattr(PsiPsiuThermoState(), "__dict__")
+
+def test_thermo_state_array_from_states(sample_states):
+    arr = ThermoStateArray.fromStates(sample_states)
+    assert len(arr) == 5
+    assert arr.stateClass is ThermoState
+    np.testing.assert_allclose(arr.p, [s.p for s in sample_states])
+    np.testing.assert_allclose(arr.p*arr.V, [s.p*s.V for s in sample_states])
+    assert arr[2] == sample_states[2]
+    assert arr[-1] == sample_states[-1]
+    assert arr.toStates() == sample_states
+    s = sample_states[1]
+    np.testing.assert_array_equal(np.asarray(s), [s.p, s.T, s.rho, s.V, s.m])
+
+def test_thermo_state_array_append(sample_states):
+    arr = ThermoStateArray(capacity=2)
+    for s in sample_states:
+        arr.append(s)
+    assert len(arr) == 5
+    assert list(arr) == sample_states
+    np.testing.assert_allclose(arr.T, [s.T for s in sample_states])
+
+    with pytest.raises(TypeError):
+        arr.append({"p":1e5})
+    with pytest.raises(IndexError):
+        arr[5]
+    with pytest.raises(AttributeError):
+        arr.Tu
+
+def test_thermo_state_array_derived_class():
+    arr = ThermoStateArray(PsiPsiuThermoState)
+    arr.append(PsiPsiuThermoState(p=1e5, T=300., Tu=290., Tb=2000.))
+    assert isinstance(arr[0], PsiPsiuThermoState)
+    assert arr.Tb[0] == 2000.
+    with pytest.raises(TypeError):
+        ThermoStateArray(dict)
+
+def test_thermo_model_state_is_snapshot(model):
+    state = model.state
+    assert model.state is state
+    with pytest.raises(FrozenInstanceError):
+        state.p = 0.0
+
+    model.update(volume=5e-4, temperature=400.)
+    assert state.V == 1e-3
+    assert model.state.V == 5e-4
+    assert model.state.T == 400.
+
+def test_thermo_model_integer_state(mixture, model):
+    assert ThermoModel(mixture, pressure=np.int64(100000), mass=1e-3, volume=1e-3).state == pytest.approx(model.state)
+    with pytest.raises(TypeError):
+        ThermoModel(mixture, pressure="1e5", mass=1e-3, volume=1e-3)
+
+def test_thermo_model_update_batch(model):
+    V = np.linspace(1e-3, 1e-4, 7)
+    T = np.linspace(300., 800., 7)
+    batch, scalar = model, copy.deepcopy(model)
+    states = batch.updateBatch(volume=V, temperature=T)
+    assert len(states) == 7
+
+    for ii in range(7):
+        scalar.update(volume=V[ii].item(), temperature=T[ii].item())
+        assert states[ii] == pytest.approx(scalar.state)
+    assert batch.state == pytest.approx(scalar.state)
+
+    p = batch.updateBatch(volume=V, temperature=T).p
+    np.testing.assert_allclose(batch.updateBatch(pressure=p, temperature=T).V, V)
+    np.testing.assert_allclose(batch.updateBatch(pressure=p, volume=V).T, T)
+    with pytest.raises(ValueError):
+        batch.updateBatch(volume=V)
+
+def test_thermo_model_properties_batch(model):
+    p = np.linspace(1e5, 5e6, 4)
+    T = np.linspace(300., 2500., 4)
+    props = model.propertiesBatch(p, T, ("cp", "gamma"))
+    for ii in range(4):
+        assert props["cp"][ii] == pytest.approx(model.mixture.cp(p[ii].item(), T[ii].item()))
+        assert props["gamma"][ii] == pytest.approx(model.mixture.gamma(p[ii].item(), T[ii].item()))
+
+    props = model.propertiesBatch(1e5, np.float64(300.), ("cp",))
+    assert props["cp"].shape == ()
+    assert props["cp"] == pytest.approx(model.mixture.cp(1e5, 300.))
+    with pytest.raises(ValueError):
+        model.propertiesBatch(p, T, ("notAProperty",))